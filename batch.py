@@ -0,0 +1,95 @@
+import os
+import sys
+import json
+import time
+import tempfile
+import traceback
+from rich.console import Console
+import users
+import shell
+from pyos import session, hotreload, events
+
+# Headless mode: `python main.py --batch script.pyos --user NAME` runs every line of a script through the
+# shell's dispatcher without the boot animation or the login prompt, and writes one JSON timing record per
+# command (to --timings, or stderr) so command latency can be measured and compared between versions.
+
+PASSWORD_ENV = "PYOS_PASSWORD"
+
+console = Console(stderr=True)
+
+def read_password(key_file=None):
+    """Password from --key-file if given, otherwise from the PYOS_PASSWORD environment variable."""
+    if key_file:
+        with open(key_file, "r") as f:
+            return f.read().strip()
+    return os.environ.get(PASSWORD_ENV)
+
+def read_script(path):
+    """Yields (line number, command) for every non-empty, non-comment line of a script ('-' reads stdin)."""
+    source = sys.stdin if path == "-" else open(path, "r")
+    try:
+        for number, line in enumerate(source, start=1):
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield number, line
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+def run(script_path, username, key_file=None, timings_path=None):
+    """Authenticate, run a batch script and return the process exit code (0 when every command succeeded)."""
+    try:
+        password = read_password(key_file)
+    except OSError as e:
+        console.print(f"[bold red]Cannot read key file:[/bold red] {e}")
+        return 2
+    if password is None:
+        console.print(f"[bold red]No password given.[/bold red] Set {PASSWORD_ENV} or pass --key-file.")
+        return 2
+
+    role = users.authenticate(username, password)
+    if role is None:
+        console.print("[bold red]Authentication failed.[/bold red]")
+        return 2
+    # The login and working directory live in a directory of their own for the length of the script, so an
+    # interactive session running at the same time keeps its user and cwd
+    with tempfile.TemporaryDirectory(prefix="pyos-batch-") as session_directory:
+        session.use_files(session_directory)
+        users.save_session(username, role)
+        try:
+            return run_lines(script_path, timings_path)
+        finally:
+            events.publish("session.changed", username=None)
+
+def run_lines(script_path, timings_path=None):
+    """Run every line of a script through the shell. Returns the exit code (1 if any command failed)."""
+    session.set_cwd(session.BASE_DIRECTORY)
+    shell.init_shell()
+
+    timings = open(timings_path, "a") if timings_path else sys.stderr
+    failures = 0
+    try:
+        for number, cmd in read_script(script_path):
+            if hotreload.has_changes():
+                shell.reload_all(automatic=True)  # Queued by a package install/removal in an earlier line
+            start = time.perf_counter()
+            try:
+                status = shell.execute_line(cmd)
+            except Exception:
+                traceback.print_exc()
+                status = "error"
+            elapsed = time.perf_counter() - start
+
+            record = {"line": number, "command": cmd, "status": status, "seconds": round(elapsed, 6)}
+            timings.write(json.dumps(record) + "\n")
+            timings.flush()
+
+            if status in ("error", "not_found"):
+                failures += 1
+            elif status == "exit":
+                break
+    finally:
+        if timings is not sys.stderr:
+            timings.close()
+        session.flush()
+    return 1 if failures else 0
@@ -0,0 +1,109 @@
+import os
+import json
+import time
+import threading
+import datetime
+from contextlib import contextmanager
+from pathlib import Path
+
+# Only the standard library is used here so main.py can start tracing before dependencies are installed.
+
+TRACE_DIR = Path(".OSData") / "boot_traces"
+MAX_TRACES = 20  # Oldest traces are rotated out past this count
+
+_boot_started = time.monotonic()
+_boot_started_wall = datetime.datetime.now()
+_stages = []
+_lock = threading.Lock()
+
+def get_rss():
+    """Return the resident set size of this process in bytes (0 if it cannot be determined)."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except Exception:
+        pass
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return 0
+
+@contextmanager
+def stage(name):
+    """Time a boot stage: monotonic start/end, CPU time of the running thread and RSS delta."""
+    start = time.monotonic()
+    cpu_start = time.thread_time()
+    rss_start = get_rss()
+    try:
+        yield
+    finally:
+        record = {
+            "name": name,
+            "start": start - _boot_started,
+            "end": time.monotonic() - _boot_started,
+            "cpu": time.thread_time() - cpu_start,
+            "rss_delta": get_rss() - rss_start,
+            "thread": threading.current_thread().name,
+        }
+        with _lock:
+            _stages.append(record)
+
+def current_trace():
+    """Return the trace recorded so far in this process."""
+    with _lock:
+        stages = sorted(_stages, key=lambda s: s["start"])
+    return {
+        "started": _boot_started_wall.strftime("%Y-%m-%d %H:%M:%S"),
+        "total": time.monotonic() - _boot_started,
+        "stages": stages,
+    }
+
+def save_trace():
+    """Write the current boot trace to .OSData/boot_traces and rotate old traces."""
+    TRACE_DIR.mkdir(parents=True, exist_ok=True)
+    trace = current_trace()
+    file_name = f"boot-{_boot_started_wall.strftime('%Y%m%d-%H%M%S-%f')}.json"
+    with open(TRACE_DIR / file_name, "w") as f:
+        json.dump(trace, f, indent=4)
+
+    traces = sorted(TRACE_DIR.glob("boot-*.json"))
+    for old_trace in traces[:-MAX_TRACES]:
+        try:
+            old_trace.unlink()
+        except OSError:
+            pass
+    return TRACE_DIR / file_name
+
+def load_traces(limit=None):
+    """Load saved boot traces, newest first."""
+    if not TRACE_DIR.exists():
+        return []
+    traces = []
+    for path in sorted(TRACE_DIR.glob("boot-*.json"), reverse=True)[:limit]:
+        try:
+            with open(path, "r") as f:
+                traces.append(json.load(f))
+        except (OSError, json.JSONDecodeError):
+            continue
+    return traces
+
+def to_chrome_trace(trace):
+    """Convert a boot trace into Chrome trace-event JSON (chrome://tracing, Perfetto)."""
+    threads = {}
+    events = []
+    for s in trace["stages"]:
+        tid = threads.setdefault(s["thread"], len(threads) + 1)
+        events.append({
+            "name": s["name"],
+            "cat": "boot",
+            "ph": "X",
+            "ts": round(s["start"] * 1_000_000),
+            "dur": round((s["end"] - s["start"]) * 1_000_000),
+            "pid": 1,
+            "tid": tid,
+            "args": {"cpu_ms": round(s["cpu"] * 1000, 3), "rss_delta": s["rss_delta"]},
+        })
+    for thread_name, tid in threads.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": thread_name}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
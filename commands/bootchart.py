@@ -0,0 +1,102 @@
+import json
+import statistics
+from rich.console import Console
+import boottrace
+from pyos.lazyimport import lazy_from
+
+Table = lazy_from("rich.table", "Table")
+Prompt, IntPrompt = lazy_from("rich.prompt", "Prompt", "IntPrompt")
+
+console = Console()
+
+config = {
+    "name": "bootchart",
+    "description": "Shows how long each boot stage took and compares it with previous boots.",
+    "alias": ["boottrace"]
+}
+
+BAR_WIDTH = 40
+EXPORT_FILE = "files/boot_trace.json"
+
+def format_bytes(value):
+    sign = "-" if value < 0 else "+"
+    value = abs(value)
+    for unit in ["B", "KB", "MB", "GB"]:
+        if value < 1024 or unit == "GB":
+            return f"{sign}{value:.0f}{unit}" if unit == "B" else f"{sign}{value:.1f}{unit}"
+        value /= 1024
+
+def show_chart(trace):
+    """Display a boot trace as a Gantt-style table."""
+    total = max([trace["total"]] + [s["end"] for s in trace["stages"]]) or 1
+    table = Table(title=f"Boot of {trace['started']} ({trace['total']:.2f}s)", header_style="bold magenta")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Start", justify="right")
+    table.add_column("Duration", justify="right", style="green")
+    table.add_column("CPU", justify="right", style="yellow")
+    table.add_column("RSS Δ", justify="right")
+    table.add_column("Timeline", style="blue", no_wrap=True)
+
+    for s in trace["stages"]:
+        offset = int(s["start"] / total * BAR_WIDTH)
+        length = max(1, int((s["end"] - s["start"]) / total * BAR_WIDTH))
+        bar = " " * offset + "█" * min(length, BAR_WIDTH - offset)
+        table.add_row(
+            s["name"],
+            f"{s['start'] * 1000:.0f}ms",
+            f"{(s['end'] - s['start']) * 1000:.0f}ms",
+            f"{s['cpu'] * 1000:.0f}ms",
+            format_bytes(s["rss_delta"]),
+            bar
+        )
+    console.print(table)
+
+def compare_with_median(traces):
+    """Compare the last boot against the median of the boots before it."""
+    latest, previous = traces[0], traces[1:]
+    if not previous:
+        console.print("[bold yellow]Only one boot trace recorded, nothing to compare against.[/bold yellow]")
+        return
+
+    table = Table(title=f"Last boot vs. median of {len(previous)} previous boots", header_style="bold magenta")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Last", justify="right", style="green")
+    table.add_column("Median", justify="right", style="yellow")
+    table.add_column("Change", justify="right")
+
+    rows = [(s["name"], s["end"] - s["start"]) for s in latest["stages"]]
+    rows.append(("total", latest["total"]))
+    for name, duration in rows:
+        if name == "total":
+            history = [t["total"] for t in previous]
+        else:
+            history = [s["end"] - s["start"] for t in previous for s in t["stages"] if s["name"] == name]
+        if not history:
+            table.add_row(name, f"{duration * 1000:.0f}ms", "-", "[dim]new[/dim]")
+            continue
+        median = statistics.median(history)
+        change = duration - median
+        colour = "red" if change > 0 else "green"
+        table.add_row(name, f"{duration * 1000:.0f}ms", f"{median * 1000:.0f}ms", f"[{colour}]{change * 1000:+.0f}ms[/{colour}]")
+    console.print(table)
+
+def export_trace(trace):
+    """Export a boot trace as Chrome trace-event JSON."""
+    with open(EXPORT_FILE, "w") as f:
+        json.dump(boottrace.to_chrome_trace(trace), f, indent=4)
+    console.print(f"[bold green]Exported trace to {EXPORT_FILE}[/bold green] (open it in chrome://tracing or Perfetto)")
+
+def execute():
+    traces = boottrace.load_traces()
+    if not traces:
+        console.print("[bold yellow]No boot traces recorded yet. Reboot to record one.[/bold yellow]")
+        return
+
+    action = Prompt.ask("[bold cyan]Select an option[/bold cyan]", choices=["chart", "compare", "export"], default="chart")
+    if action == "chart":
+        show_chart(traces[0])
+    elif action == "compare":
+        count = IntPrompt.ask("[bold yellow]Compare with how many previous boots?[/bold yellow]", default=5)
+        compare_with_median(traces[:max(1, count) + 1])
+    elif action == "export":
+        export_trace(traces[0])
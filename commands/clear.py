@@ -10,5 +10,7 @@ config = {
 console = Console()
 
 def execute():
-    os.system("clear")
+    # Nothing to clear when output goes to a file or pipe (e.g. batch mode)
+    if console.is_terminal:
+        os.system("clear")
     
\ No newline at end of file
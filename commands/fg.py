@@ -0,0 +1,23 @@
+from rich.console import Console
+from pyos import jobs
+
+console = Console()
+
+config = {
+    "name": "fg",
+    "description": "Brings a background job to the foreground (fg %n), showing its output until it ends."
+}
+
+def execute(args=None):
+    try:
+        job = jobs.get(jobs.parse_spec(args))
+    except ValueError:
+        console.print("[bold red]Usage:[/bold red] fg [%n]")
+        return
+    if job is None:
+        console.print("[bold red]No such job.[/bold red]")
+        return
+
+    console.print(f"[bold cyan][{job.number}][/bold cyan] {job.command}", highlight=False)
+    jobs.foreground(job)
+    console.print(f"[bold cyan][{job.number}][/bold cyan] {job.status}")
@@ -0,0 +1,55 @@
+import os
+import re
+import shlex
+from rich.console import Console
+from pyos import session
+
+console = Console()
+
+config = {
+    "name": "grep",
+    "description": "Prints lines matching a pattern, from a file or from a pipeline (e.g. ls | grep py).",
+    "alias": ["search"]
+}
+
+def parse_args(argv):
+    """Returns (pattern, file names, ignore case) from grep's arguments."""
+    ignore_case = "-i" in argv
+    rest = [arg for arg in argv if arg != "-i"]
+    if not rest:
+        raise ValueError("Usage: grep [-i] <pattern> [file ...]")
+    return rest[0], rest[1:], ignore_case
+
+def read_lines(file_name):
+    path = os.path.abspath(os.path.join(session.get_cwd(), file_name))
+    if not session.is_inside_base(path):
+        raise ValueError(f"Access denied: {file_name}")
+    with open(path, "r", errors="replace") as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+def stream(argv=None, stdin=None):
+    """Yields the matching lines of the input one at a time."""
+    pattern, file_names, ignore_case = parse_args(argv or [])
+    try:
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+    except re.error as e:
+        # ValueError is what the shell's pipeline runner reports as a command error
+        raise ValueError(f"Invalid pattern '{pattern}': {e}")
+    if file_names:
+        sources = [read_lines(file_name) for file_name in file_names]
+    elif stdin is not None:
+        sources = [stdin]
+    else:
+        raise ValueError("grep needs a file or piped input.")
+    for source in sources:
+        for line in source:
+            if regex.search(line):
+                yield line
+
+def execute(args=None):
+    try:
+        for line in stream(shlex.split(args or "")):
+            console.print(line, markup=False, highlight=False)
+    except (ValueError, OSError) as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
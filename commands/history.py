@@ -0,0 +1,61 @@
+import shlex
+from rich.console import Console
+from pyos import history
+from pyos.lazyimport import lazy_from
+
+Table = lazy_from("rich.table", "Table")
+
+console = Console()
+
+config = {
+    "name": "history",
+    "description": "Shows or searches your command history (history [-p] [-n COUNT] [text]).",
+    "alias": ["hist"]
+}
+
+DEFAULT_COUNT = 20
+
+def parse_args(args):
+    """Returns (text, prefix search, count) from the command's arguments."""
+    argv = shlex.split(args or "")
+    prefix = False
+    count = DEFAULT_COUNT
+    words = []
+    i = 0
+    while i < len(argv):
+        if argv[i] == "-p":
+            prefix = True
+        elif argv[i] == "-n" and i + 1 < len(argv):
+            count = int(argv[i + 1])
+            if count < 0:
+                raise ValueError("COUNT can't be negative.")
+            i += 1
+        else:
+            words.append(argv[i])
+        i += 1
+    return " ".join(words), prefix, count
+
+def execute(args=None):
+    store = history.current()
+    if store is None:
+        console.print("[bold red]No history is open for this session.[/bold red]")
+        return
+
+    try:
+        text, prefix, count = parse_args(args)
+    except ValueError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return
+
+    matches = store.search(text, prefix=prefix, limit=count)
+    if not matches:
+        console.print("[bold yellow]No matching commands.[/bold yellow]")
+        return
+
+    title = "History" if not text else f"History {'starting with' if prefix else 'containing'} '{text}'"
+    table = Table(title=title, header_style="bold magenta")
+    table.add_column("#", justify="right", style="dim")
+    table.add_column("Command", style="cyan")
+    for number, command in matches:
+        table.add_row(str(number), command)
+    console.print(table)
@@ -1,6 +1,8 @@
-import requests
 from rich.console import Console
-from rich.table import Table
+from pyos.lazyimport import lazy_from, lazy_import
+
+requests = lazy_import("requests")
+Table = lazy_from("rich.table", "Table")
 
 # Command metadata
 config = {
@@ -0,0 +1,32 @@
+from rich.console import Console
+from pyos import jobs
+from pyos.lazyimport import lazy_from
+
+Table = lazy_from("rich.table", "Table")
+
+console = Console()
+
+config = {
+    "name": "jobs",
+    "description": "Lists background jobs started with 'command &'."
+}
+
+STATUS_STYLES = {"running": "bold green", "done": "cyan", "failed": "bold red", "killed": "yellow"}
+
+def execute():
+    table_jobs = jobs.all_jobs()
+    if not table_jobs:
+        console.print("[bold yellow]No background jobs.[/bold yellow]")
+        return
+
+    table = Table(title="Background jobs", header_style="bold magenta")
+    table.add_column("Job", justify="right", style="bold")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+    table.add_column("Command", style="cyan")
+    table.add_column("Last output", style="dim", overflow="ellipsis", no_wrap=True)
+    for job in table_jobs:
+        last_line = next((line for line in reversed(job.lines()) if line.strip()), "")
+        style = STATUS_STYLES.get(job.status, "")
+        table.add_row(f"%{job.number}", f"[{style}]{job.status}[/{style}]", f"{job.elapsed:.1f}s", job.command, last_line)
+    console.print(table)
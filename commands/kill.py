@@ -0,0 +1,26 @@
+from rich.console import Console
+from pyos import jobs
+
+console = Console()
+
+config = {
+    "name": "kill",
+    "description": "Stops a background job (kill %n)."
+}
+
+def execute(args=None):
+    try:
+        number = jobs.parse_spec(args)
+    except ValueError:
+        number = None
+    if number is None:
+        console.print("[bold red]Usage:[/bold red] kill %n")
+        return
+
+    job = jobs.get(number)
+    if job is None:
+        console.print(f"[bold red]No such job: %{number}[/bold red]")
+    elif jobs.cancel(job):
+        console.print(f"[bold yellow]Stopping job %{number}: {job.command}[/bold yellow]", highlight=False)
+    else:
+        console.print(f"[bold yellow]Job %{number} has already finished ({job.status}).[/bold yellow]")
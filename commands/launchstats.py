@@ -0,0 +1,38 @@
+from rich.console import Console
+from pyos import launch
+from pyos.lazyimport import lazy_from
+
+Table = lazy_from("rich.table", "Table")
+
+console = Console()
+
+config = {
+    "name": "launchstats",
+    "description": "Shows how quickly installed packages started, per launch mode.",
+    "alias": ["launch-stats"]
+}
+
+DESCRIPTIONS = {
+    "in-process": "execute() in the shell's interpreter",
+    "zygote": "forked from the warm worker",
+    "subprocess": "fresh python interpreter"
+}
+
+def execute():
+    report = launch.latency_report()
+    if not report:
+        console.print("[bold yellow]No packages have been launched yet.[/bold yellow]")
+        return
+
+    table = Table(title="Package launch latency", header_style="bold magenta")
+    table.add_column("Mode", style="cyan")
+    table.add_column("How", style="dim")
+    table.add_column("Launches", justify="right")
+    table.add_column("Mean", justify="right", style="green")
+    table.add_column("Last", justify="right", style="yellow")
+    for mode in launch.MODES:
+        if mode in report:
+            stats = report[mode]
+            table.add_row(mode, DESCRIPTIONS[mode], str(stats["launches"]),
+                          f"{stats['mean'] * 1000:.1f}ms", f"{stats['last'] * 1000:.1f}ms")
+    console.print(table)
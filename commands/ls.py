@@ -1,6 +1,7 @@
 import os
 from rich.console import Console
 from rich.text import Text
+from pyos import session
 
 console = Console()
 
@@ -11,17 +12,9 @@ config = {
 }
 
 def execute(args=None):
-    """Lists files and directories based on the directory specified in current_directory.txt."""
+    """Lists files and directories in the session's current directory."""
     try:
-        # Read the current directory from current_directory.txt
-        current_directory_file = "current_directory.txt"
-
-        if not os.path.exists(current_directory_file):
-            console.print(f"[bold red]Error:[/bold red] {current_directory_file} not found.")
-            return
-
-        with open(current_directory_file, "r") as file:
-            current_directory = file.read().strip()
+        current_directory = session.get_cwd()
 
         # Check if the directory exists
         if not os.path.isdir(current_directory):
@@ -48,3 +41,10 @@ def execute(args=None):
 
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
+
+def stream(argv=None, stdin=None):
+    """Yields one entry per line (directories end in '/') without building the whole listing in memory."""
+    current_directory = session.get_cwd()
+    with os.scandir(current_directory) as entries:
+        for entry in entries:
+            yield f"{entry.name}/" if entry.is_dir() else entry.name
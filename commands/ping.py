@@ -1,9 +1,11 @@
 import time
-import requests
 import socket
 from rich.console import Console
-from rich.table import Table
-from rich.prompt import Prompt
+from pyos.lazyimport import lazy_from, lazy_import
+
+requests = lazy_import("requests")
+Table = lazy_from("rich.table", "Table")
+Prompt = lazy_from("rich.prompt", "Prompt")
 
 console = Console()
 
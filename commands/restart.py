@@ -1,10 +1,12 @@
 import os
+import contextlib
 import time
 from rich.console import Console
 from rich.progress import track
 import sys
 from yaspin import yaspin
 import pyos
+import core
 
 console = Console()
 
@@ -36,7 +38,8 @@ def simulate_shutdown():
         time.sleep(1)
 
     with yaspin(text="Cleaning up temporary files...", spinner="dots") as sp:
-        os.remove('current_user.json')
+        with contextlib.suppress(FileNotFoundError):
+            os.remove('current_user.json')
         time.sleep(1.5)
         sp.text = "Clearing system caches..."
         time.sleep(1)
@@ -72,11 +75,18 @@ def simulate_shutdown():
 def restart_system():
     """Simulate restarting the OS by shutting down and then running main.py."""
     console.print("[bold yellow]Restarting the system...[/bold yellow]")
-    time.sleep(2)
-    simulate_shutdown()
-    time.sleep(3)
+    cinematic = core.get_boot_profile() == "cinematic"
+    if cinematic:
+        time.sleep(2)
+        simulate_shutdown()
+        time.sleep(3)
+    else:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove('current_user.json')
+    core.save_resume_state()  # main.py resumes from this instead of cold booting
     pyos.system("clear")
-    time.sleep(1)
+    if cinematic:
+        time.sleep(1)
     os.system("python main.py")
     sys.exit(0)
 
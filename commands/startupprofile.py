@@ -0,0 +1,116 @@
+import os
+import sys
+import subprocess
+from rich.console import Console
+from pyos import manifest, registry
+from pyos.lazyimport import lazy_from
+
+Table = lazy_from("rich.table", "Table")
+Prompt = lazy_from("rich.prompt", "Prompt")
+
+console = Console()
+
+config = {
+    "name": "startupprofile",
+    "description": "Lists the most expensive imports of a command or program (python -X importtime), or with 'loaded', how often each module ran in this session.",
+    "alias": ["startup-profile", "importtime"]
+}
+
+TOP_IMPORTS = 15
+
+def parse_importtime(text):
+    """Parse `-X importtime` output into [{"module", "self", "cumulative", "depth"}] (times in microseconds)."""
+    imports = []
+    for line in text.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        imports.append({
+            "module": stripped,
+            "self": int(parts[0]),
+            "cumulative": int(parts[1]),
+            "depth": (len(name) - len(stripped) - 1) // 2,
+        })
+    return imports
+
+def profile_module(module_name):
+    """Import a module in a fresh interpreter with -X importtime and return the parsed timings."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        cwd=os.getcwd()
+    )
+    return parse_importtime(result.stderr)
+
+def module_total(imports, module_name):
+    """Cumulative import time of the profiled module itself."""
+    return next((entry["cumulative"] for entry in reversed(imports) if entry["module"] == module_name), 0)
+
+def show_module(module_name):
+    imports = profile_module(module_name)
+    if not imports:
+        console.print(f"[bold red]Could not profile {module_name}.[/bold red]")
+        return
+
+    table = Table(title=f"Most expensive imports for {module_name} ({module_total(imports, module_name) / 1000:.1f}ms total)", header_style="bold magenta")
+    table.add_column("Module", style="cyan")
+    table.add_column("Self", justify="right", style="green")
+    table.add_column("Cumulative", justify="right", style="yellow")
+    for entry in sorted(imports, key=lambda e: e["self"], reverse=True)[:TOP_IMPORTS]:
+        table.add_row(entry["module"], f"{entry['self'] / 1000:.1f}ms", f"{entry['cumulative'] / 1000:.1f}ms")
+    console.print(table)
+
+def show_all():
+    table = Table(title="Import time per command and program", header_style="bold magenta")
+    table.add_column("Module", style="cyan")
+    table.add_column("Import time", justify="right", style="green")
+    table.add_column("Heaviest dependency", style="yellow")
+
+    rows = []
+    with console.status("[bold cyan]Profiling imports...[/bold cyan]", spinner="dots"):
+        for kind in ["commands", "programs"]:
+            for name in manifest.scan(kind):
+                module_name = f"{kind}.{name}"
+                imports = profile_module(module_name)
+                dependencies = [entry for entry in imports if entry["module"] != module_name and entry["depth"] == 1]
+                heaviest = max(dependencies, key=lambda e: e["cumulative"], default=None)
+                rows.append((module_name, module_total(imports, module_name), heaviest))
+
+    for module_name, total, heaviest in sorted(rows, key=lambda r: r[1], reverse=True):
+        dependency = f"{heaviest['module']} ({heaviest['cumulative'] / 1000:.1f}ms)" if heaviest else "-"
+        table.add_row(module_name, f"{total / 1000:.1f}ms", dependency)
+    console.print(table)
+
+def show_loaded():
+    counts = registry.execution_counts()
+    if not counts:
+        console.print("[bold yellow]No modules have been loaded through the registry yet.[/bold yellow]")
+        return
+
+    table = Table(title=f"{len(counts)} modules loaded with {sum(counts.values())} executions", header_style="bold magenta")
+    table.add_column("Module", style="cyan")
+    table.add_column("Executions", justify="right")
+    for module_name, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+        # Anything above one was reloaded (hot reload or a package change)
+        table.add_row(module_name, f"[bold yellow]{count}[/bold yellow]" if count > 1 else str(count))
+    console.print(table)
+
+def execute(args=None):
+    target = (args or Prompt.ask("[bold cyan]Command or program to profile ('all' for everything, 'loaded' for this session's modules)[/bold cyan]", default="all")).strip()
+    if target == "all":
+        show_all()
+        return
+    if target == "loaded":
+        show_loaded()
+        return
+
+    for kind in ["commands", "programs"]:
+        if target in manifest.scan(kind):
+            show_module(f"{kind}.{target}")
+            return
+    console.print(f"[bold red]'{target}' was not found in commands or programs.[/bold red]")
@@ -0,0 +1,64 @@
+import time
+from rich.console import Console
+from pyos import stats
+from pyos.lazyimport import lazy_from
+
+Table = lazy_from("rich.table", "Table")
+
+console = Console()
+
+config = {
+    "name": "stats",
+    "description": "Shows latency percentiles, call counts and the slowest recent runs of each command (stats reset clears them).",
+    "alias": ["latency"]
+}
+
+SLOWEST = 5
+
+def format_seconds(seconds):
+    if seconds < 1:
+        return f"{seconds * 1000:.1f}ms"
+    return f"{seconds:.2f}s"
+
+def execute(args=None):
+    if (args or "").strip() == "reset":
+        stats.reset()
+        console.print("[bold green]Statistics cleared.[/bold green]")
+        return
+
+    entries = stats.summary()
+    if not entries:
+        console.print("[bold yellow]No commands have been timed yet.[/bold yellow]")
+        return
+
+    table = Table(title="Command latency", header_style="bold magenta")
+    table.add_column("Command", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Errors", justify="right", style="red")
+    table.add_column("Cancelled", justify="right", style="yellow")
+    table.add_column("p50", justify="right", style="green")
+    table.add_column("p95", justify="right", style="green")
+    table.add_column("p99", justify="right", style="green")
+    table.add_column("Max", justify="right")
+    table.add_column("CPU p50", justify="right", style="blue")
+    for name, entry in entries:
+        wall = entry["wall"]
+        table.add_row(
+            name, str(entry["calls"]),
+            str(entry["outcomes"].get("exception", 0)), str(entry["outcomes"].get("cancelled", 0)),
+            format_seconds(wall.percentile(50)), format_seconds(wall.percentile(95)),
+            format_seconds(wall.percentile(99)), format_seconds(entry["max"]),
+            format_seconds(entry["cpu"].percentile(50))
+        )
+    console.print(table)
+
+    slowest = Table(title="Slowest recent invocations", header_style="bold magenta")
+    slowest.add_column("When", style="dim")
+    slowest.add_column("Command", style="cyan")
+    slowest.add_column("Wall", justify="right", style="green")
+    slowest.add_column("CPU", justify="right", style="blue")
+    slowest.add_column("Outcome")
+    for timestamp, name, wall, cpu, outcome in stats.slowest_recent(SLOWEST):
+        slowest.add_row(time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp)), name,
+                        format_seconds(wall), format_seconds(cpu), outcome)
+    console.print(slowest)
@@ -1,9 +1,11 @@
 import platform
 import sys
 import os
-import psutil
 from rich.console import Console
-from rich.table import Table
+from pyos.lazyimport import lazy_from, lazy_import
+
+psutil = lazy_import("psutil")
+Table = lazy_from("rich.table", "Table")
 
 # Command metadata
 config = {
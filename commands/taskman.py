@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
-import psutil
 from rich.console import Console
-from rich.table import Table
-from rich.prompt import Prompt, IntPrompt
 from rich.text import Text
+from pyos.lazyimport import lazy_from, lazy_import
+
+psutil = lazy_import("psutil")
+Table = lazy_from("rich.table", "Table")
+Prompt, IntPrompt = lazy_from("rich.prompt", "Prompt", "IntPrompt")
 
 console = Console()
 
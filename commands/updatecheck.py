@@ -1,14 +1,32 @@
 from rich.console import Console
 from rich.prompt import Prompt
+import subprocess
 import core
+import depcache
 
 # Command metadata
 config = {
     "name": "sysupdate",
-    "description": "Checks for updates and installs them if available."
+    "description": "Checks for updates and installs them if available. Use 'sysupdate --deps' to reinstall dependencies."
 }
 
 console = Console()
 
-def execute():
-    core.update_system()
\ No newline at end of file
+def update_dependencies():
+    """Force a pip refresh of all requirement files, ignoring the stored dependency fingerprint."""
+    with console.status("[bold cyan]Reinstalling dependencies...[/bold cyan]", spinner="dots"):
+        try:
+            depcache.refresh()
+        except subprocess.CalledProcessError as e:
+            console.print(f"[bold red]Failed to install dependencies (pip exited with {e.returncode}).[/bold red]")
+            return False
+    console.print("[bold green]Dependencies are up to date.[/bold green]")
+    return True
+
+def execute(args=None):
+    if args and args.strip() == "--deps":
+        update_dependencies()
+    elif args:
+        console.print(f"[bold red]Unknown option:[/bold red] {args.strip()}. Usage: sysupdate [--deps]")
+    else:
+        core.update_system()
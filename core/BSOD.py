@@ -32,6 +32,8 @@ def simulate_bsod(error_message):
     # Simulate a short delay before rebooting
     time.sleep(2)
 
+    # No resume snapshot here: resuming would restore the state that just crashed, so this is a cold boot
+
     # Simulate rebooting (just restart the script)
     pyos.system("clear")
     os.system("python main.py")  # Replace with the appropriate path to restart your script
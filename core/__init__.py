@@ -1,4 +1,4 @@
-from .boot import boot_sequence
+from .boot import boot_sequence, resume_sequence, save_resume_state, get_boot_profile
 from .shutdown import simulate_shutdown
 from .BSOD import simulate_bsod
 from .sysupdate import update_system
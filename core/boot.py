@@ -4,22 +4,26 @@ import time
 import subprocess
 import sys
 from rich.console import Console
-import importlib.util
 from yaspin import yaspin
 from rich.panel import Panel
 from rich.align import Align
 from rich.table import Table
 import datetime
 import platform
-import psutil
-import socket
-import pkg_resources
+from pyos import packages, manifest, net, integrity, session, userdb
+from pyos.lazyimport import lazy_import
+import boottrace
+import depcache
+import resume
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+psutil = lazy_import("psutil")  # Only needed for uptime on Windows
 
 # Initialize the console for rich output
 console = Console()
 
 CONFIG_FILE = "config.json"
-USER_DB = "users.json"
+USER_DB = userdb.DB_FILE
 PROGRAMS_DIR = "programs"
 COMMANDS_DIR = "commands"
 SYSTEM_FILES = [CONFIG_FILE, USER_DB]
@@ -27,16 +31,6 @@ REQUIREMENTS_FILE = "requirements.txt"
         
 PACKAGE_JSON_FILE = "package.json"
 
-def check_internet_connection(host="8.8.8.8", port=53, timeout=3):
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            sock.connect((host, port))
-        return True
-    except socket.error:
-        return False
-
-
 def install_requirements(debug, spinner):
     """Install packages from requirements.txt"""
     if os.path.exists(REQUIREMENTS_FILE):
@@ -61,26 +55,12 @@ def install_requirements(debug, spinner):
         spinner.text = f"No {REQUIREMENTS_FILE} found. Skipping package installation." if debug == "Yes" else "Skipping package installation."
 
 def get_packages_from_requirements(requirements_file="requirements.txt"):
-    if not os.path.exists(requirements_file):
-        return []
-    with open(requirements_file, "r") as f:
-        lines = f.readlines()
-    packages = []
-    for line in lines:
-        line = line.strip()
-        if line and not line.startswith("#"):
-            # Extract package name only (ignoring versions)
-            pkg_name = line.split("==")[0].split(">=")[0].split("<=")[0].strip()
-            packages.append(pkg_name)
-    return packages
-
-def check_packages_installed(packages):
-    missing = []
-    installed_packages = {pkg.key for pkg in pkg_resources.working_set}
-    for pkg in packages:
-        if pkg.lower() not in installed_packages:
-            missing.append(pkg)
-    return missing
+    """Return the parsed requirements (name, version specifiers and markers) from a requirements file."""
+    return packages.read_requirements(requirements_file)
+
+def check_packages_installed(requirements):
+    """Return the requirements that are missing or installed at a version that does not satisfy them."""
+    return [str(requirement) for requirement in packages.missing_requirements(requirements)]
     
 def check_system_integrity(debug, spinner):
     spinner.text = "Checking system integrity..."
@@ -93,106 +73,62 @@ def check_system_integrity(debug, spinner):
                 with open(CONFIG_FILE, "w") as f:
                     json.dump({"os_name": "pyOS", "version": "1.0"}, f, indent=4)
             elif file == USER_DB:
-                with open(USER_DB, "w") as f:
-                    json.dump({}, f, indent=4)
+                userdb.ensure()  # Imports users.json if one is left from an older version
         spinner.text = "Missing files have been recreated."
     else:
         if debug == "Yes":
             spinner.text = "All system files are intact."
 
+def scan_modules(directory, label, debug, spinner):
+    """Reads the config of every module in a directory from the manifest without importing it."""
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+        if debug == "Yes":
+            spinner.text = f"No {label}s found. Created {label}s directory at {directory}."
+        return
+
+    entries = manifest.scan(directory)
+    if not entries:
+        spinner.text = f"No {label}s available in {directory}."
+    for name, entry in entries.items():
+        if entry["error"]:
+            spinner.text = f"Error loading {label} {name}: {entry['error']}"
+        elif entry["config"] is None and debug == "Yes":
+            spinner.text = f"Warning: {name} does not have a literal config attribute."
+
 def load_programs(debug, spinner):
-    if os.path.exists(PROGRAMS_DIR):
-        program_files = [f for f in os.listdir(PROGRAMS_DIR) if f.endswith(".py")]
-        if program_files:
-            for program in program_files:
-                program_name = program[:-3]  # Remove the ".py" extension
-                try:
-                    program_module = __import__(f"programs.{program_name}", fromlist=[program_name])
-                    if hasattr(program_module, "config"):
-                        pass  # Removed the display of loaded programs
-                    else:
-                        spinner.text = f"Warning:[/bold red] {program_name} does not have a config attribute."
-                except Exception as e:
-                    spinner.text = f"Error loading program {program_name}: {e}"
-        else:
-            spinner.text = f"No programs available in {PROGRAMS_DIR}."
-    else:
-        os.makedirs(PROGRAMS_DIR)
-        spinner.text = f"No programs found. Created programs directory at {PROGRAMS_DIR}."
+    scan_modules(PROGRAMS_DIR, "program", debug, spinner)
 
 def load_commands(debug, spinner):
-    if os.path.exists(COMMANDS_DIR):
-        command_files = [f for f in os.listdir(COMMANDS_DIR) if f.endswith(".py")]
-        if command_files:
-            for command in command_files:
-                command_name = command[:-3]  # Remove the ".py" extension
-                try:
-                    command_module = __import__(f"commands.{command_name}", fromlist=[command_name])
-                    if hasattr(command_module, "config"):
-                        pass  # Removed the display of loaded commands
-                    else:
-                        if debug == "Yes":
-                            spinner.text = f"Warning: {command_name} does not have a config attribute."
-                except Exception as e:                    
-                    spinner.text = f"Error loading command {command_name}: {e}"
-        else:
-            spinner.text = f"No commands available in {COMMANDS_DIR}."
-    else:
-        os.makedirs(COMMANDS_DIR)
-        if debug == "Yes":
-            spinner.text = f"No commands found. Created commands directory at {COMMANDS_DIR}."
+    scan_modules(COMMANDS_DIR, "command", debug, spinner)
 
 PYOS_FOLDER = "pyos"
 
 def check_pyos_files(debug, spinner):
-    """Check all Python files in the pyos folder for errors, ignoring __init__.py."""
-    if os.path.exists(PYOS_FOLDER):
-        if debug == "Yes":
-            spinner.text = f"Found the '{PYOS_FOLDER}' folder."
-        py_files = [f for f in os.listdir(PYOS_FOLDER) if f.endswith(".py") and f != "__init__.py"]
-
-        if not py_files:
-            if debug == "Yes":
-                spinner.text = f"No Python files found in '{PYOS_FOLDER}'"
-            return
-
-        error_files = []
-
-        # Iterate over all .py files and try to import them
-        for file_name in py_files:
-            file_path = os.path.join(PYOS_FOLDER, file_name)
-            try:
-                spec = importlib.util.spec_from_file_location(file_name, file_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)  # Try to execute the module
-            except Exception as e:
-                error_files.append(file_name)
-                if debug == "Yes":
-                    spinner.text = f"Error loading {file_name}: {e}"
-
-        if error_files:
-            if debug == "Yes":
-                spinner.text = f"There were errors in the following files: {', '.join(error_files)}"
-        else:
-            if debug == "Yes":
-                spinner.text = f"All Python files in '{PYOS_FOLDER}' loaded successfully."
-    else:
+    """Byte-compile pyos/, commands/, programs/ and installed packages without executing them (unchanged files are cached)."""
+    if not os.path.exists(PYOS_FOLDER):
         if debug == "Yes":
             spinner.text = f"Error: '{PYOS_FOLDER}' folder not found!"
+        return
+
+    broken = integrity.verify()
+    if broken:
+        for path, error in broken.items():
+            console.print(f"[bold red]Integrity check failed for {path}:[/bold red] {error}")
+    elif debug == "Yes":
+        spinner.text = "All system files compiled successfully."
 
 def set_current_directory_to_files(debug, spinner):
-    """Sets the current directory to the 'files' folder and writes it to current_directory.txt."""
-    current_directory = os.getcwd()  # Get the current working directory
-    files_directory = os.path.join(current_directory, "files")  # Define the 'files' folder within the current directory
+    """Sets the session's current directory to the 'files' folder (persisted to current_directory.txt)."""
+    files_directory = session.BASE_DIRECTORY  # The 'files' folder within the pyOS directory
 
     if not os.path.exists(files_directory):
         os.makedirs(files_directory)  # Create the 'files' folder if it doesn't exist
 
-    # Write the path of the 'files' directory to the current_directory.txt file
-    with open("current_directory.txt", "w") as f:
-        f.write(files_directory)
-        
-    if debug == "Yes":
+    session.set_cwd(files_directory)
+    session.flush()
+
+    if debug == "Yes" and spinner is not None:
         spinner.text = f"Current directory set to: {files_directory}"
 
 def get_system_info():
@@ -239,64 +175,154 @@ def display_home_screen():
     # Print the panel
     console.print(home_panel)
     
+def check_network(debug, spinner):
+    """Probe the network once and record the result for the stages that depend on it."""
+    boot_state["internet"] = net.is_online()  # Instant when the monitor already knows the answer
+    if debug == "Yes":
+        spinner.text = "Internet connection detected." if boot_state["internet"] else "No internet connection detected."
+
+def check_requirements(debug, spinner):
+    """Install requirements when online, otherwise make sure they are already present."""
+    if depcache.is_current():
+        if debug == "Yes":
+            spinner.text = "Dependency fingerprint unchanged. Skipping package installation."
+        return
+
+    if boot_state.get("internet"):
+        install_requirements(debug, spinner)  # Install required packages from requirements.txt
+        packages.invalidate()
+        depcache.save_fingerprint()
+        return
+
+    console.print("[bold yellow]No internet connection detected.[/bold yellow]")
+    requirements = get_packages_from_requirements(REQUIREMENTS_FILE)
+    if not requirements:
+        console.print("[bold green]No requirements to check. Proceeding.[/bold green]")
+        return
+
+    spinner.text = "Checking if required packages are installed..."
+    missing = check_packages_installed(requirements)
+    if missing:
+        console.print(f"[bold red]Missing packages detected: {', '.join(missing)}[/bold red]")
+        console.print("[bold red]Cannot continue without internet to install missing packages.[/bold red]")
+        sys.exit(1)
+    console.print("[bold green]All required packages are installed.[/bold green]")
+
+# Shared results handed between boot stages (e.g. network status for the requirements stage)
+boot_state = {}
+
+# Each stage lists the stages it depends on; stages without pending dependencies run concurrently.
+# "delay" is cosmetic and only applied in the cinematic boot profile.
+BOOT_STAGES = [
+    {"name": "integrity", "text": "Verifying file system integrity...", "func": check_system_integrity, "depends": [], "delay": 1},
+    {"name": "pyos", "text": "Verifying system files...", "func": check_pyos_files, "depends": [], "delay": 2},
+    {"name": "network", "text": "Starting network services...", "func": check_network, "depends": [], "delay": 3},
+    {"name": "requirements", "text": "Checking required packages...", "func": check_requirements, "depends": ["network"], "delay": 1},
+    {"name": "programs", "text": "Loading programs...", "func": load_programs, "depends": ["integrity", "requirements"], "delay": 1},
+    {"name": "commands", "text": "Loading commands...", "func": load_commands, "depends": ["integrity", "requirements"], "delay": 0},
+    {"name": "files", "text": "Preparing file system...", "func": set_current_directory_to_files, "depends": [], "delay": 0},
+]
+
+# Purely decorative messages shown before the real stages in the cinematic boot profile
+CINEMATIC_INTRO = [
+    ("Booting system...", 1),
+    ("Initializing hardware components...", 2),
+    ("Loading kernel...", 2),
+    ("Checking system memory...", 1),
+]
+
+BOOT_WORKERS = 4
+BOOT_PROFILES = ["fast", "cinematic"]
+
+def get_boot_profile():
+    """Reads the boot profile from config.json, defaulting to 'fast'."""
+    try:
+        with open(CONFIG_FILE, "r") as file:
+            profile = json.load(file).get("boot_profile", "fast")
+    except (FileNotFoundError, json.JSONDecodeError):
+        return "fast"
+    return profile if profile in BOOT_PROFILES else "fast"
+
+def run_stage(stage, debug, spinner, cinematic):
+    """Runs a single boot stage, padding it with its cosmetic delay in the cinematic profile."""
+    with boottrace.stage(stage["name"]):
+        stage["func"](debug, spinner)
+    if cinematic:
+        time.sleep(stage.get("delay", 0))
+
+def run_boot_stages(stages, debug, spinner, cinematic=False):
+    """Runs boot stages on a thread pool, starting each one as soon as its dependencies have finished."""
+    pending = {stage["name"]: stage for stage in stages}
+    running = {}
+    finished = set()
+
+    with ThreadPoolExecutor(max_workers=BOOT_WORKERS) as pool:
+        while pending or running:
+            for name, stage in list(pending.items()):
+                if all(dep in finished for dep in stage["depends"]):
+                    running[pool.submit(run_stage, stage, debug, spinner, cinematic)] = stage
+                    del pending[name]
+
+            if not running:
+                raise RuntimeError(f"Boot stages have unresolvable dependencies: {', '.join(pending)}")
+
+            spinner.text = " | ".join(stage["text"] for stage in running.values())
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                future.result()  # Re-raise stage errors (including sys.exit) on the boot thread
+                finished.add(stage["name"])
+
 def boot_sequence(debug):
+    net.start()  # Probe in the background while the other stages run
+    cinematic = get_boot_profile() == "cinematic"
     with yaspin(text="Booting system...") as spinner:
-        time.sleep(1)  # Simulate booting delay
-        spinner.text = "Initializing hardware components..."
-        time.sleep(2)  # Simulate hardware initialization
-
-        spinner.text = "Loading kernel..."
-        time.sleep(2)  # Simulate kernel loading
-
-        spinner.text = "Checking system memory..."
-        time.sleep(1)
-
-        spinner.text = "Verifying file system integrity..."
-        check_system_integrity(debug, spinner)
-        time.sleep(1)
-
-        spinner.text = "Loading system services..."
-        time.sleep(2)
-
-        # Check Python files in the pyos folder
-        check_pyos_files(debug, spinner)
-
-        spinner.text = "Starting network services..."
-        time.sleep(1)
-        packages = get_packages_from_requirements("requirements.txt")
-
-        with yaspin(text="Checking internet connection...") as spinner:
-            internet = check_internet_connection()
-            time.sleep(3)
-            if not internet:
-                spinner.fail("✗")
-                console.print("[bold yellow]No internet connection detected.[/bold yellow]")
-                if packages:
-                    spinner.text = "Checking if required packages are installed..."
-                    missing = check_packages_installed(packages)
-                    if missing:
-                        console.print(f"[bold red]Missing packages detected: {', '.join(missing)}[/bold red]")
-                        console.print("[bold red]Cannot continue without internet to install missing packages.[/bold red]")
-                        sys.exit(1)
-                    else:
-                        spinner.ok("✔")
-                        console.print("[bold green]All required packages are installed.[/bold green]")
-                else:
-                    spinner.ok("✔")
-                    console.print("[bold green]No requirements to check. Proceeding.[/bold green]")
-            else:
-                spinner.ok("✔")
-                install_requirements(debug, spinner)  # Install required packages from requirements.txt
-        time.sleep(1)
-
-        load_programs(debug, spinner)  # No longer showing programs
-        time.sleep(1)
-        load_commands(debug, spinner)  # No longer showing commands
-
-        # Set the current directory to the "files" folder
-        set_current_directory_to_files(debug, spinner)
+        if cinematic:
+            for text, delay in CINEMATIC_INTRO:
+                spinner.text = text
+                time.sleep(delay)
+
+        run_boot_stages(BOOT_STAGES, debug, spinner, cinematic)
+        spinner.ok("✔")
 
     console.print("[bold green]System ready![/bold green]\n")
+    boot_state["ready"] = True
     os.system("clear")
     display_home_screen()
     return True
+
+def save_resume_state():
+    """Writes the fast-resume snapshot on a clean shutdown so the next start can skip the cold boot."""
+    if not boot_state.get("ready"):
+        return  # Boot never finished, there is nothing trustworthy to resume from
+
+    cwd = session.get_cwd()
+    session.flush()
+
+    resume.write_snapshot({
+        "manifest": manifest.export_state(),
+        "dep_fingerprint": depcache.load_fingerprint(),
+        "internet": boot_state.get("internet"),
+        "cwd": cwd,
+        "packages": packages.export_state(),
+    })
+
+def resume_sequence(state, debug):
+    """Restores a fast-resume snapshot instead of running the boot stages."""
+    boot_state["internet"] = state["internet"]
+    net.start()
+    manifest.restore_state(state["manifest"])
+    packages.restore_state(state["packages"])
+
+    cwd = state["cwd"]
+    if cwd and os.path.isdir(cwd):
+        session.set_cwd(cwd)
+        session.flush()
+    else:
+        set_current_directory_to_files(debug, None)
+
+    if debug == "Yes":
+        console.print("[bold yellow]Resumed from snapshot, cold boot skipped.[/bold yellow]")
+    boot_state["ready"] = True
+    display_home_screen()
+    return True
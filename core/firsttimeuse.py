@@ -7,6 +7,7 @@ from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.text import Text
 import core
+from pyos import events
 
 console = Console()
 CONFIG_PATH = Path("config.json")
@@ -23,6 +24,7 @@ def check_existing_config():
 def save_config(data):
     with open(CONFIG_PATH, "w") as f:
         json.dump(data, f, indent=4)
+    events.publish("config.changed", path=str(CONFIG_PATH))
 
 def create_first_account():
     console.print(Panel(Text("Create Your First Account", style="bold white on blue", justify="center")))
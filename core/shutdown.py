@@ -5,6 +5,7 @@ from yaspin import yaspin
 import pyos
 import os
 import subprocess
+from .boot import save_resume_state
 
 # Initialize the console for rich output
 console = Console()
@@ -39,6 +40,7 @@ def simulate_shutdown():
 
     # Saving user data and disconnecting from the network
     with yaspin(text="Saving user data...", spinner="dots") as sp:
+        save_resume_state()  # Lets the next start resume instead of cold booting
         time.sleep(2)
         sp.text = "Disconnecting from network..."
         time.sleep(1)
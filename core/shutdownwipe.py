@@ -3,6 +3,7 @@ import sys
 from rich.console import Console
 from yaspin import yaspin
 import pyos
+from pyos import userdb
 import os
 
 # Initialize the console for rich output
@@ -30,7 +31,7 @@ def simulate_shutdown_wipe():
         time.sleep(2)
         try:
             os.remove('current_user.json')
-            os.remove('users.json')
+            userdb.wipe()
             os.remove('current_directory.txt')
         except:
             sp.text = "Failed to modify system files."
@@ -1,27 +1,19 @@
 from pathlib import Path
 import os
-import requests
 from rich.console import Console
-from rich.table import Table
-from rich.prompt import Confirm
-from rich.progress import Progress, BarColumn, TextColumn
 import time
-from requests.exceptions import HTTPError
-import socket
+from pyos import net
+from pyos.lazyimport import lazy_from, lazy_import
+
+requests = lazy_import("requests")
+Table = lazy_from("rich.table", "Table")
+Confirm = lazy_from("rich.prompt", "Confirm")
+Progress, BarColumn, TextColumn = lazy_from("rich.progress", "Progress", "BarColumn", "TextColumn")
 
 console = Console()
 GITHUB_API_BASE = "https://api.github.com/repos/Kalmai221/PythonOS/contents"
 IGNORE_FOLDERS = {".git", ".OSData"}
 
-def check_internet_connection(host="8.8.8.8", port=53, timeout=3):
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(timeout)
-            sock.connect((host, port))
-        return True
-    except socket.error:
-        return False
-
 def get_github_files(path=""):
     url = f"{GITHUB_API_BASE}/{path}" if path else GITHUB_API_BASE
     response = requests.get(url)
@@ -93,13 +85,13 @@ def update_system(auto_update=False):
     console.print(f"[bold blue]Working directory detected as:[/bold blue] {base_path}\n")
     # Check internet connection before proceeding
     console.print("[bold cyan]Checking internet connection...[/bold cyan]")
-    if not check_internet_connection():
+    if not net.is_online():
         console.print("[bold red]No internet connection detected. Please connect to the internet and try again.[/bold red]")
         return False
     console.print("[bold cyan]Checking for updates...[/bold cyan]")
     try:
         files = get_github_files()
-    except HTTPError as e:
+    except requests.exceptions.HTTPError as e:
         if e.response.status_code == 403:
             console.print("[bold red]GitHub API rate limit exceeded. Please try again later.[/bold red]")
         else:
@@ -0,0 +1,86 @@
+import os
+import sys
+import json
+import hashlib
+import platform
+import subprocess
+from pathlib import Path
+
+# Only the standard library is used here so main.py can check the fingerprint before dependencies are installed.
+
+OSDATA_DIR = Path(".OSData")
+FINGERPRINT_FILE = OSDATA_DIR / "deps_fingerprint.json"
+REQUIREMENT_FILES = ["boot-requirements.txt", "requirements.txt"]
+
+def installed_distributions():
+    """Return the sorted names of installed distributions by listing *.dist-info/*.egg-info folders on sys.path."""
+    found = set()
+    for entry in sys.path:
+        if not entry or not os.path.isdir(entry):
+            continue
+        try:
+            names = os.listdir(entry)
+        except OSError:
+            continue
+        for name in names:
+            if name.endswith((".dist-info", ".egg-info")):
+                found.add(name.lower())
+    return sorted(found)
+
+def compute_fingerprint():
+    """Hash the requirement files, the interpreter and the set of installed distributions."""
+    hasher = hashlib.sha256()
+    for requirements_file in REQUIREMENT_FILES:
+        hasher.update(requirements_file.encode())
+        try:
+            with open(requirements_file, "rb") as f:
+                hasher.update(f.read())
+        except FileNotFoundError:
+            hasher.update(b"<missing>")
+    hasher.update(sys.executable.encode())
+    hasher.update(sys.version.encode())
+    for name in installed_distributions():
+        hasher.update(name.encode())
+    return hasher.hexdigest()
+
+def load_fingerprint():
+    try:
+        with open(FINGERPRINT_FILE, "r") as f:
+            return json.load(f).get("fingerprint")
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def save_fingerprint():
+    """Store the fingerprint of the current environment once all requirements are installed."""
+    OSDATA_DIR.mkdir(exist_ok=True)
+    with open(FINGERPRINT_FILE, "w") as f:
+        json.dump({"fingerprint": compute_fingerprint(), "python": sys.executable}, f, indent=4)
+
+def is_current():
+    """True when nothing relevant changed since the last successful install, so pip can be skipped."""
+    stored = load_fingerprint()
+    return stored is not None and stored == compute_fingerprint()
+
+def invalidate():
+    """Forget the stored fingerprint so the next boot runs pip again."""
+    try:
+        FINGERPRINT_FILE.unlink()
+    except FileNotFoundError:
+        pass
+
+def pip_install(requirements_file, quiet=True, stdout=None):
+    """Run pip install -U for a requirements file (its output goes to `stdout`, default ours). Raises CalledProcessError on failure."""
+    cmd = [sys.executable, "-m", "pip", "install", "-r", requirements_file, "-U"]
+    if quiet:
+        cmd.append("--quiet")
+    if platform.system() == "Linux":
+        cmd.append("--break-system-packages")
+    subprocess.run(cmd, check=True, stdout=stdout)
+
+def refresh(quiet=True, stdout=None):
+    """Reinstall every requirement file unconditionally and store the new fingerprint."""
+    invalidate()
+    for requirements_file in REQUIREMENT_FILES:
+        if os.path.exists(requirements_file):
+            pip_install(requirements_file, quiet, stdout)
+    save_fingerprint()
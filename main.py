@@ -1,33 +1,59 @@
 import os
-import platform
 import subprocess
 import sys
+import argparse
+import boottrace
+import depcache
+import resume
 
-def install_requirements():
-    """Install dependencies from boot-requirements.txt with platform-specific options."""
-    cmd = ["python", "-m", "pip", "install", "-r", "boot-requirements.txt", "-U", "--quiet"]
-
-    # Add --break-system-packages if running on Linux
-    if platform.system() == "Linux":
-        cmd.append("--break-system-packages")
-
+def install_requirements(headless=False):
+    """
+    Install every requirement file and store the new dependency fingerprint, so the next boot skips pip.
+    Headless (batch mode or stdout not a terminal), pip's output goes to stderr and the screen is not cleared.
+    """
     try:
-        subprocess.run(cmd, check=True)
-        os.system("clear")
+        # boot-requirements.txt and requirements.txt, with the platform-specific pip options
+        depcache.refresh(stdout=sys.stderr if headless else None)
+        if not headless:
+            os.system("clear")
     except subprocess.CalledProcessError:
-        print("❌ Failed to install dependencies. Make sure Python and pip are installed.")
+        print("❌ Failed to install dependencies. Make sure Python and pip are installed.", file=sys.stderr if headless else sys.stdout)
         sys.exit(0)
 
-install_requirements()
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="pyOS")
+    parser.add_argument("--batch", metavar="SCRIPT", help="run a script of shell commands headlessly ('-' for stdin)")
+    parser.add_argument("--user", help="user to run the batch script as")
+    parser.add_argument("--key-file", help="file holding the user's password (default: the PYOS_PASSWORD variable)")
+    parser.add_argument("--timings", metavar="FILE", help="append the per-command JSON timings here instead of stderr")
+    arguments = parser.parse_args()
+    if arguments.batch and not arguments.user:
+        parser.error("--batch requires --user")
+    return arguments
+
+arguments = parse_arguments()
+
+# A snapshot from the last clean shutdown lets us skip pip and the boot stages entirely
+# (batch runs leave it for the next interactive boot)
+with boottrace.stage("main.resume_check"):
+    resume_state = None if arguments.batch else resume.consume_snapshot()
 
-import json
-from rich.console import Console
-import users
-import shell
-import core
-import traceback
-import time
-from pathlib import Path
+with boottrace.stage("main.install_requirements"):
+    # Skip pip entirely when requirements, interpreter and installed packages are unchanged since the last install
+    if resume_state is None and not depcache.is_current():
+        install_requirements(headless=bool(arguments.batch) or not sys.stdout.isatty())
+
+with boottrace.stage("main.imports"):
+    import json
+    from rich.console import Console
+    import users
+    import shell
+    import batch
+    from pyos import events
+    import core
+    import traceback
+    import time
+    from pathlib import Path
 
 console = Console()
 
@@ -45,9 +71,10 @@ def mark_first_time_done():
 # Load or create OS config
 def load_config():
     if not os.path.exists(CONFIG_FILE):
-        config = {"os_name": "pyOS", "version": "1.0", "debug": "False"}
+        config = {"os_name": "pyOS", "version": "1.0", "debug": "False", "boot_profile": "fast", "auto_reload": "False"}
         with open(CONFIG_FILE, "w") as f:
             json.dump(config, f, indent=4)
+        events.publish("config.changed", path=CONFIG_FILE)
         console.print(f"[bold green]Config file created: {CONFIG_FILE}[/bold green]")
     else:
         with open(CONFIG_FILE, "r") as f:
@@ -57,9 +84,14 @@ def load_config():
 MAX_ATTEMPTS = 3  # Set the maximum number of login attempts
 try:
     # result = 10 / 0  # BSOD TESTING
-    config = load_config()
+    if arguments.batch:
+        sys.exit(batch.run(arguments.batch, arguments.user, arguments.key_file, arguments.timings))
+
+    with boottrace.stage("main.load_config"):
+        config = load_config()
     console.print(f"[bold green]{config['os_name']} v{config['version']}[/bold green]")
-    time.sleep(1)
+    if core.get_boot_profile() == "cinematic":
+        time.sleep(1)
     if config['debug'] == "True":
         debug = "Yes"
         console.print("[bold yellow]Debug Mode is enabled on this OS.[/bold yellow]")
@@ -68,14 +100,23 @@ try:
     else:
         debug = "No"
         console.print("[bold yellow]Debug Mode Setting is not defined. Defaulting to Disabled.[/bold yellow]")
-    core.boot_sequence(debug)
+    if resume_state is not None:
+        with boottrace.stage("main.resume_sequence"):
+            core.resume_sequence(resume_state, debug)
+    else:
+        with boottrace.stage("main.boot_sequence"):
+            core.boot_sequence(debug)
 
     if not first_time_done():
         console.print("[bold cyan]First-time setup detected. Running initial setup...[/bold cyan]")
-        core.firsttimeuse()  # Your first-time setup logic here
+        with boottrace.stage("main.firsttimeuse"):
+            core.firsttimeuse()  # Your first-time setup logic here
         mark_first_time_done()
         console.print("[bold green]First-time setup complete! Continuing boot...[/bold green]")
 
+    # Boot is over once the login prompt appears
+    boottrace.save_trace()
+
     attempts = 0
     username = None
 
@@ -1,84 +1,94 @@
-    #!/usr/bin/env python3
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.text import Text
-    from rich.prompt import Confirm
-    from rich import box
-    import subprocess
-    import sys
-    import pkg_resources
-    import shutil
-    import socket
+#!/usr/bin/env python3
+from rich.console import Console
+from rich.panel import Panel
+from rich.text import Text
+from rich.prompt import Confirm
+from rich import box
+import subprocess
+import sys
+try:
+    from pyos.packages import is_installed
+except ImportError:
+    # Running standalone outside pyOS: ask importlib.metadata directly
+    from importlib import metadata
 
-    console = Console()
-    package_name = "ipython"
-
-    def check_package_installed(name):
-        """Check if the pip package is installed."""
-        installed = {pkg.key for pkg in pkg_resources.working_set}
-        return name in installed or shutil.which(name) is not None
-
-    def check_internet(host="pypi.org", port=443, timeout=3):
-        """Check if the machine has internet access by attempting to connect to a known host."""
+    def is_installed(name):
         try:
-            socket.create_connection((host, port), timeout=timeout)
+            metadata.version(name)
             return True
-        except (socket.timeout, socket.gaierror, OSError):
+        except metadata.PackageNotFoundError:
             return False
+import shutil
+import socket
 
-    def install_package(name):
-        """Install the pip package."""
-        if not check_internet():
-            console.print(Panel(
-                "[bold red]No internet connection detected.[/bold red]\n\n"
-                "Please check your network connection and try again.",
-                style="red", box=box.ROUNDED, padding=(1, 2)
-            ))
-            sys.exit(1)
+console = Console()
+package_name = "ipython"
 
-        with console.status(f"[bold green]Installing {name}...[/bold green]", spinner="dots"):
-            try:
-                subprocess.run(
-                    [sys.executable, "-m", "pip", "install", name, "--user", "--break-system-packages"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            except subprocess.CalledProcessError as e:
-                console.print(Panel(f"[bold red]Installation failed![/bold red]\n\n{e.stderr}", style="red", box=box.ROUNDED, padding=(1, 2)))
-                sys.exit(1)
-            else:
-                console.print(Panel(f"[bold green]{name} installed successfully![/bold green]", style="green", box=box.ROUNDED, padding=(1, 2)))
+def check_package_installed(name):
+    """Check if the pip package is installed."""
+    return is_installed(name) or shutil.which(name) is not None
 
-    def main():
-        console.clear()
+def check_internet(host="pypi.org", port=443, timeout=3):
+    """Check if the machine has internet access by attempting to connect to a known host."""
+    try:
+        socket.create_connection((host, port), timeout=timeout)
+        return True
+    except (socket.timeout, socket.gaierror, OSError):
+        return False
 
-        # Header
-        console.print(Panel(Text("Python Installer", style="bold black on white", justify="center"), box=box.ROUNDED, padding=(1, 4)))
-
-        # Description
+def install_package(name):
+    """Install the pip package."""
+    if not check_internet():
         console.print(Panel(
-            "This installer will help you install [bold]ipython[/bold].\n\n"
-            "Command run:\n[green]python -m pip install ipython --user[/green]",
-            style="grey93",
-            box=box.ROUNDED,
-            padding=(1, 4)
+            "[bold red]No internet connection detected.[/bold red]\n\n"
+            "Please check your network connection and try again.",
+            style="red", box=box.ROUNDED, padding=(1, 2)
         ))
+        sys.exit(1)
 
-        # Installation check
-        if check_package_installed(package_name):
-            console.print(f"[bold green]{package_name} is already installed.[/bold green]")
+    with console.status(f"[bold green]Installing {name}...[/bold green]", spinner="dots"):
+        try:
+            subprocess.run(
+                [sys.executable, "-m", "pip", "install", name, "--user", "--break-system-packages"],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+        except subprocess.CalledProcessError as e:
+            console.print(Panel(f"[bold red]Installation failed![/bold red]\n\n{e.stderr}", style="red", box=box.ROUNDED, padding=(1, 2)))
+            sys.exit(1)
         else:
-            if not Confirm.ask("Do you want to install ipython?", default=True):
-                console.print("[bold yellow]Installation cancelled.[/bold yellow]")
-                sys.exit(0)
-            install_package(package_name)
+            console.print(Panel(f"[bold green]{name} installed successfully![/bold green]", style="green", box=box.ROUNDED, padding=(1, 2)))
+
+def main():
+    console.clear()
+
+    # Header
+    console.print(Panel(Text("Python Installer", style="bold black on white", justify="center"), box=box.ROUNDED, padding=(1, 4)))
+
+    # Description
+    console.print(Panel(
+        "This installer will help you install [bold]ipython[/bold].\n\n"
+        "Command run:\n[green]python -m pip install ipython --user[/green]",
+        style="grey93",
+        box=box.ROUNDED,
+        padding=(1, 4)
+    ))
+
+    # Installation check
+    if check_package_installed(package_name):
+        console.print(f"[bold green]{package_name} is already installed.[/bold green]")
+    else:
+        if not Confirm.ask("Do you want to install ipython?", default=True):
+            console.print("[bold yellow]Installation cancelled.[/bold yellow]")
+            sys.exit(0)
+        install_package(package_name)
 
-        console.print(f"\n[bold green]{package_name} installation complete![/bold green]")
-        console.print(f"You can now run it with: [bold cyan]ipython[/bold cyan]")
+    console.print(f"\n[bold green]{package_name} installation complete![/bold green]")
+    console.print(f"You can now run it with: [bold cyan]ipython[/bold cyan]")
 
-    if __name__ == "__main__":
-        main()
+if __name__ == "__main__":
+    main()
 
-    def execute():
-        main()
+def execute():
+    main()
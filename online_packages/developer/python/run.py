@@ -13,19 +13,26 @@ try:
 except ImportError:
     ipython_available = False
 
-def get_current_directory():
-    """Reads the current directory from the current_directory.txt file."""
+def read_current_directory():
+    """Returns the shell's current directory from the pyOS session, or from current_directory.txt when run standalone."""
     try:
+        from pyos import session
+        return session.get_cwd()
+    except ImportError:
         with open("current_directory.txt", "r") as f:
-            directory = f.read().strip()
-            if os.path.isdir(directory):
-                return directory
-            else:
-                console.print("[bold red]Error:[/bold red] Directory not found in current_directory.txt.")
-                return None
+            return f.read().strip()
+
+def get_current_directory():
+    """Returns the shell's current directory if it exists."""
+    try:
+        directory = read_current_directory()
     except FileNotFoundError:
         console.print("[bold red]Error:[/bold red] current_directory.txt file not found.")
         return None
+    if os.path.isdir(directory):
+        return directory
+    console.print("[bold red]Error:[/bold red] Current directory not found.")
+    return None
 
 def execute(args=None):
     """Handles Python file execution or shell start."""
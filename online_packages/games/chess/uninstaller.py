@@ -6,15 +6,25 @@ from rich.prompt import Confirm
 from rich import box
 import subprocess
 import sys
-import pkg_resources
+try:
+    from pyos.packages import is_installed
+except ImportError:
+    # Running standalone outside pyOS: ask importlib.metadata directly
+    from importlib import metadata
+
+    def is_installed(name):
+        try:
+            metadata.version(name)
+            return True
+        except metadata.PackageNotFoundError:
+            return False
 
 console = Console()
 package_name = "cli-chess"
 
 def check_package_installed(name):
     """Check if the pip package is installed."""
-    installed = {pkg.key for pkg in pkg_resources.working_set}
-    return name in installed
+    return is_installed(name)
 
 def uninstall_package(name):
     """Uninstall the pip package."""
@@ -6,7 +6,18 @@ from rich.prompt import Confirm
 from rich import box
 import subprocess
 import sys
-import pkg_resources
+try:
+    from pyos.packages import is_installed
+except ImportError:
+    # Running standalone outside pyOS: ask importlib.metadata directly
+    from importlib import metadata
+
+    def is_installed(name):
+        try:
+            metadata.version(name)
+            return True
+        except metadata.PackageNotFoundError:
+            return False
 import shutil
 import socket
 
@@ -15,8 +26,7 @@ package_name = "typing_test"
 
 def check_package_installed(name):
     """Check if the pip package is installed."""
-    installed = {pkg.key for pkg in pkg_resources.working_set}
-    return name in installed or shutil.which(name) is not None
+    return is_installed(name) or shutil.which(name) is not None
 
 def check_internet(host="pypi.org", port=443, timeout=3):
     """Check if the machine has internet access by attempting to connect to a known host."""
@@ -3,7 +3,6 @@ from rich.console import Console
 from rich.prompt import IntPrompt
 import sys
 import subprocess
-import pkg_resources
 import shutil
 from rich import box
 from rich.panel import Panel
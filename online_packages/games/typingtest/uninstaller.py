@@ -6,7 +6,18 @@ from rich.panel import Panel
 from rich.text import Text
 import sys
 import subprocess
-import pkg_resources
+try:
+    from pyos.packages import is_installed
+except ImportError:
+    # Running standalone outside pyOS: ask importlib.metadata directly
+    from importlib import metadata
+
+    def is_installed(name):
+        try:
+            metadata.version(name)
+            return True
+        except metadata.PackageNotFoundError:
+            return False
 import shutil
 
 console = Console()
@@ -15,8 +26,7 @@ COMMAND_NAME = "tt"
 
 def check_package_installed(name):
     """Check if pip package is installed or CLI command is available."""
-    installed = {pkg.key for pkg in pkg_resources.working_set}
-    return name in installed or shutil.which(COMMAND_NAME) is not None
+    return is_installed(name) or shutil.which(COMMAND_NAME) is not None
 
 def uninstall_package(name):
     """Uninstall the pip package."""
@@ -1,16 +1,17 @@
-import requests
-import os
 from pathlib import Path
 from rich.console import Console
-from rich.table import Table
-from rich.prompt import IntPrompt, Confirm
 import zipfile
 import io
 import hashlib
 import pyos
-import socket
+from pyos import net, launch, events
 import json
 import shutil
+from pyos.lazyimport import lazy_from, lazy_import
+
+requests = lazy_import("requests")
+Table = lazy_from("rich.table", "Table")
+IntPrompt, Confirm = lazy_from("rich.prompt", "IntPrompt", "Confirm")
 
 config = {
     "name": "marketplace",
@@ -24,13 +25,9 @@ BASE_API_URL = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/contents/
 
 console = Console()
 
-def check_internet(host="api.github.com", port=443, timeout=3):
-    """Check if machine can connect to GitHub API."""
-    try:
-        socket.create_connection((host, port), timeout=timeout)
-        return True
-    except (socket.timeout, socket.gaierror, OSError):
-        return False
+def check_internet():
+    """Check the shared connectivity monitor instead of probing GitHub on every menu."""
+    return net.is_online()
 
 def fetch_categories():
     try:
@@ -190,13 +187,18 @@ def download_program_flow():
 
         recursively_download_folder(f"{category}/{directory_name}", new_directory_path, category)
 
+        # A running shell registers the package's commands before its next command; without a listener, restart
+        listening = events.publish("package.installed", path=str(new_directory_path), name=directory_name, category=category) > 0
+
         data_json_path = new_directory_path / "data.json"
         if data_json_path.exists():
             try:
                 with open(data_json_path, "r") as f:
                     data = json.load(f)
                 requires_restart = str(data.get("requires_restart_on_download", "false")).lower()
-                if requires_restart == "true":
+                if requires_restart == "true" and listening:
+                    console.print("[bold green]✓ Package commands will be available once the marketplace closes.[/bold green]")
+                elif requires_restart == "true":
                     console.print("\n[bold yellow]⚠️ This package requires a restart of the OS to register new commands.[/bold yellow]")
                     restart_confirm = Confirm.ask("Would you like to restart now?")
                     if restart_confirm:
@@ -258,7 +260,7 @@ def uninstall_package_flow():
             return
 
         console.print(f"[bold green]Running uninstaller script: {uninstaller_script}[/bold green]")
-        ret_code = os.system(f'python "{uninstaller_path}"')
+        ret_code = launch.run_package(str(uninstaller_path), data.get("isolated", False))
         if ret_code != 0:
             console.print(f"[bold red]Uninstaller script exited with code {ret_code}. Aborting deletion.[/bold red]")
             return
@@ -266,6 +268,7 @@ def uninstall_package_flow():
     try:
         shutil.rmtree(pkg_path)
         console.print(f"[bold green]Successfully uninstalled and removed package '{pkg['name']}'.[/bold green]")
+        events.publish("package.removed", path=str(pkg_path), name=pkg["name"], category=pkg["category"])
     except Exception as e:
         console.print(f"[bold red]Failed to delete package folder: {e}[/bold red]")
 
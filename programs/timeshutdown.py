@@ -2,7 +2,6 @@ import pyos
 from rich.console import Console
 from datetime import datetime, timedelta
 import re
-import threading
 import time
 
 console = Console()
@@ -43,17 +42,13 @@ def countdown_shutdown(delay: timedelta):
     console.print("\nShutting down now...")
     pyos.shutdown()
 
-def execute():
+def execute(args=None):
     try:
-        user_input = input("Shutdown after (e.g. 10s, 5m, 2h, 1d): ")
+        user_input = args or input("Shutdown after (e.g. 10s, 5m, 2h, 1d): ")
         delay = parse_delay(user_input)
     except ValueError as e:
         console.print(f"[bold red]{e}[/bold red]")
         return
 
-    # Start the countdown in a separate thread so it doesn't block main thread
-    t = threading.Thread(target=countdown_shutdown, args=(delay,), daemon=True)
-    t.start()
-
-    # Main thread can do other things or wait for thread to finish
-    t.join()  # Wait for shutdown countdown to complete before exiting execute()
+    # Counts down in the caller's thread; use `run timeshutdown 10m &` to keep the shell usable meanwhile
+    countdown_shutdown(delay)
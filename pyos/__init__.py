@@ -1,5 +1,24 @@
 # pyos/__init__.py
+import importlib
+
+# The function re-exports are bound eagerly: a later `import pyos.system` would otherwise replace the name
+# with the submodule. Their modules keep heavy dependencies behind pyos.lazyimport, so this stays cheap.
 from .system import system
+from .run import run, Result, RunError, CommandNotFoundError, NotRunnableError, ArgumentError, CommandFailedError
 from .shutdown import shutdown
 from .userinfo import userinfo
 from .logout import logout
+
+# Subsystems are imported on first access (`pyos.history`, `from pyos import history`)
+_SUBMODULES = {
+    "packages", "registry", "manifest", "net", "integrity", "dispatch", "session", "pipeline", "completion",
+    "hotreload", "launch", "history", "jobs", "keys", "stats", "usage", "events", "userdb",
+}
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
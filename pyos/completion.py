@@ -0,0 +1,123 @@
+import os
+import threading
+from . import dispatch, session, events
+
+# Tab completion for the shell. Names come from a prefix trie built over the dispatch index, and `cd` paths
+# come from a per-directory listing cache that is refreshed in the background when a directory's mtime changes,
+# so pressing Tab never waits on a directory scan.
+
+SHELL_BUILTINS = ["exit", "help", "reload", "cd", "run", "time"]
+
+class Trie:
+    """Prefix trie where every node keeps the sorted words below it, so a lookup is one walk down the prefix."""
+
+    def __init__(self, words=()):
+        self.root = {"children": {}, "words": []}
+        for word in sorted(set(words)):
+            self.insert(word)
+
+    def insert(self, word):
+        node = self.root
+        node["words"].append(word)
+        for char in word:
+            node = node["children"].setdefault(char, {"children": {}, "words": []})
+            node["words"].append(word)
+
+    def starts_with(self, prefix):
+        node = self.root
+        for char in prefix:
+            node = node["children"].get(char)
+            if node is None:
+                return []
+        return node["words"]
+
+_tries = {"commands": Trie(SHELL_BUILTINS), "programs": Trie()}
+
+# Directory path -> (mtime_ns, sorted subdirectory names)
+_listings = {}
+_pending = set()
+_lock = threading.Lock()
+
+def rebuild():
+    """Rebuild the name tries from the dispatch index (call after the shell's tables change)."""
+    _tries["commands"] = Trie(SHELL_BUILTINS + dispatch.names("commands"))
+    _tries["programs"] = Trie(dispatch.names("programs"))
+
+def complete_name(prefix, namespace="commands"):
+    return _tries[namespace].starts_with(prefix)
+
+def _scan(directory):
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as entries:
+            names = sorted(entry.name for entry in entries if entry.is_dir())
+        with _lock:
+            _listings[directory] = (mtime, names)
+    except OSError:
+        with _lock:
+            _listings.pop(directory, None)
+    finally:
+        with _lock:
+            _pending.discard(directory)
+
+def warm(directory):
+    """Scan a directory in the background unless a scan is already running."""
+    with _lock:
+        if directory in _pending:
+            return
+        _pending.add(directory)
+    threading.Thread(target=_scan, args=(directory,), daemon=True).start()
+
+def subdirectories(directory):
+    """
+    Cached subdirectory names of a directory. A missing or stale entry (mtime changed) triggers a background
+    rescan; until it finishes the previous listing (or nothing) is returned.
+    """
+    with _lock:
+        cached = _listings.get(directory)
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return []
+    if cached is None or cached[0] != mtime:
+        warm(directory)
+    return cached[1] if cached else []
+
+def complete_path(text):
+    """Complete a directory path typed relative to the shell's current directory, staying inside /files."""
+    head, _, tail = text.rpartition("/")
+    directory = os.path.abspath(os.path.join(session.get_cwd(), head))
+    if not session.is_inside_base(directory):
+        return []
+    prefix = f"{head}/" if head else ""
+    return [f"{prefix}{name}/" for name in subdirectories(directory) if name.startswith(tail)]
+
+def candidates(line, begidx, text):
+    """Completion candidates for `text`, the word starting at `begidx` of the current input line."""
+    words = line[:begidx].split()
+    if words[:1] == ["time"]:
+        words = words[1:]  # `time` wraps any other line
+    if not words:
+        return complete_name(text, "commands")
+    if words == ["run"]:
+        return complete_name(text, "programs")
+    if words == ["cd"]:
+        return complete_path(text)
+    return []
+
+def _on_cwd_changed(topic, path, previous):
+    warm(path)  # Have the listing ready for the next Tab
+
+def install(readline):
+    """Register the completer with readline (or pyreadline3)."""
+    matches = []
+
+    def completer(text, state):
+        if state == 0:
+            matches[:] = candidates(readline.get_line_buffer(), readline.get_begidx(), text)
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer_delims(" \t\n")
+    readline.set_completer(completer)
+    warm(session.get_cwd())
+    events.subscribe("cwd.changed", _on_cwd_changed)
@@ -0,0 +1,67 @@
+import threading
+
+# One index from every command/program name and alias to the entry it runs. The shell, the help menu and
+# pyos.system all resolve through it, so a lookup is a dict hit no matter how many packages are installed.
+
+# Which namespace each source lives in: commands are typed directly, programs and packages via `run`
+NAMESPACES = {"commands": "commands", "programs": "programs", "packages": "programs"}
+SOURCE_PRIORITY = ["commands", "programs", "packages"]
+
+_claims = {}  # name or alias -> [(source, entry name, is_alias)]
+_entries = {source: {} for source in NAMESPACES}  # source -> {entry name: tuple of aliases}
+_lock = threading.Lock()
+
+def _add(source, entry_name, aliases):
+    _claims.setdefault(entry_name, []).append((source, entry_name, False))
+    for alias in aliases:
+        if alias != entry_name:
+            _claims.setdefault(alias, []).append((source, entry_name, True))
+
+def _remove(source, entry_name, aliases):
+    for key in {entry_name, *aliases}:
+        remaining = [claim for claim in _claims.get(key, []) if claim[:2] != (source, entry_name)]
+        if remaining:
+            _claims[key] = remaining
+        else:
+            _claims.pop(key, None)
+
+def update(source, entries):
+    """
+    Sync the index with a source's table ({entry name: {"aliases": [...], ...}}).
+    Only entries that were added, removed or had their aliases changed are touched.
+    Returns (added, removed) entry names.
+    """
+    if source not in NAMESPACES:
+        raise ValueError(f"Unknown dispatch source '{source}'")
+    with _lock:
+        old = _entries[source]
+        new = {name: tuple(info.get("aliases") or []) for name, info in entries.items()}
+        removed = [name for name in old if new.get(name) != old[name]]
+        added = [name for name in new if old.get(name) != new[name]]
+        for name in removed:
+            _remove(source, name, old[name])
+        for name in added:
+            _add(source, name, new[name])
+        _entries[source] = new
+    return added, removed
+
+def resolve(name, namespace):
+    """Return (source, entry name) for a typed name or alias in a namespace, or None if nothing matches."""
+    claims = [claim for claim in _claims.get(name, ()) if NAMESPACES[claim[0]] == namespace]
+    if not claims:
+        return None
+    # Real names beat aliases; then commands beat programs beat installed packages
+    source, entry_name, _ = min(claims, key=lambda c: (c[2], SOURCE_PRIORITY.index(c[0])))
+    return source, entry_name
+
+def conflicts():
+    """Return {name: [(source, entry name, is_alias), ...]} for every name claimed by more than one entry."""
+    with _lock:
+        return {name: list(claims) for name, claims in _claims.items() if len(claims) > 1}
+
+def names(namespace=None):
+    """Every name and alias in the index, optionally only those in one namespace (used for completion)."""
+    with _lock:
+        if namespace is None:
+            return list(_claims)
+        return [name for name, claims in _claims.items() if any(NAMESPACES[c[0]] == namespace for c in claims)]
@@ -0,0 +1,62 @@
+import sys
+import threading
+import traceback
+
+# In-process publish/subscribe bus. Subsystems publish a topic when their state changes and caches subscribe to
+# invalidate exactly what changed, instead of re-reading files or asking for a restart. Delivery is synchronous,
+# in the publisher's thread; handlers run outside the lock, so they may publish or (un)subscribe themselves.
+#
+# Topics in use:
+#   cwd.changed        path, previous        pyos.session.set_cwd
+#   user.changed       username, action      pyos.userdb (action: "added", "deleted", "password", "role")
+#   session.changed    username              users.py login/logout, pyos.logout (username None when logged out)
+#   package.installed  path, name, category  marketplace
+#   package.removed    path, name, category  marketplace
+#   config.changed     path                  main.py, core/firsttimeuse.py
+#
+# A subscription is an exact topic, a "prefix.*" pattern or "*".
+
+_handlers = {}  # topic pattern -> list of handlers
+_lock = threading.Lock()
+
+def subscribe(topic, handler):
+    """Call handler(topic, **data) for every matching event. Returns the handler, so it can be used as a decorator."""
+    with _lock:
+        handlers = _handlers.setdefault(topic, [])
+        if handler not in handlers:
+            handlers.append(handler)
+    return handler
+
+def unsubscribe(topic, handler):
+    with _lock:
+        handlers = _handlers.get(topic, [])
+        if handler in handlers:
+            handlers.remove(handler)
+        if not handlers:
+            _handlers.pop(topic, None)
+
+def _patterns(topic):
+    yield topic
+    parts = topic.split(".")
+    for end in range(len(parts) - 1, 0, -1):
+        yield ".".join(parts[:end]) + ".*"
+    yield "*"
+
+def publish(topic, **data):
+    """
+    Deliver an event to its subscribers now. A handler that raises is reported and the others still run.
+    Returns the number of handlers that were called.
+    """
+    with _lock:
+        handlers = [handler for pattern in _patterns(topic) for handler in _handlers.get(pattern, [])]
+    for handler in handlers:
+        try:
+            handler(topic, **data)
+        except Exception:
+            print(f"Error in '{topic}' event handler {getattr(handler, '__qualname__', handler)}:", file=sys.stderr)
+            traceback.print_exc()
+    return len(handlers)
+
+def has_subscribers(topic):
+    with _lock:
+        return any(_handlers.get(pattern) for pattern in _patterns(topic))
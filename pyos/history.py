@@ -0,0 +1,168 @@
+import os
+import heapq
+import itertools
+import bisect
+import threading
+from collections import deque
+
+# Per-user shell history in .OSData/history/<user>, one command per line. Appending is a single write; the
+# file is only read in full the first time it is searched, into a bounded ring buffer with a search index:
+# distinct commands kept sorted for prefix search, and a trigram -> commands map for substring search.
+
+HISTORY_DIRECTORY = os.path.join(".OSData", "history")
+MAX_ENTRIES = 100000  # Ring buffer size; older entries are dropped
+COMPACT_FACTOR = 2  # Rewrite the file once it holds this many times MAX_ENTRIES lines
+TAIL_BLOCK = 65536
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+class History:
+    def __init__(self, username):
+        self.path = os.path.join(HISTORY_DIRECTORY, os.path.basename(username))
+        self.entries = None  # deque of (sequence number, command); None until loaded
+        self.next_sequence = 0
+        self.occurrences = {}  # command -> deque of sequence numbers, oldest first
+        self.sorted_commands = []
+        self.grams = {}  # trigram -> set of commands
+        self.file_lines = 0
+        self.lock = threading.Lock()
+
+    def append(self, command):
+        """Record a command: one append to the file, plus the in-memory index if it is loaded."""
+        command = command.replace("\n", " ")
+        os.makedirs(HISTORY_DIRECTORY, exist_ok=True)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, (command + "\n").encode("utf-8"))
+        finally:
+            os.close(fd)
+        with self.lock:
+            if self.entries is not None:
+                self._add(command)
+                self.file_lines += 1
+
+    def tail(self, count):
+        """The last `count` commands, read from the end of the file without loading all of it."""
+        if self.entries is not None:
+            with self.lock:
+                return [command for _, command in itertools.islice(reversed(self.entries), count)][::-1]
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                position = f.tell()
+                data = b""
+                while position > 0 and data.count(b"\n") <= count:
+                    step = min(TAIL_BLOCK, position)
+                    position -= step
+                    f.seek(position)
+                    data = f.read(step) + data
+        except FileNotFoundError:
+            return []
+        lines = data.decode("utf-8", errors="replace").splitlines()
+        if position > 0:
+            lines = lines[1:]  # First line may be cut in half
+        return [line for line in lines if line][-count:]
+
+    def _add(self, command):
+        if len(self.entries) == self.entries.maxlen:
+            _, evicted = self.entries.popleft()
+            occurrences = self.occurrences[evicted]
+            occurrences.popleft()  # The evicted entry is always its command's oldest occurrence
+            if not occurrences:
+                self._forget(evicted)
+        self.entries.append((self.next_sequence, command))
+        occurrences = self.occurrences.get(command)
+        if occurrences is None:
+            bisect.insort(self.sorted_commands, command)
+            for gram in trigrams(command.lower()):
+                self.grams.setdefault(gram, set()).add(command)
+            occurrences = self.occurrences[command] = deque()
+        occurrences.append(self.next_sequence)
+        self.next_sequence += 1
+
+    def _forget(self, command):
+        """Drop a command that no longer has any entry in the ring buffer from the search index."""
+        del self.occurrences[command]
+        del self.sorted_commands[bisect.bisect_left(self.sorted_commands, command)]
+        for gram in trigrams(command.lower()):
+            commands = self.grams[gram]
+            commands.discard(command)
+            if not commands:
+                del self.grams[gram]
+
+    def load(self):
+        """Read the file into the ring buffer and build the index (done once, on the first search)."""
+        with self.lock:
+            if self.entries is not None:
+                return
+            self.entries = deque(maxlen=MAX_ENTRIES)
+            try:
+                with open(self.path, "r", encoding="utf-8", errors="replace") as f:
+                    for line in f:
+                        line = line.rstrip("\n")
+                        if line:
+                            self._add(line)
+                            self.file_lines += 1
+            except FileNotFoundError:
+                pass
+            if self.file_lines > MAX_ENTRIES * COMPACT_FACTOR:
+                self._compact()
+
+    def _compact(self):
+        """Rewrite the file with only the entries still in the ring buffer."""
+        temp_file = self.path + ".tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.writelines(command + "\n" for _, command in self.entries)
+        os.replace(temp_file, self.path)
+        self.file_lines = len(self.entries)
+
+    def _candidates(self, text):
+        """Distinct commands sharing every trigram of `text` (a superset of those containing it)."""
+        grams = trigrams(text.lower())
+        if not grams:
+            return self.occurrences.keys()  # Too short for the trigram index
+        postings = sorted((self.grams.get(gram, set()) for gram in grams), key=len)
+        return set.intersection(*postings)
+
+    def search(self, text="", prefix=False, limit=None):
+        """
+        Return [(entry number, command)] oldest first, for entries starting with `text` (prefix=True,
+        case-sensitive) or containing it (case-insensitive). Entry numbers count from 1 for the oldest entry kept.
+        """
+        self.load()
+        with self.lock:
+            if prefix:
+                start = bisect.bisect_left(self.sorted_commands, text)
+                stop = bisect.bisect_left(self.sorted_commands, text + "\U0010ffff")
+                commands = self.sorted_commands[start:stop]
+            elif text:
+                needle = text.lower()
+                commands = [command for command in self._candidates(text) if needle in command.lower()]
+            else:
+                commands = None
+
+            if commands is None:
+                matches = list(itertools.islice(reversed(self.entries), limit))[::-1] if limit is not None else list(self.entries)
+            else:
+                # Occurrences are in order, so only the newest `limit` of each command can make the cut
+                pairs = ((sequence, command) for command in commands
+                         for sequence in itertools.islice(reversed(self.occurrences[command]), limit))
+                matches = sorted(heapq.nlargest(limit, pairs) if limit is not None else pairs)
+            first = self.entries[0][0] if self.entries else 0
+            return [(sequence - first + 1, command) for sequence, command in matches]
+
+    def __len__(self):
+        self.load()
+        return len(self.entries)
+
+_current = None
+
+def open_history(username):
+    """Make `username`'s history the active one (used by the shell and the history command)."""
+    global _current
+    _current = History(username)
+    return _current
+
+def current():
+    return _current
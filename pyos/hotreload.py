@@ -0,0 +1,125 @@
+import os
+import threading
+
+# Change tracking for the shell's reload. Every command/program source file and every installed package's
+# data.json is remembered by (mtime, size); a reload only re-imports or re-reads what changed since the last one.
+# Package directories are re-listed only when their own mtime changes, so an idle poll is just a round of stats.
+
+SOURCE_KINDS = ["commands", "programs"]
+PACKAGES_DIRECTORY = "files"
+WATCH_INTERVAL = 2  # Seconds between polls of the watcher thread
+
+_signatures = {}  # path -> (mtime_ns, size)
+_listings = {}  # directory -> (mtime_ns, subdirectory names, has data.json)
+_lock = threading.Lock()
+_changed = threading.Event()
+_stop = threading.Event()
+_thread = None
+_watcher_lock = threading.Lock()  # Serializes start/stop; separate from _lock, which the watcher itself takes
+
+def signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _listing(directory):
+    """Subdirectories of a directory and whether it holds a data.json, re-listed only when its mtime changes."""
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        _listings.pop(directory, None)
+        return [], False
+    cached = _listings.get(directory)
+    if cached is None or cached[0] != mtime:
+        subdirectories, has_data = [], False
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    subdirectories.append(entry.name)
+                elif entry.name == "data.json":
+                    has_data = True
+        cached = _listings[directory] = (mtime, sorted(subdirectories), has_data)
+    return cached[1], cached[2]
+
+def package_files(base_path=PACKAGES_DIRECTORY):
+    """Every data.json under base_path/installed_*."""
+    found = []
+    top, _ = _listing(base_path)
+    pending = [os.path.join(base_path, name) for name in top if name.startswith("installed_")]
+    while pending:
+        directory = pending.pop()
+        subdirectories, has_data = _listing(directory)
+        if has_data:
+            found.append(os.path.join(directory, "data.json"))
+        pending.extend(os.path.join(directory, name) for name in subdirectories)
+    return sorted(found)
+
+def source_files(kind):
+    if not os.path.isdir(kind):
+        return []
+    return [os.path.join(kind, f) for f in sorted(os.listdir(kind)) if f.endswith(".py") and f != "__init__.py"]
+
+def current():
+    """Return {group: {path: signature}} for "commands", "programs" and "packages"."""
+    state = {kind: {path: signature(path) for path in source_files(kind)} for kind in SOURCE_KINDS}
+    state["packages"] = {path: signature(path) for path in package_files()}
+    return state
+
+def diff(old, new):
+    """Return (added, modified, deleted) paths between two {path: signature} dicts."""
+    added = [path for path in new if path not in old]
+    modified = [path for path in new if path in old and old[path] != new[path]]
+    deleted = [path for path in old if path not in new]
+    return added, modified, deleted
+
+def collect():
+    """
+    Compare the tree with the last collected state and remember the new one.
+    Returns {group: (added, modified, deleted)} for the groups that changed.
+    """
+    with _lock:
+        state = current()
+        changes = {}
+        for group, signatures in state.items():
+            added, modified, deleted = diff(_signatures.get(group, {}), signatures)
+            if added or modified or deleted:
+                changes[group] = (added, modified, deleted)
+        _signatures.clear()
+        _signatures.update(state)
+        _changed.clear()
+    return changes
+
+def has_changes():
+    """True when the tree differs from the last collect() (cheap; the watcher sets this flag)."""
+    return _changed.is_set()
+
+def request_reload():
+    """Ask for a reload from any thread; the shell applies it between commands."""
+    _changed.set()
+
+def _watch():
+    while not _stop.wait(WATCH_INTERVAL):
+        with _lock:
+            if not _changed.is_set() and current() != _signatures:
+                _changed.set()
+
+def start_watcher():
+    """Poll the tree in a daemon thread and raise has_changes() when something was edited, added or removed."""
+    global _thread
+    with _watcher_lock:
+        if _thread is not None and _thread.is_alive():
+            if not _stop.is_set():
+                return  # Already watching
+            _thread.join()  # Stopped but not exited yet; it wakes up at once since _stop is set
+        _stop.clear()
+        _thread = threading.Thread(target=_watch, name="pyos-hotreload", daemon=True)
+        _thread.start()
+
+def stop_watcher():
+    with _watcher_lock:
+        _stop.set()
+
+def is_watching():
+    return _thread is not None and _thread.is_alive() and not _stop.is_set()
@@ -0,0 +1,114 @@
+import os
+import json
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+# Verifies Python sources by byte-compiling them (never executing them). Results are cached by the
+# SHA-256 of the source, and files whose mtime/size did not change cost a single stat.
+
+CACHE_FILE = os.path.join(".OSData", "integrity_cache.json")
+CHECKED_DIRS = ["pyos", "commands", "programs"]
+INSTALLED_DIR = "files"
+POOL_THRESHOLD = 8  # Below this many changed files compiling in-process is faster than starting a pool
+
+_lock = threading.Lock()
+
+def compile_source(path, source):
+    """Byte-compile a source file. Returns None if it compiles, otherwise the error message."""
+    try:
+        compile(source, path, "exec", dont_inherit=True)
+    except (SyntaxError, ValueError) as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+def _compile_file(path):
+    try:
+        with open(path, "rb") as f:
+            return compile_source(path, f.read())
+    except OSError as e:
+        return f"{type(e).__name__}: {e}"
+
+def find_sources():
+    """Return every .py file in pyos/, commands/, programs/ and the installed marketplace packages."""
+    sources = []
+    for directory in CHECKED_DIRS:
+        if os.path.isdir(directory):
+            sources.extend(os.path.join(directory, f) for f in sorted(os.listdir(directory)) if f.endswith(".py"))
+    if os.path.isdir(INSTALLED_DIR):
+        for entry in sorted(os.listdir(INSTALLED_DIR)):
+            category = os.path.join(INSTALLED_DIR, entry)
+            if entry.startswith("installed_") and os.path.isdir(category):
+                for root, dirs, files in os.walk(category):
+                    sources.extend(os.path.join(root, f) for f in sorted(files) if f.endswith(".py"))
+    return sources
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE, "r") as f:
+            cache = json.load(f)
+        return cache.get("files", {}), cache.get("results", {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}, {}
+
+def _save_cache(files, results):
+    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+    temp_file = CACHE_FILE + ".tmp"
+    with open(temp_file, "w") as f:
+        json.dump({"files": files, "results": results}, f)
+    os.replace(temp_file, CACHE_FILE)
+
+def verify(sources=None):
+    """
+    Byte-compile every source that changed since the last run.
+    Returns {path: error message} for the files that do not compile (empty if everything is fine).
+    A file that can't be read (e.g. deleted during the check) is reported as unverified and not cached.
+    """
+    sources = find_sources() if sources is None else sources
+    with _lock:
+        files, results = _load_cache()
+        new_files = {}
+        to_compile = {}  # sha256 -> path
+        unverified = {}  # path -> error message
+        changed = False
+
+        for path in sources:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            cached = files.get(path)
+            if cached and cached["mtime"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                new_files[path] = cached
+                continue
+
+            try:
+                with open(path, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+            except OSError as e:
+                unverified[path] = f"Unverified ({type(e).__name__}: {e})"
+                continue
+            new_files[path] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "sha256": digest}
+            changed = True
+            if digest not in results:
+                to_compile.setdefault(digest, path)
+
+        if to_compile:
+            digests = list(to_compile)
+            paths = [to_compile[d] for d in digests]
+            if len(paths) >= POOL_THRESHOLD:
+                with ProcessPoolExecutor() as pool:
+                    errors = list(pool.map(_compile_file, paths))
+            else:
+                errors = [_compile_file(path) for path in paths]
+            results.update(zip(digests, errors))
+
+        # Forget results for sources that no longer exist anywhere
+        live = {entry["sha256"] for entry in new_files.values()}
+        if changed or len(new_files) != len(files) or len(results) != len(live):
+            results = {digest: error for digest, error in results.items() if digest in live}
+            _save_cache(new_files, results)
+
+    errors = {path: results[entry["sha256"]] for path, entry in new_files.items() if results.get(entry["sha256"])}
+    errors.update(unverified)
+    return errors
@@ -0,0 +1,245 @@
+import io
+import sys
+import time
+import _thread
+import threading
+import traceback
+import subprocess
+from collections import deque
+
+# Background jobs for the shell (`cmd &`). A job runs in a worker thread, or in a child process for installed
+# packages. While jobs exist, sys.stdout/sys.stdin are replaced by proxies that route by thread: a job
+# thread's output goes into its own bounded buffer and its input reads as end-of-file, so the prompt stays usable.
+
+OUTPUT_LINES = 1000  # Lines of output kept per job
+KEEP_FINISHED = 10  # Finished jobs kept in the table so their output can still be read with fg
+
+class JobCancelled(BaseException):
+    """Raised inside a job thread when the job is killed."""
+
+class Job:
+    def __init__(self, number, command):
+        self.number = number
+        self.command = command
+        self.status = "running"
+        self.started = time.time()
+        self.finished = None
+        self.output = deque(maxlen=OUTPUT_LINES)
+        self.partial = ""
+        self.thread = None
+        self.process = None
+        self.attached = False  # In the foreground: output goes straight to the terminal
+        self.reported = False
+        self.lock = threading.Lock()
+
+    def write(self, text):
+        with self.lock:
+            if self.attached:
+                _real_stdout.write(text)
+                _real_stdout.flush()
+                return
+            lines = (self.partial + text).split("\n")
+            # A carriage return redraws the line (e.g. countdowns); only keep what follows it
+            self.partial = lines.pop().rsplit("\r", 1)[-1]
+            self.output.extend(line.rsplit("\r", 1)[-1] for line in lines)
+
+    def lines(self):
+        with self.lock:
+            return list(self.output) + ([self.partial] if self.partial else [])
+
+    def finish(self, status):
+        self.status = status
+        self.finished = time.time()
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.time()) - self.started
+
+    def is_running(self):
+        return self.status == "running"
+
+_jobs = {}  # job number -> Job
+_thread_jobs = {}  # thread ident -> Job whose output that thread produces
+_lock = threading.Lock()
+_real_stdout = sys.stdout
+_real_stdin = sys.stdin
+_shutdown_requested = threading.Event()
+
+class RoutedStdout:
+    """Stands in for sys.stdout: job threads write to their job, every other thread to the terminal."""
+
+    def write(self, text):
+        job = _thread_jobs.get(threading.get_ident())
+        if job is None:
+            return _real_stdout.write(text)
+        job.write(text)
+        return len(text)
+
+    def flush(self):
+        if threading.get_ident() not in _thread_jobs:
+            _real_stdout.flush()
+
+    def isatty(self):
+        return threading.get_ident() not in _thread_jobs and _real_stdout.isatty()
+
+    def __getattr__(self, name):
+        return getattr(_real_stdout, name)
+
+class RoutedStdin:
+    """Stands in for sys.stdin: job threads get end-of-file instead of competing with the prompt."""
+
+    def readline(self, *args):
+        if threading.get_ident() in _thread_jobs:
+            return ""
+        return _real_stdin.readline(*args)
+
+    def read(self, *args):
+        if threading.get_ident() in _thread_jobs:
+            return ""
+        return _real_stdin.read(*args)
+
+    def isatty(self):
+        return threading.get_ident() not in _thread_jobs and _real_stdin.isatty()
+
+    def fileno(self):
+        # Without a descriptor, input() falls back to readline() above instead of reading the terminal itself
+        if threading.get_ident() in _thread_jobs:
+            raise io.UnsupportedOperation("fileno")
+        return _real_stdin.fileno()
+
+    def __getattr__(self, name):
+        return getattr(_real_stdin, name)
+
+def install_streams():
+    global _real_stdout, _real_stdin
+    if not isinstance(sys.stdout, RoutedStdout):
+        _real_stdout = sys.stdout
+        sys.stdout = RoutedStdout()
+    if not isinstance(sys.stdin, RoutedStdin):
+        _real_stdin = sys.stdin
+        sys.stdin = RoutedStdin()
+
+def _new_job(command):
+    install_streams()
+    with _lock:
+        number = max(_jobs, default=0) + 1
+        job = _jobs[number] = Job(number, command)
+    return job
+
+def start_thread(command, func):
+    """
+    Run func() as a background job. func may return a status ("ok" means success, as from
+    shell.execute_line); exceptions mark the job as failed and their traceback goes to the job's output.
+    """
+    job = _new_job(command)
+
+    def run():
+        _thread_jobs[threading.get_ident()] = job
+        try:
+            result = func()
+            job.finish("done" if result in (None, "ok") else "failed")
+        except JobCancelled:
+            job.finish("killed")
+        except KeyboardInterrupt:
+            # pyos.shutdown() signals a shutdown this way; hand it to the main thread
+            job.finish("done")
+            _shutdown_requested.set()
+            _thread.interrupt_main()
+        except SystemExit as e:
+            job.finish("done" if e.code in (None, 0) else "failed")
+        except Exception:
+            job.write(traceback.format_exc())
+            job.finish("failed")
+        finally:
+            _thread_jobs.pop(threading.get_ident(), None)
+
+    job.thread = threading.Thread(target=run, name=f"pyos-job-{job.number}", daemon=True)
+    job.thread.start()
+    return job
+
+def start_process(command, argv):
+    """Run argv as a background job in a child process, capturing its output."""
+    job = _new_job(command)
+    job.process = subprocess.Popen(argv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, errors="replace")
+
+    def pump():
+        for line in job.process.stdout:
+            job.write(line)
+        code = job.process.wait()
+        if job.is_running():
+            job.finish("done" if code == 0 else "failed")
+
+    job.thread = threading.Thread(target=pump, name=f"pyos-job-{job.number}", daemon=True)
+    job.thread.start()
+    return job
+
+def get(number=None):
+    """A job by number, or the most recent one if no number is given."""
+    with _lock:
+        if number is None:
+            return _jobs[max(_jobs)] if _jobs else None
+        return _jobs.get(number)
+
+def parse_spec(spec):
+    """Job number from '%n' or 'n' (None for an empty spec). Raises ValueError otherwise."""
+    spec = (spec or "").strip()
+    if not spec:
+        return None
+    return int(spec[1:] if spec.startswith("%") else spec)
+
+def all_jobs():
+    with _lock:
+        return [_jobs[number] for number in sorted(_jobs)]
+
+def cancel(job):
+    """Stop a job: terminate its process, or raise JobCancelled in its thread at the next bytecode."""
+    if not job.is_running():
+        return False
+    if job.process is not None:
+        job.process.terminate()
+        job.finish("killed")
+        return True
+    import ctypes  # CPython only; raising in another thread has no pure-Python equivalent
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(job.thread.ident), ctypes.py_object(JobCancelled))
+    return True
+
+def foreground(job):
+    """Replay a job's buffered output, then stream it live until the job ends. Ctrl+C kills the job."""
+    with job.lock:  # Holding the lock keeps the job from writing between the replay and attaching
+        for line in job.output:
+            _real_stdout.write(line + "\n")
+        _real_stdout.write(job.partial)
+        _real_stdout.flush()
+        job.partial = ""
+        job.attached = True
+    try:
+        while job.thread.is_alive():
+            try:
+                job.thread.join(0.1)
+            except KeyboardInterrupt:
+                cancel(job)
+    finally:
+        job.attached = False
+    job.reported = True
+    remove(job)
+
+def remove(job):
+    with _lock:
+        _jobs.pop(job.number, None)
+
+def take_finished():
+    """Jobs that ended since the last call (each is reported once). Only the newest KEEP_FINISHED stay listed."""
+    finished = []
+    with _lock:
+        for job in _jobs.values():
+            if not job.is_running() and not job.reported:
+                job.reported = True
+                finished.append(job)
+        done = [number for number in sorted(_jobs) if not _jobs[number].is_running()]
+        for number in done[:-KEEP_FINISHED]:
+            del _jobs[number]
+    return finished
+
+def shutdown_requested():
+    return _shutdown_requested.is_set()
@@ -0,0 +1,49 @@
+import os
+import sys
+
+# Single keypress input for full-screen menus, without waiting for Enter. Returns names for special keys
+# ("up", "down", "left", "right", "enter", "backspace", "tab", "esc") and the character for anything else.
+
+ESCAPE_SEQUENCES = {"[A": "up", "[B": "down", "[C": "right", "[D": "left", "OA": "up", "OB": "down", "OC": "right", "OD": "left"}
+WINDOWS_KEYS = {"H": "up", "P": "down", "M": "right", "K": "left"}
+CONTROL_KEYS = {"\r": "enter", "\n": "enter", "\t": "tab", "\x7f": "backspace", "\x08": "backspace", "\x1b": "esc"}
+ESCAPE_TIMEOUT = 0.05  # How long to wait for the rest of an escape sequence before treating it as Esc
+
+def is_interactive():
+    """True when single keys can be read (stdin is a terminal)."""
+    try:
+        return sys.stdin.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+if os.name == "nt":
+    import msvcrt
+
+    def read_key():
+        char = msvcrt.getwch()
+        if char in ("\x00", "\xe0"):  # Arrow and function keys come as two characters
+            return WINDOWS_KEYS.get(msvcrt.getwch(), "")
+        if char == "\x03":
+            raise KeyboardInterrupt
+        return CONTROL_KEYS.get(char, char)
+else:
+    import tty
+    import select
+    import termios
+
+    def read_key():
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)  # Keeps Ctrl+C working, unlike raw mode
+            data = os.read(fd, 1)
+            if data == b"\x1b" and select.select([fd], [], [], ESCAPE_TIMEOUT)[0]:
+                data += os.read(fd, 2)
+            elif data and data[0] >= 0xc0:  # First byte of a multi-byte UTF-8 character
+                data += os.read(fd, 1 if data[0] < 0xe0 else 2 if data[0] < 0xf0 else 3)
+            char = data.decode("utf-8", errors="ignore")
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        if char.startswith("\x1b") and len(char) > 1:
+            return ESCAPE_SEQUENCES.get(char[1:3], "")
+        return CONTROL_KEYS.get(char, char)
@@ -0,0 +1,224 @@
+import os
+import ast
+import sys
+import json
+import time
+import tempfile
+import traceback
+import threading
+import subprocess
+import importlib.util
+from . import session
+
+# Launching installed marketplace packages. A package whose run script defines a top-level execute() runs
+# in the shell's own interpreter (its module is cached until the file changes). Packages without one, or that
+# set "isolated": true in data.json, run in a child forked from a warm worker (see pyos/zygote.py), and
+# platforms without fork fall back to a fresh interpreter. Launch latency is recorded per mode.
+# In every mode the pyOS folder is on sys.path, so package scripts can always import pyos.
+
+MODES = ["in-process", "zygote", "subprocess"]
+ZYGOTE_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "zygote.py")
+PYOS_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ZYGOTE_SUPPORTED = hasattr(os, "fork") and hasattr(os, "waitstatus_to_exitcode")
+
+# Stand-alone bootstrap for packages in a child interpreter: records when the script starts (if a started file
+# is given), then runs it as __main__, or imports it and calls its execute() the way the in-process mode does
+# (argv: started file or "", pyOS folder, "__main__" or "execute", script, script arguments)
+SUBPROCESS_BOOTSTRAP = """
+import os, sys, time, runpy
+started, root, entry = sys.argv[1:4]
+if started:
+    open(started, 'w').write(repr(time.time()))
+sys.argv = sys.argv[4:]
+sys.path[0:1] = [os.path.dirname(sys.argv[0]), root]
+if entry == 'execute':
+    runpy.run_path(sys.argv[0], run_name='installed_package_' + os.path.basename(os.path.dirname(os.path.abspath(sys.argv[0]))))['execute']()
+else:
+    runpy.run_path(sys.argv[0], run_name='__main__')
+"""
+
+# Per mode: number of launches, total and last seconds from the launch request until the package's code starts
+_latencies = {mode: {"launches": 0, "total": 0.0, "last": 0.0} for mode in MODES}
+_modules = {}  # script path -> ((mtime_ns, size), module)
+_child_usage = {"user": 0.0, "system": 0.0, "maxrss": 0}  # Totals for children forked by the warm worker
+_zygote = None
+_lock = threading.Lock()
+
+def declares_execute(script_path):
+    """True if the script defines execute() at the top level (checked with ast, without importing it)."""
+    try:
+        with open(script_path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=script_path)
+    except (OSError, SyntaxError, UnicodeDecodeError):
+        return False
+    return any(isinstance(node, ast.FunctionDef) and node.name == "execute" for node in tree.body)
+
+def choose_mode(script_path, isolated=False):
+    if not isolated and declares_execute(script_path):
+        return "in-process"
+    return "zygote" if ZYGOTE_SUPPORTED else "subprocess"
+
+def record(mode, seconds):
+    with _lock:
+        latency = _latencies[mode]
+        latency["launches"] += 1
+        latency["total"] += seconds
+        latency["last"] = seconds
+
+def latency_report():
+    """Return {mode: {"launches", "mean", "last"}} in seconds for every mode that was used."""
+    with _lock:
+        return {
+            mode: {"launches": latency["launches"], "mean": latency["total"] / latency["launches"], "last": latency["last"]}
+            for mode, latency in _latencies.items() if latency["launches"]
+        }
+
+def child_usage():
+    """CPU seconds and largest peak RSS of packages run in the warm worker. Those children aren't ours, so
+    resource.getrusage(RUSAGE_CHILDREN) does not include them."""
+    with _lock:
+        return dict(_child_usage)
+
+def exit_code(code):
+    """Translate a SystemExit code the way the interpreter does."""
+    if code is None:
+        return 0
+    return code if isinstance(code, int) else 1
+
+def load_script(script_path):
+    """Import a run script as a module, reusing the previous import while the file is unchanged."""
+    stat = os.stat(script_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _modules.get(script_path)
+    if cached and cached[0] == signature:
+        return cached[1]
+    package_name = os.path.basename(os.path.dirname(os.path.abspath(script_path)))
+    spec = importlib.util.spec_from_file_location(f"installed_package_{package_name}", script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    _modules[script_path] = (signature, module)
+    return module
+
+def run_in_process(script_path, start):
+    try:
+        module = load_script(script_path)
+        record("in-process", time.perf_counter() - start)
+        module.execute()
+    except SystemExit as e:
+        return exit_code(e.code)
+    except KeyboardInterrupt:
+        return 130
+    except Exception:
+        traceback.print_exc()  # What the interpreter would have printed for the script
+        return 1
+    return 0
+
+class Zygote:
+    """Client side of a warm worker process (pyos/zygote.py)."""
+
+    def __init__(self):
+        request_read, request_write = os.pipe()
+        status_read, status_write = os.pipe()
+        self.process = subprocess.Popen(
+            [sys.executable, ZYGOTE_SCRIPT, str(request_read), str(status_write)],
+            pass_fds=(request_read, status_write)
+        )
+        os.close(request_read)
+        os.close(status_write)
+        self.requests = os.fdopen(request_write, "w")
+        self.status = os.fdopen(status_read, "r")
+        self.ready = False
+
+    def receive(self):
+        # Ctrl+C goes to the package (and is ignored by the worker); keep waiting for its answer
+        while True:
+            try:
+                line = self.status.readline()
+                break
+            except KeyboardInterrupt:
+                continue
+        if not line:
+            raise OSError("The launch worker exited unexpectedly.")
+        return json.loads(line)
+
+    def wait_ready(self):
+        if not self.ready:
+            self.ready = self.receive().get("ready", False)
+
+    def run(self, script_path, argv):
+        self.wait_ready()
+        wall_start = time.time()
+        self.requests.write(json.dumps({"script": os.path.abspath(script_path), "argv": argv}) + "\n")
+        self.requests.flush()
+        started = self.receive()["started"]
+        record("zygote", started - wall_start)
+        result = self.receive()
+        with _lock:
+            usage = result.get("usage", {})
+            _child_usage["user"] += usage.get("user", 0.0)
+            _child_usage["system"] += usage.get("system", 0.0)
+            _child_usage["maxrss"] = max(_child_usage["maxrss"], usage.get("maxrss", 0))
+        return result["exit"]
+
+    def alive(self):
+        return self.process.poll() is None
+
+    def close(self):
+        self.requests.close()
+        self.process.wait()
+
+def get_zygote():
+    """Return the warm worker, (re)starting it if needed."""
+    global _zygote
+    with _lock:
+        if _zygote is None or not _zygote.alive():
+            _zygote = Zygote()
+        return _zygote
+
+def prestart():
+    """Start the warm worker in the background so the first isolated launch is already warm."""
+    if ZYGOTE_SUPPORTED:
+        get_zygote()
+
+def run_in_zygote(script_path, argv):
+    global _zygote
+    zygote = None
+    try:
+        zygote = get_zygote()
+        return zygote.run(script_path, argv)
+    except OSError:
+        with _lock:
+            if zygote is not None and _zygote is zygote:
+                _zygote = None  # Started again on the next launch
+        return run_in_subprocess(script_path, argv)
+
+def run_in_subprocess(script_path, argv):
+    wall_start = time.time()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        started_file = os.path.join(temp_dir, "started")
+        result = subprocess.run([sys.executable, "-c", SUBPROCESS_BOOTSTRAP, started_file, PYOS_ROOT, "__main__", os.path.abspath(script_path)] + argv)
+        try:
+            with open(started_file, "r") as f:
+                record("subprocess", float(f.read()) - wall_start)
+        except (OSError, ValueError):
+            pass  # The interpreter failed before reaching the script
+    return result.returncode
+
+def child_command(script_path, isolated=False, argv=None):
+    """
+    Command line that runs a package in a child process with the same entry point and sys.path as run_package
+    (its execute() unless it is isolated or has none, otherwise the script as __main__). Used for background jobs.
+    """
+    entry = "execute" if choose_mode(script_path, isolated) == "in-process" else "__main__"
+    return [sys.executable, "-c", SUBPROCESS_BOOTSTRAP, "", PYOS_ROOT, entry, os.path.abspath(script_path)] + (argv or [])
+
+def run_package(script_path, isolated=False, argv=None):
+    """Run an installed package's script with the cheapest mode it supports. Returns its exit code."""
+    start = time.perf_counter()
+    session.flush()  # Isolated packages read current_directory.txt
+    mode = choose_mode(script_path, isolated)
+    if mode == "in-process":
+        return run_in_process(script_path, start)
+    if mode == "zygote":
+        return run_in_zygote(script_path, argv or [])
+    return run_in_subprocess(script_path, argv or [])
@@ -0,0 +1,69 @@
+import importlib
+import threading
+
+# Module proxies that defer the real import until first attribute access.
+#
+# Convention: commands, programs and core modules declare heavy dependencies (network/process libraries such as
+# requests and psutil, and rich widgets beyond Console) at module level through lazy_import/lazy_from, so they
+# are only imported once the command actually runs and loading or listing commands stays cheap.
+
+_lock = threading.Lock()
+
+class LazyImport:
+    """Stands in for a module and imports it on first attribute access."""
+
+    def __init__(self, module_name):
+        object.__setattr__(self, "_module_name", module_name)
+        object.__setattr__(self, "_module", None)
+
+    def _resolve(self):
+        module = object.__getattribute__(self, "_module")
+        if module is None:
+            with _lock:
+                module = object.__getattribute__(self, "_module")
+                if module is None:
+                    module = importlib.import_module(object.__getattribute__(self, "_module_name"))
+                    object.__setattr__(self, "_module", module)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._resolve(), attr, value)
+
+    def __repr__(self):
+        state = "loaded" if object.__getattribute__(self, "_module") is not None else "not loaded"
+        return f"<LazyImport {object.__getattribute__(self, '_module_name')} ({state})>"
+
+class LazyAttribute:
+    """Stands in for `from module import name`; resolves on first call or attribute access."""
+
+    def __init__(self, module_name, attr):
+        self._module = LazyImport(module_name)
+        self._attr = attr
+        self._value = None
+
+    def _resolve(self):
+        if self._value is None:
+            self._value = getattr(self._module, self._attr)
+        return self._value
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self._resolve(), attr)
+
+def lazy_import(module_name):
+    """`requests = lazy_import("requests")` behaves like `import requests`, but imports on first use."""
+    return LazyImport(module_name)
+
+def lazy_from(module_name, *names):
+    """
+    `Prompt, IntPrompt = lazy_from("rich.prompt", "Prompt", "IntPrompt")` behaves like `from rich.prompt import ...`,
+    but imports on first use. A single name returns a single object. Not for exception classes: `except`
+    needs the real class, use `lazy_import(module).SomeError` instead.
+    """
+    attributes = tuple(LazyAttribute(module_name, name) for name in names)
+    return attributes[0] if len(attributes) == 1 else attributes
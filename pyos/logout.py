@@ -1,19 +1,21 @@
 from rich.console import Console
 import os
-import shell
-import users
+from . import events, session
+from .lazyimport import lazy_import
+
+shell = lazy_import("shell")
+users = lazy_import("users")
 
 # Initialize the console for rich output
 console = Console()
 
-SESSION_FILE = "current_user.json"
-
 def logout():
     MAX_ATTEMPTS = 3  # Set the maximum number of login attempts
     attempts = 0
     username = None
     try:
-        os.remove('current_user.json')
+        os.remove(session.SESSION_FILE)
+        events.publish("session.changed", username=None)
         console.print("[bold green]Logged out successfully![/bold green]")
         while attempts < MAX_ATTEMPTS:
             username = users.login_after_logout()
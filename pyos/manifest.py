@@ -0,0 +1,91 @@
+import os
+import ast
+import json
+import threading
+
+# Reads each command/program's `config` dict with ast instead of importing the module, and caches the
+# result keyed by file mtime and size so unchanged files cost a single stat.
+
+MANIFEST_FILE = os.path.join(".OSData", "module_manifest.json")
+
+_cache = None  # "kind/file.py" -> {"mtime": ..., "size": ..., "config": {...} or None, "error": str or None}
+_lock = threading.Lock()
+
+def extract_config(file_path):
+    """Return the literal `config` dict assigned at the top level of a file, or None if there isn't one."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=file_path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "config" for t in node.targets):
+            try:
+                value = ast.literal_eval(node.value)
+            except ValueError:
+                return None  # Not a literal; the module has to be imported to read it
+            return value if isinstance(value, dict) else None
+    return None
+
+def _load_cache():
+    global _cache
+    if _cache is None:
+        try:
+            with open(MANIFEST_FILE, "r") as f:
+                _cache = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            _cache = {}
+    return _cache
+
+def _save_cache():
+    os.makedirs(os.path.dirname(MANIFEST_FILE), exist_ok=True)
+    temp_file = MANIFEST_FILE + ".tmp"
+    with open(temp_file, "w") as f:
+        json.dump(_cache, f)
+    os.replace(temp_file, MANIFEST_FILE)
+
+def scan(kind):
+    """
+    Return {module name: entry} for every .py file in a directory.
+    Each entry has "config" (the literal config dict or None) and "error" (a parse error or None).
+    """
+    entries = {}
+    changed = False
+    if not os.path.isdir(kind):
+        return entries
+
+    with _lock:
+        cache = _load_cache()
+        seen = set()
+        for file_name in sorted(os.listdir(kind)):
+            if not file_name.endswith(".py") or file_name == "__init__.py":
+                continue
+            key = f"{kind}/{file_name}"
+            seen.add(key)
+            stat = os.stat(os.path.join(kind, file_name))
+            entry = cache.get(key)
+            if entry is None or entry["mtime"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+                entry = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "config": None, "error": None}
+                try:
+                    entry["config"] = extract_config(os.path.join(kind, file_name))
+                except (SyntaxError, UnicodeDecodeError, OSError) as e:
+                    entry["error"] = str(e)
+                cache[key] = entry
+                changed = True
+            entries[file_name[:-3]] = entry
+
+        for key in [k for k in cache if k.startswith(f"{kind}/") and k not in seen]:
+            del cache[key]  # File was deleted
+            changed = True
+
+        if changed:
+            _save_cache()
+    return entries
+
+def export_state():
+    """Return a copy of the manifest cache (used by the fast-resume snapshot)."""
+    with _lock:
+        return dict(_load_cache())
+
+def restore_state(cache):
+    """Seed the manifest cache from a fast-resume snapshot."""
+    global _cache
+    with _lock:
+        _cache = dict(cache)
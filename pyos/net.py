@@ -0,0 +1,119 @@
+import os
+import json
+import time
+import socket
+import threading
+
+# Shared connectivity monitor. A background thread probes the network and callers read the cached result,
+# so nobody pays for a blocking TCP probe on the hot path.
+
+PROBE_HOST = "8.8.8.8"  # Google DNS
+PROBE_PORT = 53
+PROBE_TIMEOUT = 3
+STATUS_TTL = 30  # Seconds before a cached result is re-probed
+POLL_INTERVAL = 1  # How often the monitor looks at interface state
+STATUS_FILE = os.path.join(".OSData", "net_status.json")
+
+_state = {"online": None, "checked": 0.0, "interfaces": None}
+_lock = threading.Lock()
+_ready = threading.Event()
+_wake = threading.Event()
+_thread = None
+
+def interface_signature():
+    """Return which interfaces are up, as reported by psutil.net_if_stats (None if psutil is unavailable)."""
+    try:
+        import psutil
+        stats = psutil.net_if_stats()
+    except Exception:
+        return None
+    return sorted(name for name, info in stats.items() if info.isup)
+
+def has_usable_interface(interfaces):
+    if interfaces is None:
+        return True  # Unknown, let the probe decide
+    return any(not name.startswith("lo") for name in interfaces)
+
+def probe(host=PROBE_HOST, port=PROBE_PORT, timeout=PROBE_TIMEOUT):
+    """Blocking TCP probe. Prefer status()/is_online(), which never block on the network."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+def _store(online, interfaces):
+    with _lock:
+        _state.update(online=online, checked=time.time(), interfaces=interfaces)
+        snapshot = dict(_state)
+    _ready.set()
+    try:
+        os.makedirs(os.path.dirname(STATUS_FILE), exist_ok=True)
+        with open(STATUS_FILE, "w") as f:
+            json.dump(snapshot, f)
+    except OSError:
+        pass
+
+def refresh():
+    """Probe now (blocking) and update the cached status."""
+    interfaces = interface_signature()
+    # No interface other than loopback is up: we are offline without waiting for a timeout
+    online = probe() if has_usable_interface(interfaces) else False
+    _store(online, interfaces)
+    return online
+
+def _load_persisted():
+    """Reuse the status another pyOS process recorded a moment ago, if the interfaces still look the same."""
+    try:
+        with open(STATUS_FILE, "r") as f:
+            persisted = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return
+    if time.time() - persisted.get("checked", 0) > STATUS_TTL:
+        return
+    if persisted.get("interfaces") != interface_signature():
+        return
+    with _lock:
+        _state.update(persisted)
+    _ready.set()
+
+def _monitor():
+    while True:
+        with _lock:
+            stale = time.time() - _state["checked"] > STATUS_TTL
+            interfaces = _state["interfaces"]
+        if stale or interface_signature() != interfaces:
+            refresh()
+        _wake.wait(POLL_INTERVAL)
+        _wake.clear()
+
+def start():
+    """Start the background monitor (safe to call more than once)."""
+    global _thread
+    with _lock:
+        if _thread is not None:
+            return
+        _thread = threading.Thread(target=_monitor, name="pyos-net", daemon=True)
+    _load_persisted()
+    _thread.start()
+
+def status(wait=0):
+    """
+    Return the cached status: True (online), False (offline) or None (not probed yet).
+    Pass wait=<seconds> to wait for the first probe when nothing is known yet.
+    """
+    start()
+    if wait and not _ready.is_set():
+        _ready.wait(wait)
+    with _lock:
+        return _state["online"]
+
+def is_online(wait=PROBE_TIMEOUT + 1):
+    """True if the network was reachable at the last probe, waiting for the first probe if needed."""
+    return bool(status(wait))
+
+def invalidate():
+    """Mark the cached status as stale so the monitor re-probes right away."""
+    with _lock:
+        _state["checked"] = 0.0
+    _wake.set()
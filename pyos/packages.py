@@ -0,0 +1,120 @@
+import os
+import re
+import sys
+import threading
+from importlib import metadata
+
+# packaging ships with pip; fall back to pip's vendored copy and then to name-only matching
+try:
+    from packaging.requirements import Requirement, InvalidRequirement
+except ImportError:
+    try:
+        from pip._vendor.packaging.requirements import Requirement, InvalidRequirement
+    except ImportError:
+        Requirement = None
+        InvalidRequirement = ValueError
+
+_index = None  # {canonical name: version}
+_snapshot = None  # {site directory: mtime} the index was built from
+_lock = threading.Lock()
+
+def canonicalize(name):
+    """Normalize a distribution name the way pip does (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def site_directories():
+    """Return the sys.path directories that can hold installed distributions."""
+    return [entry for entry in sys.path if entry and os.path.isdir(entry)]
+
+def take_snapshot():
+    snapshot = {}
+    for directory in site_directories():
+        try:
+            snapshot[directory] = os.stat(directory).st_mtime_ns
+        except OSError:
+            continue
+    return snapshot
+
+def build_index():
+    index = {}
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            index.setdefault(canonicalize(name), dist.version)
+    return index
+
+def get_index():
+    """Return the installed-package index, rebuilding it only when a site-packages directory changed."""
+    global _index, _snapshot
+    snapshot = take_snapshot()
+    with _lock:
+        if _index is None or snapshot != _snapshot:
+            _index = build_index()
+            _snapshot = snapshot
+        return _index
+
+def invalidate():
+    """Drop the cached index, e.g. right after pip installed or removed something."""
+    global _index
+    with _lock:
+        _index = None
+
+def get_version(name):
+    """Return the installed version of a distribution, or None if it is not installed."""
+    return get_index().get(canonicalize(name))
+
+def is_installed(name):
+    return get_version(name) is not None
+
+def parse_requirement(line):
+    """Parse one requirements.txt line. Returns None for blanks, comments and pip options."""
+    line = line.split(" #", 1)[0].strip()
+    if not line or line.startswith(("#", "-")):
+        return None
+    if Requirement is not None:
+        try:
+            return Requirement(line)
+        except InvalidRequirement:
+            return None
+    match = re.match(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)", line)
+    return match.group(1) if match else None
+
+def read_requirements(requirements_file):
+    """Return the parsed requirements of a requirements file (empty if the file does not exist)."""
+    if not os.path.exists(requirements_file):
+        return []
+    with open(requirements_file, "r") as f:
+        parsed = [parse_requirement(line) for line in f]
+    return [requirement for requirement in parsed if requirement is not None]
+
+def is_satisfied(requirement):
+    """Check one requirement (string or parsed) against the installed-package index."""
+    if isinstance(requirement, str):
+        requirement = parse_requirement(requirement)
+        if requirement is None:
+            return True
+    if isinstance(requirement, str):  # packaging unavailable: name-only check
+        return is_installed(requirement)
+    if requirement.marker is not None and not requirement.marker.evaluate():
+        return True  # Not meant for this platform/interpreter
+    version = get_version(requirement.name)
+    if version is None:
+        return False
+    return not requirement.specifier or requirement.specifier.contains(version, prereleases=True)
+
+def missing_requirements(requirements):
+    """Return the requirements that are not satisfied by the installed packages."""
+    return [requirement for requirement in requirements if not is_satisfied(requirement)]
+
+def export_state():
+    """Return the index and the site-packages snapshot it was built from (used by the fast-resume snapshot)."""
+    index = get_index()
+    with _lock:
+        return {"index": dict(index), "snapshot": dict(_snapshot)}
+
+def restore_state(state):
+    """Seed the index from a fast-resume snapshot; it is still rebuilt if site-packages changes later."""
+    global _index, _snapshot
+    with _lock:
+        _index = dict(state["index"])
+        _snapshot = dict(state["snapshot"])
@@ -0,0 +1,165 @@
+import io
+import os
+import re
+import shlex
+import inspect
+from contextlib import redirect_stdout
+from . import session
+
+# Command line parsing for the shell: arguments, `|` pipelines and `>` / `>>` redirection.
+#
+# Output protocol: a command may define `stream(argv, stdin)`, a generator yielding lines of plain text.
+# `argv` is the list of arguments and `stdin` is the previous stage's line iterator (or None).
+# Pipelines chain these generators, so data flows one line at a time with bounded memory.
+# Commands without `stream` still work in a pipeline; their printed output is captured instead.
+
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+class PipelineError(Exception):
+    """Raised for malformed command lines and unknown commands."""
+
+class Operator(str):
+    """An unquoted `|`, `>` or `>>`. Quoted or escaped operator characters stay plain words."""
+
+def tokenize(line):
+    """
+    Split a line the way a POSIX shell does (quotes, backslash escapes), returning words as str and the
+    unquoted operators `|`, `>` and `>>` as Operator, so `grep '>' notes.txt` passes `>` as an argument.
+    """
+    tokens = []
+    word = []
+    in_word = False  # Distinguishes an empty quoted word ('') from no word at all
+    quote = None
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if quote == "'":
+            if char == "'":
+                quote = None
+            else:
+                word.append(char)
+        elif quote == '"':
+            if char == '"':
+                quote = None
+            elif char == "\\" and i + 1 < len(line) and line[i + 1] in '"\\':
+                i += 1
+                word.append(line[i])
+            else:
+                word.append(char)
+        elif char in "'\"":
+            quote = char
+            in_word = True
+        elif char == "\\":
+            if i + 1 >= len(line):
+                raise PipelineError("No escaped character")
+            i += 1
+            word.append(line[i])
+            in_word = True
+        elif char.isspace() or char in "|>":
+            if in_word:
+                tokens.append("".join(word))
+                word, in_word = [], False
+            if char == "|":
+                tokens.append(Operator("|"))
+            elif char == ">":
+                if line.startswith(">>", i):
+                    i += 1
+                    tokens.append(Operator(">>"))
+                else:
+                    tokens.append(Operator(">"))
+        else:
+            word.append(char)
+            in_word = True
+        i += 1
+    if quote is not None:
+        raise PipelineError("No closing quotation")
+    if in_word:
+        tokens.append("".join(word))
+    return tokens
+
+def parse(line):
+    """
+    Parse a command line into ([(name, argv), ...], redirect) where redirect is None or (mode, path)
+    with mode "w" for `>` and "a" for `>>`.
+    """
+    tokens = tokenize(line)
+    stages = [[]]
+    redirect = None
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if not isinstance(token, Operator):
+            stages[-1].append(token)
+        elif token == "|":
+            if redirect is not None:
+                raise PipelineError("Redirection must come at the end of the command line.")
+            stages.append([])
+        else:
+            if redirect is not None or i + 1 >= len(tokens) or isinstance(tokens[i + 1], Operator):
+                raise PipelineError(f"Expected a file name after '{token}'.")
+            redirect = ("a" if token == ">>" else "w", tokens[i + 1])
+            i += 1
+        i += 1
+
+    if any(not stage for stage in stages):
+        raise PipelineError("Empty command in pipeline.")
+    return [(stage[0], stage[1:]) for stage in stages], redirect
+
+def is_simple(line):
+    """True when a line has no unquoted pipes or redirection, i.e. it can run the classic way."""
+    try:
+        return not any(isinstance(token, Operator) for token in tokenize(line))
+    except PipelineError:
+        return "|" not in line and ">" not in line  # parse() reports the quoting error if it matters
+
+def accepts_args(module):
+    return "args" in inspect.signature(module.execute).parameters
+
+def captured_output(module, argv):
+    """Run a command that has no stream() and yield what it printed, line by line."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        if argv and accepts_args(module):
+            module.execute(" ".join(shlex.quote(arg) for arg in argv))
+        else:
+            module.execute()
+    for line in buffer.getvalue().splitlines():
+        yield ANSI_ESCAPE.sub("", line)
+
+def output_of(module, argv, stdin):
+    if hasattr(module, "stream"):
+        return module.stream(argv, stdin)
+    return captured_output(module, argv)
+
+def resolve_output_path(path):
+    """Redirect targets are relative to the shell's current directory and must stay inside /files."""
+    full_path = os.path.abspath(os.path.join(session.get_cwd(), path))
+    if not session.is_inside_base(full_path):
+        raise PipelineError(f"Cannot write outside of /files: {path}")
+    return full_path
+
+def run(stages, redirect, resolve, write=print):
+    """
+    Run parsed stages. `resolve(name)` returns a command module or None. Lines go to `write`
+    unless the pipeline is redirected to a file.
+    """
+    modules = []
+    for name, argv in stages:
+        module = resolve(name)
+        if module is None:
+            raise PipelineError(f"Command not found: {name}")
+        modules.append((module, argv))
+
+    target = resolve_output_path(redirect[1]) if redirect else None
+
+    stream = None
+    for module, argv in modules:
+        stream = output_of(module, argv, stream)
+
+    if target is None:
+        for line in stream:
+            write(line)
+    else:
+        with open(target, redirect[0]) as f:
+            for line in stream:
+                f.write(line + "\n")
@@ -0,0 +1,97 @@
+import os
+import sys
+import importlib
+import threading
+
+# Single owner of command/program/pyos module loading. Boot, the shell, pyos.system and the help menu all
+# get the same module object from here, so each file is executed once per boot.
+
+KINDS = ["commands", "programs", "pyos"]
+
+_modules = {}  # "kind.name" -> module
+_exec_counts = {}  # "kind.name" -> number of times the module body was executed
+_module_locks = {}
+_lock = threading.Lock()
+
+def qualified_name(kind, name):
+    if kind not in KINDS:
+        raise ValueError(f"Unknown module kind '{kind}'")
+    return f"{kind}.{name}"
+
+def list_available(kind):
+    """Returns the module names (without extensions) available for a kind."""
+    if not os.path.isdir(kind):
+        return []
+    return sorted(f[:-3] for f in os.listdir(kind) if f.endswith(".py") and f != "__init__.py")
+
+def exists(kind, name):
+    return os.path.isfile(os.path.join(kind, f"{name}.py"))
+
+def _count_execution(qualified):
+    with _lock:
+        _exec_counts[qualified] = _exec_counts.get(qualified, 0) + 1
+
+def _module_lock(qualified):
+    # One lock per module so boot stages can import different modules concurrently
+    with _lock:
+        return _module_locks.setdefault(qualified, threading.Lock())
+
+def load(kind, name):
+    """Return the module for kind/name, importing (executing) it only the first time."""
+    qualified = qualified_name(kind, name)
+    module = _modules.get(qualified)
+    if module is not None:
+        return module
+    with _module_lock(qualified):
+        module = _modules.get(qualified)
+        if module is not None:
+            return module
+        if qualified not in sys.modules:
+            _count_execution(qualified)
+        module = importlib.import_module(qualified)
+        _modules[qualified] = module
+        return module
+
+def reload(kind, name):
+    """Re-execute a module from disk, updating the shared module object in place."""
+    qualified = qualified_name(kind, name)
+    with _module_lock(qualified):
+        module = _modules.get(qualified) or sys.modules.get(qualified)
+        if module is not None:
+            _count_execution(qualified)
+            module = importlib.reload(module)
+            _modules[qualified] = module
+            return module
+    return load(kind, name)
+
+def forget(kind, name):
+    """Drop a module (e.g. because its file was deleted)."""
+    qualified = qualified_name(kind, name)
+    with _module_lock(qualified):
+        _modules.pop(qualified, None)
+        sys.modules.pop(qualified, None)
+
+def execution_counts():
+    """Return how many times each module was executed in this process."""
+    with _lock:
+        return dict(_exec_counts)
+
+class LazyModule:
+    """Stands in for a command/program module and imports it through the registry on first attribute access."""
+
+    def __init__(self, kind, name):
+        self._kind = kind
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(load(self._kind, self._name), attr)
+
+    def __repr__(self):
+        return f"<LazyModule {qualified_name(self._kind, self._name)}>"
+
+def lazy(kind, name):
+    """Return the module if it is already loaded, otherwise a proxy that loads it on first use."""
+    return _modules.get(qualified_name(kind, name)) or LazyModule(kind, name)
+
+def is_loaded(kind, name):
+    return qualified_name(kind, name) in _modules
@@ -0,0 +1,92 @@
+import time
+import shlex
+import inspect
+from . import registry, dispatch, stats
+
+# Programmatic entry point for commands and programs: pyos.run(name, *args) -> Result.
+# Names and aliases resolve through the dispatch index (falling back to the files on disk) and modules come
+# from the shared registry, so a call never re-imports anything. Problems are raised as RunError subclasses;
+# SystemExit and KeyboardInterrupt are left alone because restart/shutdown rely on them.
+
+KINDS = ["commands", "programs"]
+
+class RunError(Exception):
+    """Base class for errors raised by pyos.run."""
+
+    def __init__(self, name, message):
+        super().__init__(message)
+        self.name = name
+
+class CommandNotFoundError(RunError):
+    """No command or program has this name or alias."""
+
+class NotRunnableError(RunError):
+    """The module exists but has no execute() function."""
+
+class ArgumentError(RunError):
+    """Arguments were given to a command whose execute() takes none."""
+
+class CommandFailedError(RunError):
+    """execute() raised an exception; it is available as __cause__."""
+
+class Result:
+    """Outcome of pyos.run: `value` is what execute() returned, `status` is 0 on success (1 if it returned False)."""
+
+    def __init__(self, name, kind, value, elapsed):
+        self.name = name
+        self.kind = kind
+        self.value = value
+        self.status = 1 if value is False else 0
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.status == 0
+
+    def __repr__(self):
+        return f"<Result {self.kind}.{self.name} status={self.status} value={self.value!r}>"
+
+def resolve(name):
+    """Return (kind, module name) for a command or program name/alias, or (None, None) if it does not exist."""
+    # Names and aliases resolve through the shared dispatch index once the shell has built it
+    for namespace in KINDS:
+        resolved = dispatch.resolve(name, namespace)
+        if resolved and resolved[0] in KINDS:
+            return resolved
+
+    # Fall back to the files on disk (e.g. before the shell has started)
+    for kind in KINDS:
+        if registry.exists(kind, name):
+            return kind, name
+    return None, None
+
+def run(name, *args):
+    """
+    Run a command or program by name or alias. Arguments are passed to execute() as one shell-quoted string,
+    the same way the shell passes them. Returns a Result; raises a RunError subclass on failure.
+    """
+    kind, module_name = resolve(name)
+    if kind is None:
+        raise CommandNotFoundError(name, f"'{name}' not found in either 'commands' or 'programs' directory.")
+
+    try:
+        module = registry.load(kind, module_name)
+    except Exception as e:
+        raise CommandFailedError(name, f"Error executing {kind[:-1]} '{name}': {e}") from e
+
+    execute = getattr(module, "execute", None)
+    if execute is None:
+        raise NotRunnableError(name, f"{kind[:-1].capitalize()} '{name}' does not have an execute function.")
+    if args and "args" not in inspect.signature(execute).parameters:
+        raise ArgumentError(name, f"{kind[:-1].capitalize()} '{name}' does not take any arguments.")
+
+    start = time.perf_counter()
+    try:
+        with stats.measure(module_name):
+            if args:
+                value = execute(" ".join(shlex.quote(str(arg)) for arg in args))
+            else:
+                value = execute()
+    except Exception as e:
+        raise CommandFailedError(name, f"Error executing {kind[:-1]} '{name}': {e}") from e
+    return Result(module_name, kind, value, time.perf_counter() - start)
@@ -0,0 +1,89 @@
+import os
+import atexit
+import threading
+from . import events
+
+# Shell session state held in memory. The working directory is persisted to current_directory.txt only
+# when it changes, debounced and written atomically, so rendering the prompt never touches the disk.
+# Every change is published as a "cwd.changed" event. The logged-in user lives in current_user.json; a batch
+# run points both files elsewhere (see use_files) and package processes inherit that through the environment.
+
+CWD_ENV = "PYOS_CWD_FILE"
+SESSION_ENV = "PYOS_SESSION_FILE"
+CWD_FILE = os.environ.get(CWD_ENV, "current_directory.txt")
+SESSION_FILE = os.environ.get(SESSION_ENV, "current_user.json")
+BASE_DIRECTORY = os.path.abspath("files")
+WRITE_DELAY = 0.5  # Seconds to wait for further changes before writing
+
+_cwd = None
+_dirty = False
+_timer = None
+_lock = threading.Lock()
+
+def _load():
+    global _cwd
+    try:
+        with open(CWD_FILE, "r") as f:
+            _cwd = f.read().strip() or BASE_DIRECTORY
+    except FileNotFoundError:
+        _cwd = BASE_DIRECTORY
+
+def get_cwd():
+    """Return the current directory (read from disk only the first time)."""
+    with _lock:
+        if _cwd is None:
+            _load()
+        return _cwd
+
+def set_cwd(path):
+    """Change the current directory in memory, schedule a write-behind to current_directory.txt and publish it."""
+    global _cwd, _dirty, _timer
+    path = os.path.abspath(path)
+    with _lock:
+        if path == _cwd:
+            return
+        previous = _cwd
+        _cwd = path
+        _dirty = True
+        if _timer is not None:
+            _timer.cancel()
+        _timer = threading.Timer(WRITE_DELAY, flush)
+        _timer.daemon = True
+        _timer.start()
+    events.publish("cwd.changed", path=path, previous=previous)
+
+def flush():
+    """Write pending changes now (atomically). Called automatically after WRITE_DELAY and at exit."""
+    global _dirty, _timer
+    with _lock:
+        if _timer is not None:
+            _timer.cancel()
+            _timer = None
+        if not _dirty:
+            return
+        temp_file = CWD_FILE + ".tmp"
+        with open(temp_file, "w") as f:
+            f.write(_cwd)
+        os.replace(temp_file, CWD_FILE)
+        _dirty = False
+
+def use_files(directory):
+    """Keep this process's user and working directory in `directory` instead of the shared files, starting at /files."""
+    global CWD_FILE, SESSION_FILE, _cwd, _dirty
+    with _lock:
+        CWD_FILE = os.environ[CWD_ENV] = os.path.join(directory, "current_directory.txt")
+        SESSION_FILE = os.environ[SESSION_ENV] = os.path.join(directory, "current_user.json")
+        _cwd = BASE_DIRECTORY
+        _dirty = False
+
+def relative_path(path=None):
+    """Return a path (default: the current directory) relative to /files, e.g. '/docs' or '' for the root."""
+    path = get_cwd() if path is None else path
+    relative = os.path.relpath(path, BASE_DIRECTORY)
+    return f"/{relative}" if relative != "." else ""
+
+def is_inside_base(path):
+    path = os.path.abspath(path)
+    return path == BASE_DIRECTORY or path.startswith(BASE_DIRECTORY + os.sep)
+
+atexit.register(flush)
@@ -0,0 +1,193 @@
+import os
+import json
+import time
+import atexit
+import threading
+from collections import deque
+from contextlib import contextmanager
+from . import jobs
+
+# Latency statistics per command/program. Every invocation records wall time, CPU time (of the calling
+# thread) and its outcome into fixed-size log-linear histograms (HDR style: 16 sub-buckets per power of two
+# of microseconds, so percentiles stay within ~6% whatever the range). Saved to .OSData/stats periodically.
+
+STATS_FILE = os.path.join(".OSData", "stats", "latency.json")
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+MAX_EXPONENT = 40  # 2^40 microseconds is about 12 days
+BUCKETS = SUB_BUCKETS * (MAX_EXPONENT - SUB_BUCKET_BITS + 2)
+RECENT_INVOCATIONS = 200  # Kept for "slowest recent"
+SAVE_INTERVAL = 30  # Seconds between background saves
+OUTCOMES = ["ok", "exception", "cancelled"]
+
+def bucket_index(microseconds):
+    value = max(0, int(microseconds))
+    exponent = value.bit_length() - 1
+    if exponent < SUB_BUCKET_BITS:
+        return value  # Small values get a bucket each
+    exponent = min(exponent, MAX_EXPONENT)
+    sub_bucket = (value >> (exponent - SUB_BUCKET_BITS)) & (SUB_BUCKETS - 1)
+    return SUB_BUCKETS * (exponent - SUB_BUCKET_BITS + 1) + sub_bucket
+
+def bucket_value(index):
+    """Midpoint of a bucket, in microseconds."""
+    if index < SUB_BUCKETS:
+        return index
+    exponent = index // SUB_BUCKETS + SUB_BUCKET_BITS - 1
+    sub_bucket = index % SUB_BUCKETS
+    shift = exponent - SUB_BUCKET_BITS
+    low = (SUB_BUCKETS + sub_bucket) << shift
+    return low + ((1 << shift) - 1) / 2
+
+class Histogram:
+    def __init__(self, counts=None, low=None, high=None):
+        self.counts = [0] * BUCKETS
+        for index, count in (counts or {}).items():
+            self.counts[int(index)] = count
+        self.total = sum(self.counts)
+        self.low = low  # Exact smallest and largest values recorded, in seconds
+        self.high = high
+
+    @classmethod
+    def from_json(cls, data):
+        if "counts" not in data:
+            data = {"counts": data}  # Saved before the exact range was kept
+        return cls(data["counts"], data.get("min"), data.get("max"))
+
+    def record(self, seconds):
+        self.counts[bucket_index(seconds * 1000000)] += 1
+        self.total += 1
+        self.low = seconds if self.low is None else min(self.low, seconds)
+        self.high = seconds if self.high is None else max(self.high, seconds)
+
+    def percentile(self, percent):
+        """Value (in seconds) below which `percent` of the recorded values fall, within the recorded range."""
+        if not self.total:
+            return 0.0
+        target = max(1, round(self.total * percent / 100))
+        running = 0
+        for index, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                value = bucket_value(index) / 1000000
+                break
+        else:
+            return 0.0
+        # A bucket's midpoint can lie beyond the values actually in it
+        if self.low is not None:
+            value = max(value, self.low)
+        if self.high is not None:
+            value = min(value, self.high)
+        return value
+
+    def to_json(self):
+        counts = {str(index): count for index, count in enumerate(self.counts) if count}
+        return {"counts": counts, "min": self.low, "max": self.high}
+
+_commands = None  # name -> {"calls", "outcomes", "wall", "cpu", "max"}
+_recent = deque(maxlen=RECENT_INVOCATIONS)  # (timestamp, name, wall, cpu, outcome)
+_dirty = False
+_timer = None
+_lock = threading.Lock()
+
+def _load():
+    global _commands
+    if _commands is not None:
+        return
+    _commands = {}
+    try:
+        with open(STATS_FILE, "r") as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return
+    for name, entry in data.get("commands", {}).items():
+        _commands[name] = {
+            "calls": entry["calls"],
+            "outcomes": entry["outcomes"],
+            "wall": Histogram.from_json(entry["wall"]),
+            "cpu": Histogram.from_json(entry["cpu"]),
+            "max": entry["max"],
+        }
+    _recent.extend(tuple(invocation) for invocation in data.get("recent", []))
+
+def save():
+    """Write the statistics to disk now if anything changed."""
+    global _dirty, _timer
+    with _lock:
+        _timer = None
+        if not _dirty:
+            return
+        data = {
+            "commands": {
+                name: {"calls": entry["calls"], "outcomes": entry["outcomes"], "wall": entry["wall"].to_json(),
+                       "cpu": entry["cpu"].to_json(), "max": entry["max"]}
+                for name, entry in _commands.items()
+            },
+            "recent": list(_recent),
+        }
+        _dirty = False
+    os.makedirs(os.path.dirname(STATS_FILE), exist_ok=True)
+    temp_file = STATS_FILE + ".tmp"
+    with open(temp_file, "w") as f:
+        json.dump(data, f)
+    os.replace(temp_file, STATS_FILE)
+
+def record(name, wall, cpu, outcome="ok"):
+    global _dirty, _timer
+    with _lock:
+        _load()
+        entry = _commands.get(name)
+        if entry is None:
+            entry = _commands[name] = {"calls": 0, "outcomes": {}, "wall": Histogram(), "cpu": Histogram(), "max": 0.0}
+        entry["calls"] += 1
+        entry["outcomes"][outcome] = entry["outcomes"].get(outcome, 0) + 1
+        entry["wall"].record(wall)
+        entry["cpu"].record(cpu)
+        entry["max"] = max(entry["max"], wall)
+        _recent.append((time.time(), name, wall, cpu, outcome))
+        _dirty = True
+        if _timer is None:
+            _timer = threading.Timer(SAVE_INTERVAL, save)
+            _timer.daemon = True
+            _timer.start()
+
+@contextmanager
+def measure(name):
+    """Time the block as one invocation of `name`; exceptions are recorded and re-raised."""
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    outcome = "ok"
+    try:
+        yield
+    except (KeyboardInterrupt, jobs.JobCancelled):
+        outcome = "cancelled"
+        raise
+    except SystemExit as e:
+        outcome = "ok" if e.code in (None, 0) else "exception"
+        raise
+    except BaseException:
+        outcome = "exception"
+        raise
+    finally:
+        record(name, time.perf_counter() - wall_start, time.thread_time() - cpu_start, outcome)
+
+def summary():
+    """Return [(name, entry)] for every command, most called first."""
+    with _lock:
+        _load()
+        return sorted(_commands.items(), key=lambda item: item[1]["calls"], reverse=True)
+
+def slowest_recent(count=5):
+    with _lock:
+        _load()
+        return sorted(_recent, key=lambda invocation: invocation[2], reverse=True)[:count]
+
+def reset():
+    global _commands, _dirty
+    with _lock:
+        _commands = {}
+        _recent.clear()
+        _dirty = True
+    save()
+
+atexit.register(save)
@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+from . import launch
+from .lazyimport import lazy_import
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+psutil = lazy_import("psutil")
+
+# Process resource snapshots for the shell's `time` builtin. A snapshot is taken before and after a command
+# and difference() turns the pair into wall time, CPU time, peak RSS growth, I/O bytes and child usage.
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+def peak_rss():
+    if resource is not None:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT
+    try:
+        memory = psutil.Process().memory_info()
+        return getattr(memory, "peak_wset", memory.rss)
+    except Exception:
+        return None
+
+def io_counters():
+    """(bytes read, bytes written) by this process, or None where psutil can't tell (e.g. macOS)."""
+    try:
+        counters = psutil.Process().io_counters()
+    except Exception:
+        return None
+    return counters.read_bytes, counters.write_bytes
+
+def children():
+    """CPU seconds and peak RSS (bytes) of finished child processes, including those of the launch worker."""
+    times = os.times()
+    worker = launch.child_usage()
+    usage = {
+        "user": times.children_user + worker["user"],
+        "system": times.children_system + worker["system"],
+        "maxrss": worker["maxrss"] * RSS_UNIT,
+    }
+    if resource is not None:
+        usage["maxrss"] = max(usage["maxrss"], resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * RSS_UNIT)
+    return usage
+
+def snapshot():
+    times = os.times()
+    return {
+        "wall": time.perf_counter(),
+        "user": times.user,
+        "system": times.system,
+        "peak_rss": peak_rss(),
+        "io": io_counters(),
+        "children": children(),
+    }
+
+def difference(before, after):
+    """What happened between two snapshots. Values that can't be measured on this platform are None."""
+    result = {
+        "wall": after["wall"] - before["wall"],
+        "user": after["user"] - before["user"],
+        "system": after["system"] - before["system"],
+        "peak_rss": None,
+        "read_bytes": None,
+        "write_bytes": None,
+        "children_user": after["children"]["user"] - before["children"]["user"],
+        "children_system": after["children"]["system"] - before["children"]["system"],
+        # Peak RSS of children is a high-water mark; it only says something if it moved
+        "children_peak_rss": after["children"]["maxrss"] if after["children"]["maxrss"] > before["children"]["maxrss"] else None,
+    }
+    if before["peak_rss"] is not None and after["peak_rss"] is not None:
+        result["peak_rss"] = after["peak_rss"] - before["peak_rss"]
+    if before["io"] is not None and after["io"] is not None:
+        result["read_bytes"] = after["io"][0] - before["io"][0]
+        result["write_bytes"] = after["io"][1] - before["io"][1]
+    return result
@@ -0,0 +1,186 @@
+import os
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from . import events
+
+# User accounts in SQLite (WAL mode, keyed by username with an index on role). Lookups go through a bounded
+# in-process cache that is dropped whenever PRAGMA data_version reports a commit from another connection
+# (e.g. an isolated package or a batch run), and on every write made here; nothing ever loads the whole table.
+# An existing users.json is imported the first time the database is opened and kept as users.json.bak.
+
+DB_FILE = "users.db"
+LEGACY_FILE = "users.json"
+CACHE_SIZE = 1024  # Accounts kept in memory, most recently used
+
+_connection = None
+_data_version = None
+_cache = OrderedDict()  # username -> (password, role), or None for a name that does not exist
+_lock = threading.RLock()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    role TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS users_role ON users (role);
+"""
+
+def _migrate(connection):
+    """Import users.json into an empty database, then move the file aside so it is not imported twice."""
+    if not os.path.exists(LEGACY_FILE):
+        return
+    if connection.execute("SELECT 1 FROM users LIMIT 1").fetchone() is not None:
+        return
+    try:
+        with open(LEGACY_FILE, "r") as f:
+            users = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return
+    connection.execute("BEGIN")
+    try:
+        connection.executemany(
+            "INSERT OR IGNORE INTO users (username, password, role) VALUES (?, ?, ?)",
+            ((username, details.get("password", ""), details.get("role", "user")) for username, details in users.items())
+        )
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+    try:
+        os.replace(LEGACY_FILE, LEGACY_FILE + ".bak")
+    except FileNotFoundError:
+        pass  # Another process migrated it at the same time
+
+def _connect():
+    global _connection
+    if _connection is None:
+        connection = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        _migrate(connection)
+        _connection = connection
+    return _connection
+
+def _check_version(connection):
+    """Drop the cache if another connection committed since the last look."""
+    global _data_version
+    version = connection.execute("PRAGMA data_version").fetchone()[0]
+    if version != _data_version:
+        _cache.clear()
+        _data_version = version
+
+def _write(sql, parameters, username, action):
+    with _lock:
+        connection = _connect()
+        changed = connection.execute(sql, parameters).rowcount > 0
+        _cache.pop(username, None)
+    if changed:
+        events.publish("user.changed", username=username, action=action)
+    return changed
+
+def ensure():
+    """Create the database (and import users.json) if needed."""
+    with _lock:
+        _connect()
+
+def get(username):
+    """Return {"password": ..., "role": ...} for a user, or None."""
+    with _lock:
+        connection = _connect()
+        _check_version(connection)
+        if username in _cache:
+            _cache.move_to_end(username)
+            row = _cache[username]
+        else:
+            row = connection.execute("SELECT password, role FROM users WHERE username = ?", (username,)).fetchone()
+            _cache[username] = row
+            if len(_cache) > CACHE_SIZE:
+                _cache.popitem(last=False)
+    if row is None:
+        return None
+    return {"password": row[0], "role": row[1]}
+
+def exists(username):
+    return get(username) is not None
+
+def has_users():
+    with _lock:
+        return _connect().execute("SELECT 1 FROM users LIMIT 1").fetchone() is not None
+
+def count(role=None):
+    with _lock:
+        connection = _connect()
+        if role is None:
+            return connection.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+        return connection.execute("SELECT COUNT(*) FROM users WHERE role = ?", (role,)).fetchone()[0]
+
+def iterate(batch=500):
+    """Yield (username, role) in username order, a batch at a time, so listing every account stays flat in memory."""
+    last = ""
+    while True:
+        with _lock:
+            rows = _connect().execute(
+                "SELECT username, role FROM users WHERE username > ? ORDER BY username LIMIT ?", (last, batch)
+            ).fetchall()
+        if not rows:
+            return
+        yield from rows
+        last = rows[-1][0]
+
+def add(username, password, role):
+    """Create an account (password is the stored hash). Returns False if the username is taken."""
+    return _write("INSERT OR IGNORE INTO users (username, password, role) VALUES (?, ?, ?)",
+                  (username, password, role), username, "added")
+
+def delete(username):
+    return _write("DELETE FROM users WHERE username = ?", (username,), username, "deleted")
+
+def set_password(username, password):
+    return _write("UPDATE users SET password = ? WHERE username = ?", (password, username), username, "password")
+
+def set_role(username, role):
+    return _write("UPDATE users SET role = ? WHERE username = ?", (role, username), username, "role")
+
+def close():
+    global _connection, _data_version
+    with _lock:
+        if _connection is not None:
+            _connection.close()
+        _connection = None
+        _data_version = None
+        _cache.clear()
+
+def wipe():
+    """Delete the database and its WAL files."""
+    close()
+    for suffix in ["", "-wal", "-shm"]:
+        try:
+            os.remove(DB_FILE + suffix)
+        except FileNotFoundError:
+            pass
+
+class Users(Mapping):
+    """Read-only username -> {"password", "role"} view of the database, for code written against users.json."""
+
+    def __getitem__(self, username):
+        user = get(username)
+        if user is None:
+            raise KeyError(username)
+        return user
+
+    def __contains__(self, username):
+        return exists(username)
+
+    def __iter__(self):
+        return (username for username, _ in iterate())
+
+    def __len__(self):
+        return count()
+
+    def __bool__(self):
+        return has_users()
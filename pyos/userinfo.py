@@ -1,23 +1,38 @@
 import json
+import threading
 from rich.console import Console
+from . import events, session
 
 # Initialize the console for rich output
 console = Console()
 
-USER_DB = "users.json"
-SESSION_FILE = "current_user.json"
+# The session is read from disk once and kept until a session.changed or user.changed event invalidates it
+_cache = None
+_lock = threading.Lock()
 
 def load_session():
     """Load the current user session from current_user.json."""
     try:
-        with open(SESSION_FILE, 'r') as f:
+        with open(session.SESSION_FILE, 'r') as f:
             return json.load(f)  # Returns the entire session data
     except (FileNotFoundError, KeyError):
         return None
 
+def _invalidate(topic, **data):
+    global _cache
+    with _lock:
+        _cache = None
+
+events.subscribe("session.changed", _invalidate)
+events.subscribe("user.changed", _invalidate)
+
 def userinfo():
     """Return the logged-in user's username and role from current_user.json."""
-    session_data = load_session()
+    global _cache
+    with _lock:
+        if _cache is None:
+            _cache = load_session() or {}
+        session_data = _cache
     if session_data:
         username = session_data.get('username')  # Get the username
         role = session_data.get('role')  # Get the role
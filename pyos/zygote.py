@@ -0,0 +1,70 @@
+import os
+import sys
+import json
+import time
+import runpy
+import signal
+import traceback
+
+# Warm worker for installed packages that need their own process. pyos.launch starts this file as a script
+# (so the pyos package itself is not imported here), it imports the heavy modules once, then forks a child per
+# launch. The child inherits the warm interpreter and the terminal, runs the package's script as __main__
+# and exits; only the fork is paid per launch instead of an interpreter start plus the rich import.
+#
+# Protocol (one JSON object per line): requests {"script": path, "argv": [...]} arrive on the request fd;
+# the worker answers {"ready": true} once warm, then {"started": time} and {"exit": code, "usage": {...}} for
+# every launch, where usage is the child's CPU time and peak RSS from wait4().
+
+PYOS_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WARM_MODULES = ["rich.console", "rich.prompt", "rich.panel", "rich.text", "rich.table", "rich.box"]
+
+def send(status, message):
+    status.write(json.dumps(message) + "\n")
+    status.flush()
+
+def run_child(status, request):
+    """Runs in the forked child: execute the script like `python script` would and exit with its code."""
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    send(status, {"started": time.time()})
+    script = request["script"]
+    sys.argv = [script] + request.get("argv", [])
+    sys.path[0:1] = [os.path.dirname(os.path.abspath(script)), PYOS_ROOT]  # Packages may import pyos
+    code = 0
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
+def serve(request_fd, status_fd):
+    # Ctrl+C belongs to the package being run, not to the worker
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for name in WARM_MODULES:
+        try:
+            __import__(name)
+        except ImportError:
+            pass
+
+    requests = os.fdopen(request_fd, "r")
+    status = os.fdopen(status_fd, "w")
+    send(status, {"ready": True})
+
+    for line in requests:  # Ends when the shell closes the pipe (or exits)
+        request = json.loads(line)
+        pid = os.fork()
+        if pid == 0:
+            requests.close()
+            run_child(status, request)
+        _, wait_status, usage = os.wait4(pid, 0)
+        send(status, {
+            "exit": os.waitstatus_to_exitcode(wait_status),
+            "usage": {"user": usage.ru_utime, "system": usage.ru_stime, "maxrss": usage.ru_maxrss}
+        })
+
+if __name__ == "__main__":
+    serve(int(sys.argv[1]), int(sys.argv[2]))
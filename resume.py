@@ -0,0 +1,90 @@
+import os
+import sys
+import json
+from pathlib import Path
+
+# Only the standard library is used here so main.py can validate the snapshot before anything else is imported.
+
+RESUME_FILE = Path(".OSData") / "resume.json"
+SNAPSHOT_VERSION = 2
+
+# Anything that would change what a cold boot produces. Directories are included so added/removed files are noticed.
+WATCHED_FILES = ["boot-requirements.txt", "requirements.txt", "config.json", "users.db", "main.py", "shell.py", "users.py"]
+WATCHED_DIRS = ["commands", "programs", "pyos", "core"]
+INSTALLED_DIR = "files"
+
+def signature(path):
+    """Return [mtime_ns, size] of a path (a list, so it compares equal after a JSON round trip), or None."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+def collect_paths():
+    paths = list(WATCHED_FILES)
+    for directory in WATCHED_DIRS:
+        paths.append(directory)
+        if os.path.isdir(directory):
+            paths.extend(os.path.join(directory, f) for f in os.listdir(directory) if f.endswith(".py"))
+
+    # Installed marketplace packages (the category folders and each package's data.json)
+    paths.append(INSTALLED_DIR)
+    if os.path.isdir(INSTALLED_DIR):
+        for entry in os.listdir(INSTALLED_DIR):
+            category = os.path.join(INSTALLED_DIR, entry)
+            if entry.startswith("installed_") and os.path.isdir(category):
+                paths.append(category)
+                for root, dirs, files in os.walk(category):
+                    paths.append(root)
+                    if "data.json" in files:
+                        paths.append(os.path.join(root, "data.json"))
+
+    # site-packages and friends: their mtimes change whenever pip installs or removes a distribution.
+    # The pyOS folder itself is skipped, its mtime changes with every session file written.
+    root = os.path.abspath(os.getcwd())
+    paths.extend(entry for entry in sys.path if entry and os.path.isdir(entry) and os.path.abspath(entry) != root)
+    return sorted(set(paths))
+
+def write_snapshot(state):
+    """Store the resume state together with the stat signatures it is valid for."""
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "python": [sys.executable, sys.version],
+        "signatures": {path: signature(path) for path in collect_paths()},
+        "state": state,
+    }
+    RESUME_FILE.parent.mkdir(exist_ok=True)
+    temp_file = RESUME_FILE.with_suffix(".tmp")
+    with open(temp_file, "w") as f:
+        json.dump(snapshot, f)
+    os.replace(temp_file, RESUME_FILE)
+
+def consume_snapshot():
+    """
+    Return the saved resume state if nothing it depends on changed (one stat per path), otherwise None.
+    The snapshot is removed either way, so it is only ever used for the boot right after a clean shutdown.
+    """
+    try:
+        with open(RESUME_FILE, "r") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):  # json.JSONDecodeError is a ValueError
+        return None
+    finally:
+        invalidate()
+
+    if not isinstance(snapshot, dict):
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("python") != [sys.executable, sys.version]:
+        return None
+    for path, expected in snapshot["signatures"].items():
+        if signature(path) != expected:
+            return None
+    return snapshot["state"]
+
+def invalidate():
+    """Remove the snapshot so the next start is a cold boot."""
+    try:
+        RESUME_FILE.unlink()
+    except FileNotFoundError:
+        pass
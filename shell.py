@@ -1,10 +1,13 @@
 import os
-import importlib.util
+import inspect
 import time
 from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt
+from rich.live import Live
+from rich.panel import Panel
 import json
+from pyos import registry, manifest, dispatch, session, pipeline, completion, hotreload, launch, history, jobs, keys, stats, usage, events
 try:
     import readline
 except ImportError:
@@ -13,268 +16,574 @@ except ImportError:
 # Initialize the console for rich output
 console = Console()
 
+READLINE_HISTORY = 1000  # Most recent commands offered on the up arrow
+
 # Metadata dictionary for commands
 commands_config = {}
+available_commands = {}
+available_programs = {}
+
 
-base_directory = os.path.abspath("files")  # Base directory is '/files'
-current_directory_file = "current_directory.txt"  # File containing the current directory
+# data.json path -> command name, so a reload can re-read or drop a single package
+package_sources = {}
+
+def make_execute_func(script_path, isolated=False):
+    def execute():
+        if os.path.exists(script_path):
+            launch.run_package(script_path, isolated)
+        else:
+            console.print(f"[bold red]Run script not found:[/bold red] {script_path}")
+    return execute
+
+def load_package(data_json_path):
+    """Reads one installed package's data.json. Returns (command name, entry) or None if it can't be run."""
+    try:
+        with open(data_json_path, "r") as f:
+            data = json.load(f)
+        command_name = data.get("command")
+        if command_name:
+            description = data.get("description", "No description available.")
+            run_script = data.get("scripts", {}).get("run")
+            if run_script:
+                run_script_path = os.path.join(os.path.dirname(data_json_path), run_script)
+                return command_name, {
+                    "module": type("DynamicModule", (), {"execute": make_execute_func(run_script_path, data.get("isolated", False))}),
+                    "description": description,
+                    "aliases": data.get("alias", []),
+                    "script": run_script_path,
+                    "isolated": data.get("isolated", False)
+                }
+            console.print(f"[bold yellow]Warning:[/bold yellow] 'run' script not found in {data_json_path}, skipping.")
+    except Exception as e:
+        console.print(f"[bold red]Error loading {data_json_path}: {e}[/bold red]")
+    return None
 
 def load_installed_packages(base_path="files"):
     """Load commands from all data.json files under 'files/installed_*' recursively."""
     installed = {}
-
-    # Loop over directories like files/installed_developer, files/installed_games, etc.
-    for entry in os.listdir(base_path):
-        full_dir_path = os.path.join(base_path, entry)
-        if os.path.isdir(full_dir_path) and entry.startswith("installed_"):
-            for root, dirs, files in os.walk(full_dir_path):
-                if "data.json" in files:
-                    data_json_path = os.path.join(root, "data.json")
-                    try:
-                        with open(data_json_path, "r") as f:
-                            data = json.load(f)
-                        command_name = data.get("command")
-                        if command_name:
-                            description = data.get("description", "No description available.")
-                            run_script = data.get("scripts", {}).get("run")
-                            if run_script:
-                                run_script_path = os.path.join(root, run_script)
-
-                                def make_execute_func(script_path):
-                                    def execute():
-                                        if os.path.exists(script_path):
-                                            os.system(f'python "{script_path}"')
-                                        else:
-                                            console.print(f"[bold red]Run script not found:[/bold red] {script_path}")
-                                    return execute
-
-                                installed[command_name] = {
-                                    "module": type("DynamicModule", (), {"execute": make_execute_func(run_script_path)}),
-                                    "description": description,
-                                    "aliases": data.get("alias", [])
-                                }
-                            else:
-                                console.print(f"[bold yellow]Warning:[/bold yellow] 'run' script not found in {data_json_path}, skipping.")
-                    except Exception as e:
-                        console.print(f"[bold red]Error loading {data_json_path}: {e}[/bold red]")
+    package_sources.clear()
+
+    # Covers directories like files/installed_developer, files/installed_games, etc.
+    for data_json_path in hotreload.package_files(base_path):
+        loaded = load_package(data_json_path)
+        if loaded:
+            command_name, entry = loaded
+            installed[command_name] = entry
+            package_sources[data_json_path] = command_name
     return installed
 
 
 def get_relative_path():
-    """Returns the shell path from 'current_directory.txt' relative to '/files'."""
-    try:
-        with open(current_directory_file, "r") as file:
-            current_directory = file.read().strip()
-
-        # Ensure that the path is relative to '/files'
-        if current_directory.startswith(base_directory):
-            relative_path = os.path.relpath(current_directory, base_directory)
-            return f"/{relative_path}" if relative_path != "." else ""
-        else:
-            return "[bold red]Error:[/bold red] Current directory is outside of '/files'."
-    except FileNotFoundError:
-        return "[bold red]Error:[/bold red] current_directory.txt not found."
-
-def load_module(file_path, module_name):
-    """Dynamically loads a Python module from a given file path."""
-    try:
-        if os.path.exists(file_path):
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            return module
-        else:
-            console.print(f"[bold red]Error:[/bold red] File '{file_path}' not found.")
-            return None
-    except Exception as e:
-        console.print(f"[bold red]Error loading '{module_name}': {e}[/bold red]")
-        return None
+    """Returns the shell path relative to '/files' from the in-memory session (no file I/O)."""
+    if session.is_inside_base(session.get_cwd()):
+        return session.relative_path()
+    return "[bold red]Error:[/bold red] Current directory is outside of '/files'."
 
 def list_available(directory):
     """Returns a list of Python files (without extensions) in a given directory."""
-    if os.path.exists(directory):
-        return [f[:-3] for f in os.listdir(directory) if f.endswith(".py")]
-    return []
+    return registry.list_available(directory)
+
+def report_load_error(module_name, error):
+    console.print(f"[bold red]Error loading '{module_name}': {error}[/bold red]")
 
 def load_all_modules(directory):
-    """Loads all Python modules from a specified directory."""
+    """
+    Builds the command/program table from the manifest (config read with ast, cached by mtime/size).
+    Modules are only imported on first use; files whose config is not a literal are imported now.
+    """
     available = {}
-    for file_name in list_available(directory):
-        module = load_module(os.path.join(directory, file_name + ".py"), file_name)
-        if module and hasattr(module, "config"):
-            available[file_name] = {
-                "module": module,
-                "description": module.config.get("description", "No description available."),
-                "aliases": module.config.get("alias", [])
-            }
+    for file_name, entry in manifest.scan(directory).items():
+        if entry["error"]:
+            report_load_error(file_name, entry["error"])
+            continue
+        module_config = entry["config"]
+        module = registry.lazy(directory, file_name)
+        if module_config is None:
+            try:
+                module = registry.load(directory, file_name)
+            except Exception as e:
+                report_load_error(file_name, e)
+                continue
+            module_config = getattr(module, "config", None)
+            if not isinstance(module_config, dict):
+                continue
+        available[file_name] = {
+            "module": module,
+            "description": module_config.get("description", "No description available."),
+            "aliases": module_config.get("alias", [])
+        }
     return available
 
-def reload_all():
+def module_name(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+def apply_source_changes(kind, changes):
+    """Re-imports modified modules that were already imported and forgets deleted ones, then rebuilds the table."""
+    _, modified, deleted = changes
+    for path in modified:
+        name = module_name(path)
+        if registry.is_loaded(kind, name):
+            try:
+                registry.reload(kind, name)
+            except Exception as e:
+                report_load_error(name, e)
+    for path in deleted:
+        registry.forget(kind, module_name(path))
+    return load_all_modules(kind)  # Unchanged files are served from the manifest cache
+
+def apply_package_changes(packages, changes):
+    """Re-reads the data.json files that were added or modified and drops deleted packages."""
+    added, modified, deleted = changes
+    packages = dict(packages)
+    for path in modified + deleted:
+        packages.pop(package_sources.pop(path, None), None)
+    for path in added + modified:
+        loaded = load_package(path)
+        if loaded:
+            command_name, entry = loaded
+            packages[command_name] = entry
+            package_sources[path] = command_name
+    return packages
+
+def describe_changes(changes):
+    parts = []
+    for group, (added, modified, deleted) in changes.items():
+        for label, paths in [("added", added), ("reloaded", modified), ("removed", deleted)]:
+            if paths:
+                names = ", ".join(module_name(path) if group != "packages" else os.path.basename(os.path.dirname(path)) for path in paths)
+                parts.append(f"{label} {group} {names}")
+    return "; ".join(parts)
+
+# Per-source tables behind the dispatch index (available_programs merges programs and packages for the help menu)
+tables = {"commands": {}, "programs": {}, "packages": {}}
+
+def index_tables(commands, programs, packages):
+    """Updates the dispatch index with the current tables and rebuilds the merged program list."""
     global available_commands, available_programs
-
-    console.print("[bold yellow]Reloading commands and programs...[/bold yellow]")
-
-    # Reload commands and programs from disk (fresh imports)
-    available_commands = load_all_modules("commands")
-
-    installed_programs = load_installed_packages("files")
-    available_programs = load_all_modules("programs")
-    available_programs.update(installed_programs)
-
-    console.print("[bold green]Reload complete![/bold green]")
-
+    for source, table in [("commands", commands), ("programs", programs), ("packages", packages)]:
+        tables[source] = table
+        dispatch.update(source, table)
+    available_commands = commands
+    available_programs = dict(programs)
+    available_programs.update(packages)
+    completion.rebuild()
+
+def report_conflicts():
+    """Prints every name or alias that is claimed by more than one command, program or package."""
+    for name, claims in sorted(dispatch.conflicts().items()):
+        owners = ", ".join(f"{source[:-1]} '{entry}'" + (" (alias)" if is_alias else "") for source, entry, is_alias in claims)
+        console.print(f"[bold yellow]Warning:[/bold yellow] '{name}' is claimed by {owners}.")
+
+def lookup(name, namespace):
+    """Resolves a typed name or alias through the dispatch index. Returns (entry name, entry) or (None, None)."""
+    resolved = dispatch.resolve(name, namespace)
+    if resolved is None:
+        return None, None
+    source, entry_name = resolved
+    return entry_name, tables[source].get(entry_name)
+
+def resolve_command_module(name):
+    matched_command, command = lookup(name, "commands")
+    return command["module"] if matched_command else None
+
+def run_pipeline(cmd):
+    """Runs a command line with pipes and/or redirection, streaming lines between the commands. Returns success."""
+    try:
+        stages, redirect = pipeline.parse(cmd)
+        # The stages stream into each other, so their time can't be split; all pipelines share one entry
+        with stats.measure("pipeline"):
+            pipeline.run(stages, redirect, resolve_command_module,
+                         write=lambda line: console.print(line, markup=False, highlight=False))
+    except (pipeline.PipelineError, ValueError, OSError) as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        return False
+    return True
+
+def reload_all(automatic=False):
+    """Reloads only the commands, programs and packages whose files changed since the last reload."""
+    start = time.perf_counter()
+    changes = hotreload.collect()
+    if not changes:
+        if not automatic:
+            console.print("[bold green]Nothing changed.[/bold green]")
+        return
+
+    commands, programs, packages = tables["commands"], tables["programs"], tables["packages"]
+    if "commands" in changes:
+        commands = apply_source_changes("commands", changes["commands"])
+    if "programs" in changes:
+        programs = apply_source_changes("programs", changes["programs"])
+    if "packages" in changes:
+        packages = apply_package_changes(packages, changes["packages"])
+    index_tables(commands, programs, packages)
+    report_conflicts()
+
+    elapsed = (time.perf_counter() - start) * 1000
+    console.print(f"[bold green]Reload complete:[/bold green] {describe_changes(changes)} [dim]({elapsed:.1f}ms)[/dim]")
+
+def auto_reload_enabled():
+    try:
+        with open("config.json", "r") as f:
+            return json.load(f).get("auto_reload", "False") == "True"
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+
+
+def on_package_changed(topic, **data):
+    """
+    A package was installed or removed while the shell runs. The event may come from a running command or a
+    job thread, so the reload is only queued; the shell applies it before the next command.
+    """
+    hotreload.request_reload()
+
+def on_config_changed(topic, **data):
+    """Start or stop the reload watcher when auto_reload is switched in config.json."""
+    if auto_reload_enabled():
+        hotreload.start_watcher()
+    else:
+        hotreload.stop_watcher()
+
+def init_shell():
+    """Builds the command/program tables and the dispatch index (shared by the interactive shell and batch mode)."""
+    hotreload.collect()  # Baseline for incremental reloads
+    index_tables(load_all_modules("commands"), load_all_modules("programs"), load_installed_packages("files"))
+    report_conflicts()
+    events.subscribe("package.*", on_package_changed)
+
+def execute_line(cmd):
+    """
+    Runs one shell line. Returns "exit", "ok", "not_found" or "error" (the line was rejected).
+    Exceptions raised by commands are not caught here.
+    """
+    if cmd.endswith("&"):
+        return start_background(cmd[:-1].strip())
+    elif cmd == "exit":
+        console.print("[bold green]Logging out...[/bold green]")
+        return "exit"
+    elif cmd.startswith("time "):
+        return time_command(cmd[5:].strip())
+    elif cmd == "help":
+        show_help(available_commands, available_programs)
+    elif cmd == "reload":
+        reload_all()
+    elif cmd.startswith("cd "):
+        args = cmd[3:].strip()
+        if "cd" in available_commands:
+            with stats.measure("cd"):
+                available_commands["cd"]["module"].execute(args)
+        else:
+            console.print("[bold red]cd command not found![/bold red]")
+            return "not_found"
+    elif cmd.startswith("run "):
+        program_name, _, args = cmd[4:].strip().partition(" ")
+        matched_program, program = lookup(program_name, "programs")
+
+        if matched_program:
+            readline.parse_and_bind("set editing-mode emacs")
+            with stats.measure(matched_program):
+                if args.strip() and pipeline.accepts_args(program["module"]):
+                    program["module"].execute(args.strip())
+                else:
+                    program["module"].execute()
+            readline.parse_and_bind("set editing-mode vi")
+        else:
+            console.print(f"[bold red]Program '{program_name}' not found.[/bold red]")
+            return "not_found"
+    elif not pipeline.is_simple(cmd):
+        if not run_pipeline(cmd):
+            return "error"
+    else:
+        # Anything after the command name is handed to execute() as a single argument string
+        name, _, args = cmd.partition(" ")
+        matched_command, command = lookup(name, "commands")
+
+        if matched_command:
+            module = command["module"]
+            if args.strip() and "args" not in inspect.signature(module.execute).parameters:
+                console.print(f"[bold red]{matched_command} does not take any arguments.[/bold red]")
+                return "error"
+            with stats.measure(matched_command):
+                if args.strip():
+                    module.execute(args.strip())
+                else:
+                    module.execute()
+        else:
+            console.print("[bold red]Command not found.[/bold red] Type 'help' for a list of commands.")
+            return "not_found"
+    return "ok"
+
+def format_size(value):
+    if value is None:
+        return "n/a"
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    for unit in ["B", "KB", "MB", "GB"]:
+        if value < 1024 or unit == "GB":
+            return f"{sign}{value:.0f}{unit}" if unit == "B" else f"{sign}{value:.1f}{unit}"
+        value /= 1024
+
+def time_command(cmd):
+    """The `time` builtin: runs a line and reports wall/CPU time, peak RSS growth, I/O and child process usage."""
+    if not cmd:
+        console.print("[bold red]Usage:[/bold red] time <command>")
+        return "error"
+
+    before = usage.snapshot()
+    try:
+        status = execute_line(cmd)
+    finally:
+        used = usage.difference(before, usage.snapshot())
+
+        table = Table(title=f"time: {cmd}", show_header=False, box=None, padding=(0, 2))
+        table.add_column(style="bold cyan")
+        table.add_column(justify="right")
+        table.add_row("real", f"{used['wall']:.3f}s")
+        table.add_row("user", f"{used['user']:.3f}s")
+        table.add_row("sys", f"{used['system']:.3f}s")
+        table.add_row("peak RSS Δ", format_size(used["peak_rss"]))
+        table.add_row("read", format_size(used["read_bytes"]))
+        table.add_row("written", format_size(used["write_bytes"]))
+        if used["children_user"] or used["children_system"] or used["children_peak_rss"]:
+            table.add_row("child user", f"{used['children_user']:.3f}s")
+            table.add_row("child sys", f"{used['children_system']:.3f}s")
+            table.add_row("child peak RSS", format_size(used["children_peak_rss"]))
+        console.print(table)
+    return status
+
+FOREGROUND_ONLY = ["exit", "help", "reload", "fg"]
+
+def start_background(cmd):
+    """Starts a line as a background job: installed packages in a child process, everything else in a thread."""
+    name = cmd.split(" ", 1)[0]
+    if not cmd or name in FOREGROUND_ONLY:
+        console.print(f"[bold red]'{cmd}' can't run in the background.[/bold red]")
+        return "error"
+
+    package = None
+    if name == "run":
+        resolved = dispatch.resolve(cmd[4:].strip().split(" ", 1)[0], "programs")
+        if resolved and resolved[0] == "packages":
+            package = tables["packages"].get(resolved[1])
+
+    if package is not None:
+        session.flush()  # The child reads current_directory.txt
+        job = jobs.start_process(cmd, launch.child_command(package["script"], package.get("isolated", False)))
+    else:
+        job = jobs.start_thread(cmd, lambda: execute_line(cmd))
+    console.print(f"[bold cyan][{job.number}][/bold cyan] started: {cmd}", highlight=False)
+    return "ok"
+
+def report_finished_jobs():
+    for job in jobs.take_finished():
+        console.print(f"[bold cyan][{job.number}][/bold cyan] {job.status} ({job.elapsed:.1f}s): {job.command}", highlight=False)
 
 def start_shell(username):
-    global available_commands, available_programs
-
-    available_commands = load_all_modules("commands")
-    available_programs = load_all_modules("programs")
-    installed_programs = load_installed_packages("files")
-    available_programs.update(installed_programs)
+    init_shell()
 
+    if auto_reload_enabled():
+        hotreload.start_watcher()
+    events.subscribe("config.changed", on_config_changed)
+    completion.install(readline)
+    launch.prestart()
     readline.parse_and_bind("tab: complete")
     readline.parse_and_bind("set editing-mode vi")
 
+    # Only the tail of the user's history is read now; the history command loads the rest on first search
+    user_history = history.open_history(username)
+    readline.clear_history()
+    for previous in user_history.tail(READLINE_HISTORY):
+        readline.add_history(previous)
+
     while True:
+        report_finished_jobs()
         relative_path = get_relative_path()
         prompt = f"{username}@pyOS{relative_path}> "
 
         try:
             cmd = input(prompt).strip()
         except (KeyboardInterrupt, EOFError):
+            if jobs.shutdown_requested():
+                raise KeyboardInterrupt  # A background job asked for a shutdown (pyos.shutdown)
             console.print("\n[bold yellow]Exiting shell...[/bold yellow]")
             break
 
-        if cmd == "exit":
-            console.print("[bold green]Logging out...[/bold green]")
-            break
-        elif cmd == "help":
-            show_help(available_commands, available_programs)
-        elif cmd == "reload":
-            reload_all()
-        elif cmd.startswith("cd "):
-            args = cmd[3:].strip()
-            if "cd" in available_commands:
-                available_commands["cd"]["module"].execute(args)
-            else:
-                console.print("[bold red]cd command not found![/bold red]")
-        elif cmd.startswith("run "):
-            program_name = cmd[4:].strip()
-            matched_program = next((name for name, info in available_programs.items()
-                                    if program_name == name or program_name in info["aliases"]), None)
-
-            if matched_program:
-                readline.parse_and_bind("set editing-mode emacs")
-                available_programs[matched_program]["module"].execute()
-                readline.parse_and_bind("set editing-mode vi")
-            else:
-                console.print(f"[bold red]Program '{program_name}' not found.[/bold red]")
-        else:
-            matched_command = next((name for name, info in available_commands.items()
-                                    if cmd == name or cmd in info["aliases"]), None)
+        if cmd:
+            user_history.append(cmd)
 
-            if matched_command:
-                available_commands[matched_command]["module"].execute()
-            else:
-                console.print("[bold red]Command not found.[/bold red] Type 'help' for a list of commands.")
+        if hotreload.has_changes():
+            reload_all(automatic=True)
 
+        if execute_line(cmd) == "exit":
+            break
 
-def draw_help_menu(selected_index, mode, available_commands, available_programs):
-    """Generates and displays the help menu."""
-    console.clear()
-    table = Table(title=f"[bold cyan]Help Menu ({mode.capitalize()})[/bold cyan]", expand=True)
-    table.add_column("Name", style="bold")
-    table.add_column("Description", style="yellow")
-    table.add_column("Aliases", justify="right", style="blue")
-
-    data = available_commands if mode == "commands" else available_programs
-    items = list(data.items())
-
-    for i, (name, info) in enumerate(items):
-        highlight = "[bold green]→[/bold green] " if i == selected_index else "   "
-        aliases = ", ".join(info['aliases']) if info['aliases'] else "None"
-        table.add_row(f"{highlight}{name}", info['description'], aliases)
 
-    table.add_row("\n[bold cyan]Use [W/S] to navigate, [Enter] to select, [T] for Programs, [Q] to quit[/bold cyan]", "", "")
-    console.print(table)
-    
-def show_help(available_commands, available_programs):
-    """Interactive help menu following the correct structure."""
-    mode = None  # No mode selected initially
-    selected_index = 0
-    options = ["Programs", "Commands"]
+HELP_WINDOW = 15  # Rows drawn at once; longer lists scroll inside a fixed-height table
 
-    while True:
-        console.clear()
-
-        if mode is None:
-            # TITLE: Choose between Programs or Commands
-            console.print("[bold cyan]HELP MENU[/bold cyan]\n")
-            for i, option in enumerate(options):
-                prefix = "[bold green]→[/bold green] " if i == selected_index else "   "
-                console.print(f"{prefix}{option}")
-            key = console.input("\n[bold cyan]Use [W/S] to move, [Enter] to select, [Q] to quit: [/bold cyan]").strip().lower()
-
-            if key in ["w", "up"]:
-                selected_index = (selected_index - 1) % len(options)
-            elif key in ["s", "down"]:
-                selected_index = (selected_index + 1) % len(options)
-            elif key == "":
-                mode = options[selected_index].lower()  # Set mode to 'programs' or 'commands'
-                selected_index = 0  # Reset selection
-            elif key == "q":
-                console.print("[bold yellow]Exiting Help Menu...[/bold yellow]")
-                return
+def fuzzy_score(query, text):
+    """Lower is better. None when the characters of the query don't appear in order in the text."""
+    text = text.lower()
+    score = 0
+    position = -1
+    for char in query:
+        found = text.find(char, position + 1)
+        if found == -1:
+            return None
+        score += found - position - 1  # Characters skipped since the previous match
+        position = found
+    return score
+
+class HelpBrowser:
+    """State of the interactive help menu: the list shown, the filter, the selection and the visible window."""
+
+    def __init__(self, available_commands, available_programs):
+        self.sources = {"commands": available_commands, "programs": available_programs}
+        self.mode = "commands"
+        self.query = ""
+        self.selected = 0
+        self.offset = 0
+        self.details = None  # Name of the entry whose details are open
+        self.filtered = {}  # (mode, query) -> matching names, best first
+        self.matches = self.filter()
+
+    def filter(self):
+        key = (self.mode, self.query)
+        if key not in self.filtered:
+            data = self.sources[self.mode]
+            if not self.query:
+                self.filtered[key] = list(data)
+            else:
+                # Typing one more character can only narrow the previous result, so start from it
+                names = self.filtered.get((self.mode, self.query[:-1]), data)
+                query = self.query.lower()
+                scored = []
+                for name in names:
+                    scores = [fuzzy_score(query, text) for text in [name, *data[name]["aliases"]]]
+                    scores = [score for score in scores if score is not None]
+                    if scores:
+                        scored.append((min(scores), name))
+                self.filtered[key] = [name for _, name in sorted(scored)]
+        return self.filtered[key]
+
+    def refilter(self):
+        self.matches = self.filter()
+        self.selected = 0
+        self.offset = 0
+
+    def move(self, delta):
+        if not self.matches:
+            return
+        self.selected = max(0, min(len(self.matches) - 1, self.selected + delta))
+        if self.selected < self.offset:
+            self.offset = self.selected
+        elif self.selected >= self.offset + HELP_WINDOW:
+            self.offset = self.selected - HELP_WINDOW + 1
+
+    def entry(self):
+        return self.sources[self.mode][self.details]
+
+    def handle(self, key):
+        """Applies a keypress. Returns "quit", "run" or None."""
+        if self.details is not None:
+            if key in ("r", "R"):
+                return "run"
+            if key in ("b", "B", "esc", "backspace", "left"):
+                self.details = None
+            return None
 
-        else:
-            # SELECT COMMAND OR PROGRAM NAME
-            console.clear()
-            data = available_programs if mode == "programs" else available_commands
-            items = list(data.keys())
-
-            if not items:
-                console.print(f"[bold red]No {mode} available.[/bold red]")
-                console.input("\n[bold cyan]Press Enter to go back...[/bold cyan]")
-                mode = None
-                continue
+        if key == "esc":
+            if not self.query:
+                return "quit"
+            self.query = ""
+            self.refilter()
+        elif key == "up":
+            self.move(-1)
+        elif key == "down":
+            self.move(1)
+        elif key in ("enter", "right"):
+            if self.matches:
+                self.details = self.matches[self.selected]
+        elif key == "tab":
+            self.mode = "programs" if self.mode == "commands" else "commands"
+            self.query = ""
+            self.refilter()
+        elif key == "backspace":
+            if self.query:
+                self.query = self.query[:-1]
+                self.refilter()
+        elif len(key) == 1 and key.isprintable():
+            self.query += key
+            self.refilter()
+        return None
 
-            console.print(f"[bold cyan]Select a {mode[:-1].capitalize()}[/bold cyan]\n")
-            for i, name in enumerate(items):
-                prefix = "[bold green]→[/bold green] " if i == selected_index else "   "
-                console.print(f"{prefix}{name}")
-            key = console.input("\n[bold cyan]Use [W/S] to move, [Enter] to select, [B] to go back: [/bold cyan]").strip().lower()
-
-            if key in ["w", "up"]:
-                selected_index = (selected_index - 1) % len(items)
-            elif key in ["s", "down"]:
-                selected_index = (selected_index + 1) % len(items)
-            elif key == "":
-                selected_item = items[selected_index]
-                if show_command_info(selected_item, mode, available_commands, available_programs):
-                    return  # If the user runs a command, exit help completely
-                selected_index = 0  # Reset selection after returning
-            elif key == "b":
-                mode = None
-                selected_index = 0  # Reset selection
-
-def show_command_info(item_name, mode, available_commands, available_programs):
-    """Displays command or program details with options to run or go back."""
-    console.clear()
-    data = available_programs if mode == "programs" else available_commands
-    info = data.get(item_name, {})
-
-    description = info.get("description", "No description available.")
-    aliases = ", ".join(info.get("aliases", [])) if info.get("aliases") else "None"
-
-    console.print(f"[bold cyan]{item_name} Information[/bold cyan]\n")
-    console.print(f"[bold]Description:[/bold] {description}")
-    console.print(f"[bold]Aliases:[/bold] {aliases}")
+    def render(self):
+        if self.details is not None:
+            info = self.entry()
+            aliases = ", ".join(info["aliases"]) if info["aliases"] else "None"
+            return Panel(
+                f"[bold]Description:[/bold] {info['description']}\n[bold]Aliases:[/bold] {aliases}\n\n"
+                "[bold cyan][R] Run, [B] Back[/bold cyan]",
+                title=f"[bold cyan]{self.details} Information[/bold cyan]", expand=False
+            )
+
+        data = self.sources[self.mode]
+        table = Table(
+            title=f"[bold cyan]Help Menu ({self.mode.capitalize()})[/bold cyan]",
+            caption=f"Filter: [bold]{self.query}[/bold]▏ {len(self.matches)} of {len(data)} · "
+                    "[bold cyan]↑/↓[/bold cyan] move · [bold cyan]Enter[/bold cyan] details · "
+                    "[bold cyan]Tab[/bold cyan] commands/programs · [bold cyan]Esc[/bold cyan] quit",
+            expand=True
+        )
+        table.add_column("Name", style="bold")
+        table.add_column("Description", style="yellow")
+        table.add_column("Aliases", justify="right", style="blue")
+
+        # Only the visible window is rendered, so a keypress costs the same however long the list is
+        window = self.matches[self.offset:self.offset + HELP_WINDOW]
+        for i, name in enumerate(window, start=self.offset):
+            info = data[name]
+            highlight = "[bold green]→[/bold green] " if i == self.selected else "   "
+            aliases = ", ".join(info["aliases"]) if info["aliases"] else "None"
+            table.add_row(f"{highlight}{name}", info["description"], aliases)
+        for _ in range(HELP_WINDOW - len(window)):
+            table.add_row("", "", "")  # Fixed height, so the live view never jumps
+        return table
+
+def print_help(available_commands, available_programs):
+    """Plain listing for when keys can't be read one at a time (e.g. batch mode)."""
+    for mode, data in [("commands", available_commands), ("programs", available_programs)]:
+        table = Table(title=f"{mode.capitalize()}", expand=True)
+        table.add_column("Name", style="bold")
+        table.add_column("Description", style="yellow")
+        table.add_column("Aliases", justify="right", style="blue")
+        for name, info in data.items():
+            table.add_row(name, info["description"], ", ".join(info["aliases"]) if info["aliases"] else "None")
+        console.print(table)
 
-    while True:
-        key = console.input("\n[bold cyan][R] Run, [B] Back: [/bold cyan]").strip().lower()
-        if key == "r":
-            console.print(f"[bold green]Running {item_name}...[/bold green]\n")
+def show_help(available_commands, available_programs):
+    """Interactive help menu: arrow keys move, typing filters, Enter shows details and R runs the entry."""
+    if not keys.is_interactive():
+        print_help(available_commands, available_programs)
+        return
+
+    browser = HelpBrowser(available_commands, available_programs)
+    to_run = None
+    with Live(browser.render(), console=console, auto_refresh=False, transient=True) as live:
+        while True:
+            try:
+                action = browser.handle(keys.read_key())
+            except KeyboardInterrupt:
+                break
+            if action == "quit":
+                break
+            if action == "run":
+                to_run = browser.details, browser.entry()
+                break
+            live.update(browser.render(), refresh=True)
+
+    if to_run:
+        name, info = to_run
+        console.print(f"[bold green]Running {name}...[/bold green]\n")
+        with stats.measure(name):
             info["module"].execute()  # Run the command or program
-            return True  # Exit help completely after running
-        elif key == "b":
-            return False  # Go back to the previous menu
+    else:
+        console.print("[bold yellow]Exiting Help Menu...[/bold yellow]")
@@ -0,0 +1,17 @@
+import os
+import sys
+import pytest
+
+# Import the shell's modules the way main.py does: from the pyOS folder, with it as the working directory
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+@pytest.fixture(autouse=True)
+def isolated_stats(tmp_path, monkeypatch):
+    """Keep the latency statistics recorded by the shell out of the checkout's .OSData."""
+    from pyos import stats
+    monkeypatch.setattr(stats, "STATS_FILE", os.path.join(str(tmp_path), "stats", "latency.json"))
+    monkeypatch.setattr(stats, "_commands", None)
+    yield
+    stats.save()  # While the path is still patched, so the save at exit has nothing left to write
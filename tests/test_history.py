@@ -0,0 +1,31 @@
+from pyos import history
+
+
+def make_history(tmp_path, monkeypatch, max_entries):
+    monkeypatch.setattr(history, "HISTORY_DIRECTORY", str(tmp_path))
+    monkeypatch.setattr(history, "MAX_ENTRIES", max_entries)
+    return history.History("tester")
+
+
+def test_limit_zero_returns_nothing(tmp_path, monkeypatch):
+    store = make_history(tmp_path, monkeypatch, 10)
+    for command in ["ls", "cd docs", "ls"]:
+        store.append(command)
+    assert store.search(limit=0) == []
+    assert store.search("ls", limit=0) == []
+    assert len(store.search(limit=None)) == 3
+
+
+def test_evicted_commands_leave_the_index(tmp_path, monkeypatch):
+    store = make_history(tmp_path, monkeypatch, 3)
+    store.load()
+    for command in ["calendar", "ls", "ls", "cd docs"]:
+        store.append(command)
+    assert store.search("calendar") == []
+    assert store.search("cal", prefix=True) == []
+    assert "calendar" not in store.sorted_commands
+    assert not any("calendar" in commands for commands in store.grams.values())
+    assert store.search("ls") == [(1, "ls"), (2, "ls")]
+
+    store.append("pwd")  # Evicts one of the two "ls" entries, which must stay searchable
+    assert store.search("ls", prefix=True) == [(1, "ls")]
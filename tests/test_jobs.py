@@ -0,0 +1,37 @@
+import os
+import sys
+import subprocess
+import pytest
+
+pty = pytest.importorskip("pty")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# input() only reads the terminal directly when stdin is a real tty, so the job runs under a pseudo-terminal
+JOB_SCRIPT = """
+import sys
+from pyos import jobs
+
+def ask():
+    try:
+        input("name? ")
+    except EOFError:
+        return "ok"
+    return "failed"
+
+job = jobs.start_thread("ask", ask)
+job.thread.join(5)
+sys.stderr.write(job.status + "|" + "".join(job.lines()))
+"""
+
+
+def test_input_in_a_job_reads_end_of_file():
+    master, slave = pty.openpty()
+    try:
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get("PYTHONPATH")])))
+        result = subprocess.run([sys.executable, "-c", JOB_SCRIPT], stdin=slave, stdout=slave,
+                                stderr=subprocess.PIPE, text=True, cwd=ROOT, env=env, timeout=30)
+    finally:
+        os.close(master)
+        os.close(slave)
+    assert result.stderr == "done|name? "
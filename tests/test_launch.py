@@ -0,0 +1,24 @@
+import subprocess
+from pyos import launch
+
+
+def write_package(tmp_path, source):
+    package = tmp_path / "demo"
+    package.mkdir()
+    script = package / "run.py"
+    script.write_text(source)
+    return str(script)
+
+
+def test_child_command_calls_execute_with_pyos_importable(tmp_path):
+    script = write_package(tmp_path, "import pyos.session\n\ndef execute():\n    print('executed', __name__)\n")
+    result = subprocess.run(launch.child_command(script), capture_output=True, text=True, cwd=tmp_path)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "executed installed_package_demo\n"
+
+
+def test_child_command_runs_scripts_without_execute_as_main(tmp_path):
+    script = write_package(tmp_path, "import sys\nprint(__name__, sys.argv[1:])\nsys.exit(3)\n")
+    result = subprocess.run(launch.child_command(script, argv=["a"]), capture_output=True, text=True, cwd=tmp_path)
+    assert result.returncode == 3
+    assert result.stdout == "__main__ ['a']\n"
@@ -0,0 +1,43 @@
+import types
+import pytest
+import shell
+from pyos import pipeline
+from commands import grep
+
+def fake_command(*lines):
+    return types.SimpleNamespace(stream=lambda argv, stdin: iter(lines))
+
+def test_operators_are_parsed():
+    stages, redirect = pipeline.parse("ls | grep py > out.txt")
+    assert stages == [("ls", []), ("grep", ["py"])]
+    assert redirect == ("w", "out.txt")
+    assert pipeline.parse("ls >> out.txt")[1] == ("a", "out.txt")
+
+def test_quoted_redirect_is_an_argument():
+    assert pipeline.is_simple("grep '>' notes.txt")
+    assert pipeline.parse("grep '>' notes.txt") == ([("grep", [">", "notes.txt"])], None)
+    assert pipeline.parse('grep ">>" notes.txt') == ([("grep", [">>", "notes.txt"])], None)
+
+def test_quoted_pipe_is_an_argument():
+    assert pipeline.is_simple("echo 'a|b'")
+    assert pipeline.is_simple("echo a\\|b")
+    assert pipeline.parse("echo 'a|b' | grep a") == ([("echo", ["a|b"]), ("grep", ["a"])], None)
+
+def test_unquoted_operators_are_not_simple():
+    assert not pipeline.is_simple("ls | grep py")
+    assert not pipeline.is_simple("ls>out.txt")
+
+def test_unclosed_quote_is_reported():
+    with pytest.raises(pipeline.PipelineError):
+        pipeline.parse("grep 'py | ls")
+
+def test_invalid_grep_pattern_in_pipeline(monkeypatch):
+    commands = {"ls": fake_command("a.py", "(b)"), "grep": grep}
+    stages, redirect = pipeline.parse("ls | grep '('")
+    with pytest.raises(ValueError):
+        pipeline.run(stages, redirect, commands.get, write=lambda line: None)
+
+    # The shell reports it as a command error instead of letting it escape
+    monkeypatch.setattr(shell, "resolve_command_module", commands.get)
+    assert shell.run_pipeline("ls | grep '('") is False
+    assert shell.run_pipeline("ls | grep b") is True
@@ -0,0 +1,25 @@
+import types
+import shell
+from pyos import stats
+
+def test_percentiles_stay_within_the_recorded_range():
+    histogram = stats.Histogram()
+    values = [0.0091, 0.0092, 0.0093]  # 9.3ms lands in a bucket whose midpoint is about 9.47ms
+    for seconds in values:
+        histogram.record(seconds)
+    assert histogram.percentile(95) == max(values)
+    assert histogram.percentile(5) >= min(values)
+
+def test_histogram_round_trips_through_json():
+    histogram = stats.Histogram()
+    histogram.record(0.25)
+    loaded = stats.Histogram.from_json(histogram.to_json())
+    assert (loaded.total, loaded.low, loaded.high) == (1, 0.25, 0.25)
+    assert stats.Histogram.from_json(histogram.to_json()["counts"]).total == 1
+
+def test_pipelines_share_one_entry(monkeypatch):
+    commands = {name: types.SimpleNamespace(stream=lambda argv, stdin: iter(["x"])) for name in ["ls", "sort", "uniq"]}
+    monkeypatch.setattr(shell, "resolve_command_module", commands.get)
+    assert shell.run_pipeline("ls | sort")
+    assert shell.run_pipeline("ls | uniq | sort")
+    assert [(name, entry["calls"]) for name, entry in stats.summary()] == [("pipeline", 2)]
@@ -6,34 +6,33 @@ from rich.console import Console
 from rich.prompt import Prompt
 import time
 import pyos
+from pyos import userdb, session
 
-USER_DB = "users.json"
+USER_DB = userdb.DB_FILE
 console = Console()
 
-# Load or create user database
+# Load or create user database (imports an existing users.json the first time)
 def load_or_create_user_db():
-    if not os.path.exists(USER_DB):
-        with open(USER_DB, "w") as f:
-            json.dump({}, f)
+    userdb.ensure()
 
 def hash_password(password):
     """Hash the password using SHA-256"""
     return hashlib.sha256(password.encode()).hexdigest()
 
 def get_users():
-    """Get the list of registered users"""
-    with open(USER_DB, "r") as f:
-        return json.load(f)
+    """Get the registered users as a read-only mapping backed by the user database"""
+    return userdb.Users()
 
 def save_session(username, role):
     """Save the current user session with username and role."""
-    with open('current_user.json', 'w') as f:
+    with open(session.SESSION_FILE, 'w') as f:
         json.dump({'username': username, 'role': role}, f)  # Save both username and role
+    pyos.events.publish("session.changed", username=username)
 
 def load_session():
     """Load the current user session"""
     try:
-        with open('current_user.json', 'r') as f:
+        with open(session.SESSION_FILE, 'r') as f:
             return json.load(f)['username']
     except (FileNotFoundError, KeyError):
         return None
@@ -41,25 +40,20 @@ def load_session():
 def register():
     """Register a new user"""
     username = Prompt.ask("[bold yellow]New username[/bold yellow]").strip()
-    users = get_users()
 
-    if username in users:
+    if userdb.exists(username):
         console.print("[bold red]User already exists![/bold red]")
         return None
 
     password = getpass.getpass("New password: ")
 
     # Determine if the new user is an admin or a regular user
-    is_admin = len(users) == 0  # First user is admin
+    is_admin = not userdb.has_users()  # First user is admin
     role = "admin" if is_admin else "user"
 
-    with open(USER_DB, "r+") as f:
-        users[username] = {
-            "password": hash_password(password),
-            "role": role
-        }
-        f.seek(0)
-        json.dump(users, f, indent=4)
+    if not userdb.add(username, hash_password(password), role):
+        console.print("[bold red]User already exists![/bold red]")
+        return None
 
     console.print(f"[bold green]User  registered successfully! Role: {role}[/bold green]")
     return username
@@ -67,70 +61,59 @@ def register():
 def delete_user():
     """Delete a user"""
     current_user = load_session()
-    users = get_users()
 
-    if users[current_user]['role'] != 'admin':
+    if userdb.get(current_user)['role'] != 'admin':
         console.print("[bold red]You do not have permission to delete users.[/bold red]")
         return
 
     username = Prompt.ask("[bold yellow]Enter the username to delete[/bold yellow]").strip()
-    if username not in users:
+    if not userdb.delete(username):
         console.print(f"[bold red]User {username} not found.[/bold red]")
         return
 
-    del users[username]
-    with open(USER_DB, "w") as f:
-        json.dump(users, f, indent=4)
-
     console.print(f"[bold green]User {username} deleted successfully![/bold green]")
 
 def view_users():
     """View all users"""
-    users = get_users()
     current_user = load_session()  # Get the current logged-in user
-    if users:
+    if userdb.has_users():
         console.print("[bold yellow]Registered Users:[/bold yellow]")
-        for username, details in users.items():
+        for username, role in userdb.iterate():
             # Add "- You" next to the current logged-in user
             if username == current_user:
-                console.print(f"- {username} [bold cyan](You)[/bold cyan] - Role: {details['role']}")
+                console.print(f"- {username} [bold cyan](You)[/bold cyan] - Role: {role}")
             else:
-                console.print(f"- {username} - Role: {details['role']}")
+                console.print(f"- {username} - Role: {role}")
     else:
         console.print("[bold red]No users found.[/bold red]")
 
 def change_password():
     """Change the password for a user"""
     current_user = load_session()
-    users = get_users()
 
-    if users[current_user]['role'] != 'admin':
+    if userdb.get(current_user)['role'] != 'admin':
         console.print("[bold red]You do not have permission to change other users' passwords.[/bold red]")
         return False
 
     username = Prompt.ask("[bold yellow]Enter the username whose password you want to change[/bold yellow]").strip()
-    if username not in users:
+    if not userdb.exists(username):
         console.print("[bold red]User  not found.[/bold red]")
         return False
 
     new_password = getpass.getpass(f"Enter a new password for {username}: ").strip()
-    users[username]['password'] = hash_password(new_password)
-
-    with open(USER_DB, "w") as f:
-        json.dump(users, f, indent=4)
+    userdb.set_password(username, hash_password(new_password))
     console.print(f"[bold green]Password for {username} changed successfully![/bold green]")
     return True
 
 def change_role():
     """Change the role of a user between admin and user."""
-    users = get_users()
-
     username = Prompt.ask("[bold yellow]Enter the username whose role you want to change[/bold yellow]").strip()
-    if username not in users:
+    user = userdb.get(username)
+    if user is None:
         console.print("[bold red]User not found.[/bold red]")
         return False
 
-    current_role = users[username]['role']
+    current_role = user['role']
 
     # Ask for the new role
     new_role = Prompt.ask(
@@ -140,32 +123,38 @@ def change_role():
 
     # If changing from admin to user, check if at least one admin remains
     if current_role == "admin" and new_role == "user":
-        admin_count = sum(1 for user in users.values() if user['role'] == "admin")
+        admin_count = userdb.count("admin")
         if admin_count <= 1:
             console.print("[bold red]There must be at least one admin in the system.[/bold red]")
             return False
 
     # Change the role
-    users[username]['role'] = new_role
-    with open(USER_DB, "w") as f:
-        json.dump(users, f, indent=4)
+    userdb.set_role(username, new_role)
     pyos.system("clear")
     console.print(f"[bold green]Role for {username} changed to {new_role} successfully![/bold green]")
     return True
 
 
+def authenticate(username, password):
+    """Check a username and password without prompting. Returns the user's role, or None."""
+    load_or_create_user_db()
+    user = userdb.get(username)
+    if user and user['password'] == hash_password(password):
+        return user['role']
+    return None
+
 def login():
     """Handle user login"""
-    users = get_users()
     username = input("Username: ").strip()
-    if username not in users:
+    user = userdb.get(username)
+    if user is None:
         console.print(f"[bold red]{username} not found in users database.[/bold red]")
         return None
     password = getpass.getpass("Password: ")
-    if users[username]['password'] == hash_password(password):
+    if user['password'] == hash_password(password):
         os.system("clear")
-        console.print(f"[bold green]Welcome back, {username}! Role: {users[username]['role']}[/bold green]")
-        save_session(username, users[username]['role'])  # Save username and role
+        console.print(f"[bold green]Welcome back, {username}! Role: {user['role']}[/bold green]")
+        save_session(username, user['role'])  # Save username and role
         return username
     else:
         console.print("[bold red]Incorrect password.[/bold red]")
@@ -175,7 +164,8 @@ def logout():
     """Logout the current user by removing session"""
     try:
         pyos.system("clear")
-        os.remove('current_user.json')
+        os.remove(session.SESSION_FILE)
+        pyos.events.publish("session.changed", username=None)
         console.print("[bold green]Logged out successfully![/bold green]")
         time.sleep(2)
         pyos.system("clear")
@@ -200,10 +190,9 @@ def user_menu():
 def boot_sequence():
     """Boot the system and check user session"""
     load_or_create_user_db()  # Ensure the user database is loaded
-    users_data = get_users()
 
     # If users exist, proceed to login, else go to register
-    if users_data:
+    if userdb.has_users():
         console.print("[bold yellow]Users found. Please log in.[/bold yellow]")
         return login()
     else:
@@ -213,10 +202,9 @@ def boot_sequence():
 def login_after_logout():
     """Boot the system and check user session"""
     load_or_create_user_db()  # Ensure the user database is loaded
-    users_data = get_users()
 
     # If users exist, proceed to login, else go to register
-    if users_data:
+    if userdb.has_users():
         console.print("[bold yellow]Users found. Please log in.[/bold yellow]")
         return login()
     else: